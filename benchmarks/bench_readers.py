@@ -0,0 +1,109 @@
+"""Compare the openpyxl and fast (xlsx_reader) .xlsx reader backends.
+
+Builds inputs from the test suite's pipeline fixture (``tests/test_batch.py``:
+``_make_valid_workbook`` / ``_make_app_config``), scaled to a given number of
+data rows and padded with extra sheets the way supplier files usually are,
+then times sheet loading (open, detect, snapshot) and the full
+``process_file`` pipeline with each backend.
+
+Usage (from the repository root)::
+
+    python benchmarks/bench_readers.py [--rows 2000] [--extra-sheets 10] [--repeat 5]
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(_ROOT / "src"), str(_ROOT)]
+
+from tests.test_batch import _make_app_config, _make_valid_workbook  # noqa: E402
+
+from autoconvert import batch  # noqa: E402
+from autoconvert.models import AppConfig  # noqa: E402
+
+
+def _build_input(path: Path, rows: int, extra_sheets: int) -> Path:
+    """Save the fixture workbook scaled to ``rows`` data rows plus extra sheets.
+
+    Args:
+        path: Destination .xlsx path.
+        rows: Data rows on the invoice and packing sheets.
+        extra_sheets: Filler sheets (200 x 20 values each) not used by the pipeline.
+
+    Returns:
+        The saved path.
+    """
+    wb = _make_valid_workbook()
+    inv_ws, pack_ws = wb["Invoice"], wb["Packing"]
+    pack_ws.move_range("A11:F11", rows=rows - 1)
+    for offset in range(1, rows):
+        for ws, width in ((inv_ws, 13), (pack_ws, 6)):
+            for col in range(1, width + 1):
+                ws.cell(row=9 + offset, column=col, value=ws.cell(row=9, column=col).value)
+    pack_ws.cell(row=10 + rows, column=4, value=15.5 * rows)
+    pack_ws.cell(row=10 + rows, column=5, value=20.0 * rows)
+    for idx in range(extra_sheets):
+        ws = wb.create_sheet(f"History {idx + 1}")
+        for row in range(1, 201):
+            for col in range(1, 21):
+                ws.cell(row=row, column=col, value=row * col + 0.5)
+    wb.save(path)
+    return path
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    """Return the median wall time of ``fn`` in seconds.
+
+    Args:
+        fn: Callable to time.
+        repeat: Number of timed runs.
+
+    Returns:
+        Median seconds per run.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Parse arguments, build the input and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="data rows per sheet (default: 2000)")
+    parser.add_argument("--extra-sheets", type=int, default=10, help="unused filler sheets (default: 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per measurement (default: 5)")
+    args = parser.parse_args()
+    # Reason: Per-file pipeline logging would swamp the timing table.
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        path = _build_input(tmp_path / "bench_input.xlsx", args.rows, args.extra_sheets)
+        configs: dict[str, AppConfig] = {}
+        for reader in ("openpyxl", "fast"):
+            configs[reader] = _make_app_config(tmp_path).model_copy(update={"reader": reader})
+
+        print(f"Input: {args.rows} rows, {args.extra_sheets} extra sheets, {path.stat().st_size / 1024:.0f} KiB")
+        print(f"{'reader':<10} {'load sheets':>12} {'process_file':>13}")
+        timings: dict[str, tuple[float, float]] = {}
+        for reader, config in configs.items():
+            load = _time(lambda: batch._read_sheets(path, config), args.repeat)
+            full = _time(lambda: batch.process_file(path, config, output_dir=tmp_path), args.repeat)
+            timings[reader] = (load, full)
+            print(f"{reader:<10} {load * 1000:>10.1f}ms {full * 1000:>11.1f}ms")
+        base, fast = timings["openpyxl"], timings["fast"]
+        print(f"{'speedup':<10} {base[0] / fast[0]:>11.1f}x {base[1] / fast[1]:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
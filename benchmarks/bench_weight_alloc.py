@@ -0,0 +1,116 @@
+"""Time weight allocation (FR-021 to FR-026) on large invoices.
+
+Builds a synthetic invoice of ``--lines`` lines spread over ``--parts`` part
+numbers (several packing rows per part, 5-decimal net weights), then times
+``weight_alloc.allocate_weights`` against the per-value ``round_half_up``
+reference from the test suite (``tests/test_weight_alloc.py``:
+``_reference_allocation``, plus the per-item ``model_copy`` the pipeline
+used to make) and checks that both allocate identical weights.
+
+Usage (from the repository root)::
+
+    python benchmarks/bench_weight_alloc.py [--lines 50000] [--parts 5000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(_ROOT / "src"), str(_ROOT)]
+
+from tests.test_weight_alloc import _inv, _pack, _reference_allocation, _totals  # noqa: E402
+
+from autoconvert.models import InvoiceItem, PackingItem, PackingTotals  # noqa: E402
+from autoconvert.weight_alloc import allocate_weights  # noqa: E402
+
+
+def _build_input(lines: int, parts: int, seed: int = 0) -> tuple[list[InvoiceItem], list[PackingItem], PackingTotals]:
+    """Build invoice items, packing items and totals for one synthetic file.
+
+    Args:
+        lines: Number of invoice lines.
+        parts: Number of distinct part numbers.
+        seed: Random seed.
+
+    Returns:
+        (invoice items, packing items, packing totals).
+    """
+    rng = random.Random(seed)
+    invoice = [_inv(f"PART-{idx % parts:05d}", Decimal(rng.randint(1, 2000))) for idx in range(lines)]
+    packing = [
+        _pack(f"PART-{part:05d}", Decimal(rng.randint(1, 500)), Decimal(rng.randint(1, 5_000_000)).scaleb(-5))
+        for part in range(parts)
+        for _ in range(rng.randint(1, 3))
+    ]
+    packing_sum = sum((item.nw for item in packing), Decimal("0"))
+    return invoice, packing, _totals(packing_sum.quantize(Decimal("0.01")), 2)
+
+
+def _reference_pipeline(
+    invoice: list[InvoiceItem], packing: list[PackingItem], totals: PackingTotals
+) -> list[InvoiceItem]:
+    """Run the reference allocation and copy the weights onto the items as the Decimal path did.
+
+    Args:
+        invoice: Invoice items.
+        packing: Packing items.
+        totals: Packing totals.
+
+    Returns:
+        Invoice items with allocated_weight populated.
+    """
+    weights = _reference_allocation(invoice, packing, totals)
+    return [item.model_copy(update={"allocated_weight": w}) for item, w in zip(invoice, weights, strict=True)]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    """Return the median wall time of ``fn`` in seconds.
+
+    Args:
+        fn: Callable to time.
+        repeat: Number of timed runs.
+
+    Returns:
+        Median seconds per run.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    """Parse arguments, build the input and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=50_000, help="invoice lines (default: 50000)")
+    parser.add_argument("--parts", type=int, default=5_000, help="distinct part numbers (default: 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement (default: 3)")
+    args = parser.parse_args()
+    # Reason: Per-step allocation logging would swamp the timing table.
+    logging.disable(logging.CRITICAL)
+
+    invoice, packing, totals = _build_input(args.lines, args.parts)
+    engine = [item.allocated_weight for item in allocate_weights(list(invoice), packing, totals)]
+    reference = _reference_allocation(invoice, packing, totals)
+    if [str(v) for v in engine] != [str(v) for v in reference]:
+        raise SystemExit("allocate_weights and the reference allocation disagree")
+
+    print(f"Input: {args.lines} invoice lines, {args.parts} parts, {len(packing)} packing rows")
+    ref = _time(lambda: _reference_pipeline(invoice, packing, totals), args.repeat)
+    new = _time(lambda: allocate_weights(list(invoice), packing, totals), args.repeat)
+    print(f"{'reference (round_half_up)':<28} {ref * 1000:>9.1f}ms")
+    print(f"{'allocate_weights':<28} {new * 1000:>9.1f}ms")
+    print(f"{'speedup':<28} {ref / new:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
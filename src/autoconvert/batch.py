@@ -4,43 +4,91 @@ Orchestrates the full per-file pipeline: open workbook, detect sheets,
 map columns, extract data, transform, allocate weights, validate, and
 write output.  ``run_batch()`` manages directory setup, file scanning,
 clearing ``data/finished/``, and collecting results.
+
+With ``workers > 1`` the per-file pipeline runs in a process pool.  The
+pre-loaded ``AppConfig`` is shipped to each worker once (pool initializer),
+worker log records are forwarded to the parent's handlers through a queue,
+and results are collected in the same sorted order as the serial path.
 """
 
 import logging
+import logging.handlers
+import multiprocessing
 import os
 import stat
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-
-import openpyxl
-
-from .column_map import detect_header_row, extract_inv_no_from_header, map_columns
+from typing import TYPE_CHECKING
+
+from .column_map import (
+    complete_column_mapping,
+    detect_header_row,
+    locate_inv_no_in_header,
+    map_header_fields,
+    read_inv_no_at,
+)
 from .errors import ErrorCode, ProcessingError, WarningCode
 from .extract_invoice import extract_invoice_items
 from .extract_packing import extract_packing_items, validate_merged_weights
 from .extract_totals import detect_total_row, extract_totals
+from .layout_cache import LayoutCache, build_layout
+from .manifest import Manifest, config_digest, file_digest
 from .merge_tracker import MergeTracker
-from .models import AppConfig, BatchResult, FileResult, InvoiceItem, PackingTotals
-from .output import write_template
+from .models import AppConfig, BatchResult, FileLayout, FileResult, InvoiceRecord, PackingRecord, PackingTotals
+from .output import OutputWriterPool, write_template
 from .report import print_batch_summary
+from .sheet_cache import SheetCache
 from .sheet_detect import detect_sheets
+from .sheet_snapshot import SheetSnapshot
 from .transform import clean_po_number, convert_country, convert_currency
 from .validate import determine_file_status
 from .weight_alloc import allocate_weights
-from .xls_adapter import convert_xls_to_xlsx
+from .workbook_loader import load_xlsx_sheets
+from .xlsx_reader import read_xlsx_sheets
+
+if TYPE_CHECKING:
+    from openpyxl.workbook.workbook import Workbook
+
+    from .xls_adapter import XlsWorkbook
 
 logger = logging.getLogger(__name__)
 
 _DATA_DIR = Path("data")
 _FINISHED_DIR = Path("data") / "finished"
+_MANIFEST_NAME = "finished_manifest.json"
+_LAYOUT_CACHE_NAME = "layout_cache.json"
 _SEPARATOR = "-" * 65
 
+# Background output stage of the serial path: writer threads and the maximum
+# number of outputs queued or in flight (backpressure bound).
+_WRITER_THREADS = 2
+_MAX_PENDING_WRITES = 4
 
-def run_batch(config: AppConfig) -> BatchResult:
+# Per-worker state, populated by _init_worker() in each pool process.
+_worker_config: AppConfig | None = None
+_worker_output_dir: Path | None = None
+_worker_layout_cache: LayoutCache | None = None
+
+
+def run_batch(
+    config: AppConfig,
+    workers: int = 1,
+    incremental: bool = False,
+    layout_cache: bool = False,
+) -> BatchResult:
     """Orchestrate full batch: setup dirs, clear finished, scan, process, collect.
 
     Args:
         config: Application configuration (pre-loaded, pre-validated by config.py).
+        workers: Number of worker processes. ``1`` (default) processes files
+            serially in this process; larger values spread ``process_file``
+            calls over a process pool. Result order is identical either way.
+        incremental: Keep ``data/finished/`` and its manifest instead of
+            clearing it; only new, changed, or previously failed inputs are
+            processed, and outputs of removed inputs are pruned.
+        layout_cache: Reuse header layouts of known supplier formats from
+            ``data/layout_cache.json`` and record newly seen ones there.
 
     Returns:
         BatchResult with counts, timing, and per-file FileResult list.
@@ -48,7 +96,14 @@ def run_batch(config: AppConfig) -> BatchResult:
     _ensure_directories()
     file_list = _scan_files()
 
+    manifest: Manifest | None = None
+    if incremental:
+        manifest = Manifest(_DATA_DIR / _MANIFEST_NAME, _FINISHED_DIR)
+        manifest.prune({filepath.name for filepath in file_list})
+
     if not file_list:
+        if manifest is not None:
+            manifest.save()
         logger.info("No processable files found in %s", _DATA_DIR)
         return BatchResult(
             total_files=0,
@@ -60,15 +115,27 @@ def run_batch(config: AppConfig) -> BatchResult:
             log_path=str((_DATA_DIR / "process_log.txt").resolve()),
         )
 
-    _clear_finished_dir()
+    if manifest is None:
+        _clear_finished_dir()
     start_time = time.monotonic()
 
+    layouts: LayoutCache | None = None
+    if layout_cache:
+        layouts = LayoutCache(_DATA_DIR / _LAYOUT_CACHE_NAME, config_digest(config))
+
     total = len(file_list)
-    results: list[FileResult] = []
-    for idx, filepath in enumerate(file_list, start=1):
-        logger.info(_SEPARATOR)
-        logger.info("[%d/%d] Processing: %s ...", idx, total, filepath.name)
-        results.append(process_file(filepath, config))
+    if manifest is None:
+        results = _process_files(file_list, config, workers, layouts)
+    else:
+        results = _process_incremental(file_list, config, workers, manifest, layouts)
+
+    if layouts is not None:
+        # Reason: Workers only read the cache; the parent records what they
+        # learned so the file has a single writer.
+        for result in results:
+            if result.layout is not None:
+                layouts.record(result.layout)
+        layouts.save()
 
     processing_time = time.monotonic() - start_time
     batch_result = BatchResult(
@@ -79,18 +146,36 @@ def run_batch(config: AppConfig) -> BatchResult:
         processing_time=processing_time,
         file_results=results,
         log_path=str((_DATA_DIR / "process_log.txt").resolve()),
+        layout_cache_lookups=sum(1 for r in results if r.layout_cache_hit is not None),
+        layout_cache_hits=sum(1 for r in results if r.layout_cache_hit),
     )
     print_batch_summary(batch_result)
     return batch_result
 
 
-def process_file(filepath: Path, config: AppConfig) -> FileResult:
+def process_file(
+    filepath: Path,
+    config: AppConfig,
+    output_dir: Path | None = None,
+    layout_cache: LayoutCache | None = None,
+    writer: OutputWriterPool | None = None,
+) -> FileResult:
     """Per-file pipeline: open workbook, detect sheets, map columns,
     extract, transform, allocate, validate, output.
 
     Args:
         filepath: Absolute path to the input Excel file.
         config: Application configuration.
+        output_dir: Directory for the output file; defaults to ``data/finished/``.
+        layout_cache: Known supplier layouts (read only). When given, a
+            verified cached layout replaces header detection and the header
+            scans of column mapping, and FileResult reports the hit/miss and
+            the layout used.
+        writer: Background output stage. When given, the output is queued
+            there instead of written synchronously; a write failure is then
+            reported by ``writer.collect()`` under ``filepath.name`` and must
+            be applied with ``_apply_write_failures()``, which also logs the
+            final status of the queued file.
 
     Returns:
         FileResult with status, errors, warnings, invoice_items,
@@ -98,18 +183,23 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
     """
     errs: list[ProcessingError] = []
     warns: list[ProcessingError] = []
-    inv_items: list[InvoiceItem] = []
-    pack_items: list = []
+    inv_items: list[InvoiceRecord] = []
+    pack_items: list[PackingRecord] = []
     pack_totals: PackingTotals | None = None
 
-    # Phase 1: Open Workbook
-    workbook = None
+    # Phase 1-2: Open workbook, detect sheets, snapshot them
+    # Reason: Every later read (header scan, extraction, totals) goes through
+    # the SheetSnapshots instead of openpyxl's per-cell API.
     try:
-        workbook = _open_workbook(filepath)
+        inv_snap, pack_snap = _read_sheets(filepath, config)
+    except ProcessingError as e:
+        _collect(errs, e)
+        return _make_result(filepath, errs, warns)
     except PermissionError:
         _record_err(
             errs, ErrorCode.ERR_010, f"File is locked or inaccessible: {filepath.name}", {"filename": filepath.name}
         )
+        return _make_result(filepath, errs, warns)
     except Exception as exc:
         _record_err(
             errs,
@@ -117,61 +207,74 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
             f"File is corrupted or unreadable: {filepath.name} ({exc})",
             {"filename": filepath.name},
         )
-
-    if errs or workbook is None:
         return _make_result(filepath, errs, warns)
 
-    # Phase 2: Sheet Detection
+    # Phase 3a: Layout cache lookup
+    cached: FileLayout | None = None
+    layout_hit: bool | None = None
+    if layout_cache is not None:
+        cached = layout_cache.lookup(inv_snap, pack_snap)
+        layout_hit = cached is not None
+
+    # Phase 3b: Invoice Column Mapping
+    # Reason: Header detection and column mapping read the snapshot, whose
+    # merged non-anchor cells are already empty, so the MergeTrackers are
+    # only built once the mapped columns are known and capture just the
+    # ranges that touch them.  Nothing is unmerged in the workbook.
     try:
-        invoice_sheet, packing_sheet = detect_sheets(workbook, config)
+        if cached is not None:
+            inv_hdr_map = cached.invoice
+        else:
+            inv_hdr = detect_header_row(inv_snap, "invoice", config)
+            inv_hdr_map = map_header_fields(inv_snap, inv_hdr, "invoice", config)
+        inv_cmap = complete_column_mapping(inv_snap, inv_hdr_map, config)
     except ProcessingError as e:
         _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout_hit=layout_hit)
 
-    # Phase 3a: Invoice Column Mapping
-    # Reason: MergeTracker MUST be initialized BEFORE detect_header_row / map_columns
-    inv_mt = MergeTracker(invoice_sheet)
+    # Phase 3c: Packing Column Mapping
     try:
-        inv_hdr = detect_header_row(invoice_sheet, "invoice", config)
+        if cached is not None:
+            pack_hdr_map = cached.packing
+        else:
+            pack_hdr = detect_header_row(pack_snap, "packing", config)
+            pack_hdr_map = map_header_fields(pack_snap, pack_hdr, "packing", config)
+        pack_cmap = complete_column_mapping(pack_snap, pack_hdr_map, config)
     except ProcessingError as e:
         _collect(errs, e)
-        # Still init packing MergeTracker before returning (for consistency)
-        MergeTracker(packing_sheet)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout_hit=layout_hit)
 
-    try:
-        inv_cmap = map_columns(invoice_sheet, inv_hdr, "invoice", config)
-    except ProcessingError as e:
-        _collect(errs, e)
-        MergeTracker(packing_sheet)
-        return _make_result(filepath, errs, warns)
-
-    # Phase 3b: Packing Column Mapping
-    pack_mt = MergeTracker(packing_sheet)
-    try:
-        pack_hdr = detect_header_row(packing_sheet, "packing", config)
-    except ProcessingError as e:
-        _collect(errs, e)
-        return _make_result(filepath, errs, warns)
-
-    try:
-        pack_cmap = map_columns(packing_sheet, pack_hdr, "packing", config)
-    except ProcessingError as e:
-        _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+    inv_mt = MergeTracker(inv_snap, columns=inv_cmap.field_map.values())
+    pack_mt = MergeTracker(pack_snap, columns=pack_cmap.field_map.values())
 
-    # Phase 3c: Invoice Number Fallback
+    # Phase 3d: Invoice Number Fallback
     inv_no_from_col = "inv_no" in inv_cmap.field_map
     inv_no_param: str | None = None
+    inv_no_cell: tuple[int, int] | None = None
     if not inv_no_from_col:
-        inv_no_param = extract_inv_no_from_header(invoice_sheet, config)
+        if cached is not None and cached.inv_no_cell is not None:
+            inv_no_param = read_inv_no_at(inv_snap, *cached.inv_no_cell, config)
+            if inv_no_param is not None:
+                inv_no_cell = cached.inv_no_cell
+        if inv_no_param is None:
+            found = locate_inv_no_in_header(inv_snap, config)
+            if found is not None:
+                inv_no_param, inv_no_row, inv_no_col = found
+                inv_no_cell = (inv_no_row, inv_no_col)
+
+    layout: FileLayout | None = None
+    if layout_cache is not None:
+        if cached is not None and cached.inv_no_cell == inv_no_cell:
+            layout = cached
+        else:
+            layout = build_layout(inv_snap, pack_snap, inv_hdr_map, pack_hdr_map, inv_no_cell)
 
     # Phase 4: Data Extraction
     try:
-        inv_items = extract_invoice_items(invoice_sheet, inv_cmap, inv_mt, inv_no_param)
+        inv_items = extract_invoice_items(inv_snap, inv_cmap, inv_mt, inv_no_param)
     except ProcessingError as e:
         _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
 
     # [10b] ERR_021: verify inv_no is populated
     if inv_no_from_col:
@@ -185,28 +288,28 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
             "Invoice number not found: neither column extraction nor header fallback produced a value.",
             {"filename": filepath.name},
         )
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
 
     try:
-        pack_items, last_data_row = extract_packing_items(packing_sheet, pack_cmap, pack_mt)
+        pack_items, last_data_row = extract_packing_items(pack_snap, pack_cmap, pack_mt)
     except ProcessingError as e:
         _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
 
     try:
         validate_merged_weights(pack_items, pack_mt, pack_cmap)
     except ProcessingError as e:
         _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
 
     try:
-        total_row = detect_total_row(packing_sheet, last_data_row, pack_cmap, pack_mt)
+        total_row = detect_total_row(pack_snap, last_data_row, pack_cmap, pack_mt)
     except ProcessingError as e:
         _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
 
     try:
-        pack_totals = extract_totals(packing_sheet, total_row, pack_cmap)
+        pack_totals = extract_totals(pack_snap, total_row, pack_cmap)
     except ProcessingError as e:
         _collect(errs, e)
 
@@ -221,7 +324,7 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
         warns.append(w)
 
     if errs:
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
     assert pack_totals is not None
 
     # Phase 5: Transformation (warnings only, no short-circuit)
@@ -236,30 +339,227 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
         inv_items = allocate_weights(inv_items, pack_items, pack_totals)
     except ProcessingError as e:
         _collect(errs, e)
-        return _make_result(filepath, errs, warns)
+        return _make_result(filepath, errs, warns, layout=layout, layout_hit=layout_hit)
 
     # Phase 7: Validation
     status = determine_file_status(errs, warns)
 
     # Phase 8: Output (only for Success or Attention)
+    queued = False
     if status in ("Success", "Attention"):
-        output_path = _FINISHED_DIR / f"{filepath.stem}_template.xlsx"
-        try:
-            write_template(inv_items, pack_totals, config, output_path)
-        except ProcessingError as e:
-            _collect(errs, e)
-            status = determine_file_status(errs, warns)
-
-    _log_file_status(status)
+        output_path = (output_dir or _FINISHED_DIR) / _output_name(filepath)
+        if writer is not None:
+            writer.submit(filepath.name, inv_items, pack_totals, config, output_path)
+            queued = True
+        else:
+            try:
+                write_template(inv_items, pack_totals, config, output_path)
+            except ProcessingError as e:
+                _collect(errs, e)
+                status = determine_file_status(errs, warns)
+
+    # Reason: A queued write has not happened yet; its status is logged once,
+    # after collect(), by _apply_write_failures().
+    if not queued:
+        _log_file_status(status)
+    # Reason: The pipeline works on slots records; FileResult is the public
+    # boundary, so the pydantic models are only built here, once per line.
     return FileResult(
         filename=filepath.name,
         status=status,
         errors=errs,
         warnings=warns,
-        invoice_items=inv_items,
-        packing_items=pack_items,
+        invoice_items=[item.to_model() for item in inv_items],
+        packing_items=[item.to_model() for item in pack_items],
         packing_totals=pack_totals,
+        layout=layout,
+        layout_cache_hit=layout_hit,
+    )
+
+
+# ---------------------------------------------------------------------------
+# File dispatch (serial / process pool / incremental)
+# ---------------------------------------------------------------------------
+
+
+def _process_files(
+    file_list: list[Path],
+    config: AppConfig,
+    workers: int,
+    layout_cache: LayoutCache | None = None,
+) -> list[FileResult]:
+    """Process files serially or over a process pool, preserving order.
+
+    Args:
+        file_list: Files to process, in scan order.
+        config: Application configuration.
+        workers: Requested worker process count.
+        layout_cache: Known supplier layouts passed to process_file, or None.
+
+    Returns:
+        FileResult list in file_list order.
+    """
+    total = len(file_list)
+    if workers > 1 and total > 1:
+        return _process_parallel(file_list, config, min(workers, total), layout_cache)
+    results: list[FileResult] = []
+    # Reason: Outputs are written by background threads so saving one file
+    # overlaps extraction of the next; failures are folded back into the
+    # matching FileResult before the batch result is built.
+    with OutputWriterPool(_WRITER_THREADS, _MAX_PENDING_WRITES) as writer:
+        for idx, filepath in enumerate(file_list, start=1):
+            logger.info(_SEPARATOR)
+            logger.info("[%d/%d] Processing: %s ...", idx, total, filepath.name)
+            results.append(process_file(filepath, config, layout_cache=layout_cache, writer=writer))
+        failures = writer.collect()
+    _apply_write_failures(results, failures)
+    return results
+
+
+def _process_incremental(
+    file_list: list[Path],
+    config: AppConfig,
+    workers: int,
+    manifest: Manifest,
+    layout_cache: LayoutCache | None = None,
+) -> list[FileResult]:
+    """Process only new, changed, or previously failed files; reuse the rest.
+
+    Args:
+        file_list: All scanned input files, in scan order.
+        config: Application configuration.
+        workers: Requested worker process count.
+        manifest: Loaded (and already pruned) manifest; updated and saved here.
+        layout_cache: Known supplier layouts passed to process_file, or None.
+
+    Returns:
+        FileResult list in file_list order; unchanged files carry their
+        recorded status and warnings.
+    """
+    cfg_digest = config_digest(config)
+    hashes: dict[str, str] = {}
+    for filepath in file_list:
+        try:
+            hashes[filepath.name] = file_digest(filepath)
+        except OSError:
+            # Reason: A locked file cannot be hashed; process_file reports ERR_010.
+            hashes[filepath.name] = ""
+
+    pending = [fp for fp in file_list if manifest.needs_processing(fp.name, hashes[fp.name], cfg_digest)]
+    logger.info(
+        "Incremental mode: %d unchanged, %d to process",
+        len(file_list) - len(pending),
+        len(pending),
     )
+    for filepath in pending:
+        manifest.discard_output(filepath.name)
+
+    processed = dict(zip((fp.name for fp in pending), _process_files(pending, config, workers, layout_cache)))
+
+    results: list[FileResult] = []
+    for filepath in file_list:
+        result = processed.get(filepath.name)
+        if result is None:
+            logger.debug("Unchanged, skipped: %s", filepath.name)
+            result = manifest.cached_result(filepath.name)
+        else:
+            manifest.record(filepath.name, hashes[filepath.name], cfg_digest, result, _output_name(filepath))
+        results.append(result)
+
+    manifest.save()
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Process pool
+# ---------------------------------------------------------------------------
+
+
+def _process_parallel(
+    file_list: list[Path],
+    config: AppConfig,
+    workers: int,
+    layout_cache: LayoutCache | None = None,
+) -> list[FileResult]:
+    """Run process_file over a process pool, preserving file_list order.
+
+    Args:
+        file_list: Sorted input files (from _scan_files()).
+        config: Application configuration, sent once to each worker.
+        workers: Pool size.
+        layout_cache: Known supplier layouts, sent once to each worker (read only).
+
+    Returns:
+        FileResult list in the same order as file_list.
+    """
+    total = len(file_list)
+    logger.info("Processing %d files with %d worker processes", total, workers)
+
+    # Reason: Worker processes have no (or inherited, fork-unsafe) logging
+    # handlers. Forward their records through a queue to the parent's
+    # handlers so console/file output keeps one format and one writer.
+    log_queue: multiprocessing.Queue = multiprocessing.Queue()  # type: ignore[type-arg]
+    root_logger = logging.getLogger()
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(config, _FINISHED_DIR.resolve(), log_queue, root_logger.getEffectiveLevel(), layout_cache),
+        ) as pool:
+            jobs = [(idx, total, filepath) for idx, filepath in enumerate(file_list, start=1)]
+            # Reason: Executor.map yields results in submission order, so the
+            # FileResult list matches the serial path regardless of which
+            # worker finishes first.
+            return list(pool.map(_process_in_worker, jobs))
+    finally:
+        listener.stop()
+
+
+def _init_worker(
+    config: AppConfig,
+    output_dir: Path,
+    log_queue: multiprocessing.Queue,  # type: ignore[type-arg]
+    log_level: int,
+    layout_cache: LayoutCache | None = None,
+) -> None:
+    """Pool initializer: keep the shared config and route logging to the parent.
+
+    Args:
+        config: Application configuration loaded once by the parent.
+        output_dir: Absolute output directory (data/finished/).
+        log_queue: Queue drained by the parent's QueueListener.
+        log_level: The parent's effective root level; records below it are
+            dropped in the worker instead of being pickled through the queue.
+        layout_cache: Known supplier layouts loaded by the parent, or None.
+    """
+    global _worker_config, _worker_output_dir, _worker_layout_cache
+    _worker_config = config
+    _worker_output_dir = output_dir
+    _worker_layout_cache = layout_cache
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
+
+
+def _process_in_worker(job: tuple[int, int, Path]) -> FileResult:
+    """Process one file inside a pool worker.
+
+    Args:
+        job: (1-based index, total file count, file path).
+
+    Returns:
+        The FileResult from process_file().
+    """
+    idx, total, filepath = job
+    assert _worker_config is not None
+    logger.info(_SEPARATOR)
+    logger.info("[%d/%d] Processing: %s ...", idx, total, filepath.name)
+    return process_file(filepath, _worker_config, _worker_output_dir, _worker_layout_cache)
 
 
 # ---------------------------------------------------------------------------
@@ -267,6 +567,32 @@ def process_file(filepath: Path, config: AppConfig) -> FileResult:
 # ---------------------------------------------------------------------------
 
 
+def _output_name(filepath: Path) -> str:
+    """Return the output file name for an input file ({stem}_template.xlsx)."""
+    return f"{filepath.stem}_template.xlsx"
+
+
+def _apply_write_failures(results: list[FileResult], failures: dict[str, ProcessingError]) -> None:
+    """Fold background write failures (ERR_051/ERR_052) into their FileResults.
+
+    Logs the final status of every file whose output was queued (Success or
+    Attention before the write); process_file() already logged the others.
+
+    Args:
+        results: FileResults of the batch, in processing order.
+        failures: Failed writes by input filename, from OutputWriterPool.collect().
+    """
+    for result in results:
+        if result.status not in ("Success", "Attention"):
+            continue
+        error = failures.get(result.filename)
+        if error is not None:
+            logger.error("[%s] %s: %s (%s)", error.code.value, error.code.name, error.message, result.filename)
+            result.errors.append(error)
+            result.status = determine_file_status(result.errors, result.warnings)
+        _log_file_status(result.status, result.filename)
+
+
 def _record_err(
     errs: list[ProcessingError],
     code: ErrorCode,
@@ -289,6 +615,8 @@ def _make_result(
     filepath: Path,
     errs: list[ProcessingError],
     warns: list[ProcessingError],
+    layout: FileLayout | None = None,
+    layout_hit: bool | None = None,
 ) -> FileResult:
     """Build a failed FileResult, log status, and return it."""
     status = determine_file_status(errs, warns)
@@ -301,6 +629,8 @@ def _make_result(
         invoice_items=[],
         packing_items=[],
         packing_totals=None,
+        layout=layout,
+        layout_cache_hit=layout_hit,
     )
 
 
@@ -378,33 +708,114 @@ def _clear_finished_dir() -> None:
                 raise
 
 
-def _open_workbook(filepath: Path) -> openpyxl.Workbook:
-    """Open an Excel file as an openpyxl Workbook.
+def _read_sheets(filepath: Path, config: AppConfig) -> tuple[SheetSnapshot, SheetSnapshot]:
+    """Snapshot the Invoice and Packing sheets of an Excel file, via the sheet cache if enabled.
+
+    With ``config.sheet_cache_dir`` set, unchanged file bytes are served from
+    the parsed-sheet cache and freshly parsed sheets are stored there.
+
+    Args:
+        filepath: Path to the Excel file.
+        config: Application configuration (sheet name patterns, reader, cache).
+
+    Returns:
+        (invoice snapshot, packing snapshot).
+
+    Raises:
+        ProcessingError: ERR_012/ERR_013 if no matching sheet exists.
+        PermissionError: If the file is locked (ERR_010).
+        Exception: If the file is corrupted or unreadable (ERR_011).
+    """
+    if config.sheet_cache_dir is None:
+        return _parse_sheets(filepath, config)
+    cache = SheetCache(config.sheet_cache_dir, config.sheet_cache_max_bytes)
+    key = cache.key(filepath, config)
+    cached = cache.lookup(key)
+    if cached is not None:
+        return cached
+    inv_snap, pack_snap = _parse_sheets(filepath, config)
+    cache.store(key, inv_snap, pack_snap)
+    return inv_snap, pack_snap
+
+
+def open_xls_workbook(filepath: Path) -> "XlsWorkbook":
+    """Open a legacy .xls file through xls_adapter, importing it on first use.
+
+    Batches without .xls inputs therefore never import xlrd.
+
+    Args:
+        filepath: Path to the .xls file.
+
+    Returns:
+        XlsWorkbook facade (see xls_adapter.open_xls_workbook).
+    """
+    from .xls_adapter import open_xls_workbook as _open_xls_workbook
+
+    return _open_xls_workbook(filepath)
+
+
+def _parse_sheets(filepath: Path, config: AppConfig) -> tuple[SheetSnapshot, SheetSnapshot]:
+    """Open an Excel file and snapshot its Invoice and Packing sheets.
+
+    With ``config.reader == "fast"`` .xlsx files are streamed by xlsx_reader
+    without building openpyxl objects; otherwise .xlsx files are loaded with
+    only the two matched sheets parsed (see workbook_loader).  .xls files are
+    read through the xlrd facade, which parses only the matched sheets.
 
     Args:
         filepath: Path to the Excel file.
+        config: Application configuration (sheet name patterns, reader).
 
     Returns:
-        openpyxl Workbook object.
+        (invoice snapshot, packing snapshot).
 
     Raises:
+        ProcessingError: ERR_012/ERR_013 if no matching sheet exists.
         PermissionError: If the file is locked (ERR_010).
         Exception: If the file is corrupted or unreadable (ERR_011).
     """
     if filepath.suffix.lower() == ".xls":
-        return convert_xls_to_xlsx(filepath)
-    return openpyxl.load_workbook(filepath, data_only=True)
+        with open_xls_workbook(filepath) as xls_workbook:
+            return _snapshot_sheets(xls_workbook, config)
+    if config.reader == "fast":
+        return read_xlsx_sheets(filepath, config)
+    return _snapshot_sheets(load_xlsx_sheets(filepath, config), config)
+
+
+def _snapshot_sheets(workbook: "Workbook | XlsWorkbook", config: AppConfig) -> tuple[SheetSnapshot, SheetSnapshot]:
+    """Detect the Invoice and Packing sheets of a workbook and snapshot them.
+
+    Args:
+        workbook: openpyxl Workbook or the .xls facade.
+        config: Application configuration with compiled sheet patterns.
+
+    Returns:
+        (invoice snapshot, packing snapshot).
+
+    Raises:
+        ProcessingError: ERR_012/ERR_013 if no matching sheet exists.
+    """
+    invoice_sheet, packing_sheet = detect_sheets(workbook, config)  # type: ignore[arg-type]
+    inv_snap = SheetSnapshot.from_worksheet(invoice_sheet)
+    if packing_sheet is invoice_sheet:
+        # Reason: One sheet matched both patterns.  Its merges belong to the
+        # invoice MergeTracker, just as when the sheet was unmerged in place.
+        return inv_snap, inv_snap.without_merges()
+    return inv_snap, SheetSnapshot.from_worksheet(packing_sheet)
 
 
-def _log_file_status(status: str) -> None:
+def _log_file_status(status: str, filename: str | None = None) -> None:
     """Log the final file processing status with appropriate level.
 
     Args:
         status: One of "Success", "Attention", "Failed".
+        filename: Input filename appended to the status, for statuses logged
+            outside the file's own log section (after background writes).
     """
+    suffix = f" ({filename})" if filename is not None else ""
     if status == "Success":
-        logger.info("SUCCESS")
+        logger.info("SUCCESS%s", suffix)
     elif status == "Attention":
-        logger.warning("ATTENTION")
+        logger.warning("ATTENTION%s", suffix)
     else:
-        logger.error("FAILED")
+        logger.error("FAILED%s", suffix)
@@ -1,25 +1,102 @@
-"""cli — FR-034: Command-line interface and diagnostic mode entry point."""
+"""cli — FR-034: Command-line interface and diagnostic mode entry point.
+
+Only light modules are imported at start-up.  The pipeline (batch, watch and
+with them openpyxl) is imported once a run mode is chosen, and configuration
+loading (pydantic, YAML, openpyxl) on the first load_config() call, so
+``--help`` and argument errors return without touching them.
+"""
 
 import argparse
+import multiprocessing
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from . import batch as _batch
-from .config import load_config
 from .errors import ConfigError
 from .logger import setup_diagnostic_logging, setup_logging
 from .report import print_batch_summary
 
+if TYPE_CHECKING:
+    from .models import AppConfig
+
+
+def load_config(config_dir: Path) -> "AppConfig":
+    """Load the configuration via config.load_config, importing it on first use.
+
+    Args:
+        config_dir: Configuration directory.
+
+    Returns:
+        Validated AppConfig.
+
+    Raises:
+        ConfigError: ERR_001 through ERR_005 on validation failures.
+    """
+    from .config import load_config as _load_config
+
+    return _load_config(config_dir)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type: parse a strictly positive integer.
+
+    Args:
+        value: Raw command-line string.
+
+    Returns:
+        The parsed integer.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer >= 1.
+    """
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    """argparse type: parse a strictly positive number of seconds.
+
+    Args:
+        value: Raw command-line string.
+
+    Returns:
+        The parsed float.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a number > 0.
+    """
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value!r}") from exc
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value!r}")
+    return number
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments for autoconvert.
 
     Supports an optional --diagnostic <filename> flag that processes a single
-    file with DEBUG-level console output.
+    file with DEBUG-level console output, --workers N to process a batch
+    over N worker processes, --incremental to skip unchanged files,
+    --layout-cache to reuse header layouts of known supplier formats,
+    --reader to choose the .xlsx reader backend, --sheet-cache to reuse
+    parsed sheets of unchanged files, and --watch to keep running and
+    convert files as they arrive in data/.
 
     Returns:
         argparse.Namespace: Parsed arguments with attribute ``diagnostic``
-            set to the filename string if provided, or ``None`` otherwise.
+            set to the filename string if provided, or ``None`` otherwise,
+            ``workers`` (default 1), ``incremental`` (bool), ``layout_cache``
+            (bool), ``reader`` (``"openpyxl"`` or ``"fast"``), ``sheet_cache``
+            (bool), ``sheet_cache_size`` (MiB, default 256), ``watch`` (bool)
+            and ``poll_interval`` (seconds, default 2.0).
     """
     parser = argparse.ArgumentParser(
         prog="autoconvert",
@@ -31,6 +108,53 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Process a single file with DEBUG-level console output (FR-034).",
     )
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes for batch mode (default: 1, serial).",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep data/finished/ and only convert new, changed, or previously failed files.",
+    )
+    parser.add_argument(
+        "--layout-cache",
+        action="store_true",
+        help="Reuse header layouts of known supplier formats (stored in data/layout_cache.json).",
+    )
+    parser.add_argument(
+        "--reader",
+        choices=("openpyxl", "fast"),
+        default="openpyxl",
+        help="Reader for .xlsx inputs: openpyxl (default) or fast (streams only the two matched sheets' XML).",
+    )
+    parser.add_argument(
+        "--sheet-cache",
+        action="store_true",
+        help="Reuse parsed sheets of unchanged input files (stored in data/sheet_cache/).",
+    )
+    parser.add_argument(
+        "--sheet-cache-size",
+        metavar="MB",
+        type=_positive_int,
+        default=256,
+        help="Size cap of data/sheet_cache/ in MiB; least recently used entries are evicted (default: 256).",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and convert new or modified files in data/ as they arrive (Ctrl+C to stop).",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        metavar="SECONDS",
+        type=_positive_float,
+        default=2.0,
+        help="Seconds between directory polls in --watch mode (default: 2.0).",
+    )
     return parser.parse_args()
 
 
@@ -45,6 +169,9 @@ def main() -> None:
     Returns:
         None. Calls sys.exit() with the appropriate exit code.
     """
+    # Reason: Required for the --workers process pool in the frozen
+    # (PyInstaller) Windows executable; a no-op everywhere else.
+    multiprocessing.freeze_support()
     args = parse_args()
 
     # Resolve project root and config/data directories relative to this file.
@@ -62,6 +189,14 @@ def main() -> None:
             file=sys.stderr,
         )
         sys.exit(2)
+    config.reader = args.reader
+    if args.sheet_cache:
+        config.sheet_cache_dir = data_dir / "sheet_cache"
+        config.sheet_cache_max_bytes = args.sheet_cache_size * 1024 * 1024
+
+    # Reason: Imported here rather than at module level so that --help and
+    # configuration errors do not pay for the pipeline's imports.
+    from . import batch as _batch
 
     # --- Diagnostic mode (FR-034): single-file with DEBUG console output ---
     if args.diagnostic is not None:
@@ -71,9 +206,23 @@ def main() -> None:
         exit_code = 1 if file_result.status == "Failed" else 0
         sys.exit(exit_code)
 
+    # --- Watch mode: config stays loaded, files are converted as they arrive ---
+    if args.watch:
+        from . import watch as _watch
+
+        setup_logging(data_dir)
+        batch_result = _watch.watch_directory(config, poll_interval=args.poll_interval)
+        exit_code = 1 if batch_result.failed_count > 0 else 0
+        sys.exit(exit_code)
+
     # --- Normal batch mode ---
     setup_logging(data_dir)
-    batch_result = _batch.run_batch(config)
+    batch_result = _batch.run_batch(
+        config,
+        workers=args.workers,
+        incremental=args.incremental,
+        layout_cache=args.layout_cache,
+    )
     print_batch_summary(batch_result)
 
     exit_code = 1 if batch_result.failed_count > 0 else 0
@@ -6,7 +6,9 @@ import re
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .errors import ErrorCode, ProcessingError
+from .header_match import HeaderMatcher
 from .models import AppConfig, ColumnMapping, FieldPattern
+from .sheet_snapshot import SheetSnapshot, snapshot_of
 from .utils import HEADER_KEYWORDS, normalize_header
 
 logger = logging.getLogger(__name__)
@@ -46,11 +48,11 @@ _INV_PREFIX_RE = re.compile(r"^(?:INV[#.]\s*|INV(?=\d)|NO\.?\s*)", re.IGNORECASE
 # ---------------------------------------------------------------------------
 
 
-def detect_header_row(sheet: Worksheet, sheet_type: str, config: AppConfig) -> int:
+def detect_header_row(sheet: Worksheet | SheetSnapshot, sheet_type: str, config: AppConfig) -> int:
     """Detect the header row by scanning rows 7-30 with three-tier priority.
 
     Args:
-        sheet: Worksheet to scan (already unmerged).
+        sheet: Worksheet to scan (already unmerged), or its SheetSnapshot.
         sheet_type: "invoice" or "packing".
         config: Application configuration.
 
@@ -60,16 +62,18 @@ def detect_header_row(sheet: Worksheet, sheet_type: str, config: AppConfig) -> i
     Raises:
         ProcessingError: ERR_014 if no row meets the cell-count threshold.
     """
+    snap = snapshot_of(sheet)
     threshold = _INVOICE_THRESHOLD if sheet_type == "invoice" else _PACKING_THRESHOLD
 
     # Reason: We collect all qualifying rows with their tier, then pick
     # the best one (lowest tier, then earliest row on tie).
     candidates: list[tuple[int, int]] = []  # (tier, row_number)
 
+    scan_cols = snap.data_columns(_SCAN_COL_END)
     for row_idx in range(_SCAN_ROW_START, _SCAN_ROW_END + 1):
         cell_values: list[str] = []
-        for col_idx in range(1, _SCAN_COL_END + 1):
-            raw = sheet.cell(row=row_idx, column=col_idx).value
+        for col_idx in range(1, scan_cols + 1):
+            raw = snap.value(row_idx, col_idx)
             if raw is None:
                 continue
             text = str(raw).strip()
@@ -111,7 +115,7 @@ def detect_header_row(sheet: Worksheet, sheet_type: str, config: AppConfig) -> i
 
 
 def map_columns(
-    sheet: Worksheet,
+    sheet: Worksheet | SheetSnapshot,
     header_row: int,
     sheet_type: str,
     config: AppConfig,
@@ -119,7 +123,7 @@ def map_columns(
     """Map columns via regex with sub-header and currency fallback.
 
     Args:
-        sheet: Worksheet (already unmerged).
+        sheet: Worksheet (already unmerged), or its SheetSnapshot.
         header_row: 1-based header row from detect_header_row().
         sheet_type: "invoice" or "packing".
         config: Application configuration.
@@ -130,10 +134,40 @@ def map_columns(
     Raises:
         ProcessingError: ERR_020 listing all missing required column names.
     """
+    snap = snapshot_of(sheet)
+    header_mapping = map_header_fields(snap, header_row, sheet_type, config)
+    return complete_column_mapping(snap, header_mapping, config)
+
+
+def map_header_fields(
+    sheet: Worksheet | SheetSnapshot,
+    header_row: int,
+    sheet_type: str,
+    config: AppConfig,
+) -> ColumnMapping:
+    """Map columns from the header row and, if needed, the sub-header row.
+
+    This is the part of map_columns() that depends only on header text, so
+    its result can be reused for files of the same layout (see
+    layout_cache.py).  It never raises; complete_column_mapping() applies the
+    data-row fallbacks and the required-field check.
+
+    Args:
+        sheet: Worksheet (already unmerged), or its SheetSnapshot.
+        header_row: 1-based header row from detect_header_row().
+        sheet_type: "invoice" or "packing".
+        config: Application configuration.
+
+    Returns:
+        ColumnMapping of the header-derived field_map, header_row, and
+        effective_header_row.
+    """
+    snap = snapshot_of(sheet)
     columns_config = config.invoice_columns if sheet_type == "invoice" else config.packing_columns
+    matcher = _header_matcher(config, sheet_type)
 
     # Step 1: Scan the primary header row
-    field_map = _scan_row_for_fields(sheet, header_row, columns_config)
+    field_map = _scan_row_for_fields(snap, header_row, columns_config, matcher)
     effective_header_row = header_row
     logger.debug("Primary header scan at row %d: mapped %s", header_row, list(field_map.keys()))
 
@@ -149,10 +183,10 @@ def map_columns(
             unmapped_required,
         )
         # Guard: check sub-header row is not data-like
-        if not _is_data_like_row(sheet, sub_row):
+        if not _is_data_like_row(snap, sub_row):
             # Only try to match the unmapped required fields
             sub_columns = {name: columns_config[name] for name in unmapped_required if name in columns_config}
-            sub_map = _scan_row_for_fields(sheet, sub_row, sub_columns)
+            sub_map = _scan_row_for_fields(snap, sub_row, sub_columns, matcher)
             if sub_map:
                 field_map.update(sub_map)
                 effective_header_row = sub_row
@@ -164,11 +198,43 @@ def map_columns(
         else:
             logger.debug("Sub-header row %d rejected (data-like)", sub_row)
 
+    return ColumnMapping(
+        sheet_type=sheet_type,
+        field_map=field_map,
+        header_row=header_row,
+        effective_header_row=effective_header_row,
+    )
+
+
+def complete_column_mapping(
+    sheet: Worksheet | SheetSnapshot,
+    header_mapping: ColumnMapping,
+    config: AppConfig,
+) -> ColumnMapping:
+    """Apply the data-row fallbacks and required-field check to a header mapping.
+
+    Args:
+        sheet: Worksheet (already unmerged), or its SheetSnapshot.
+        header_mapping: Result of map_header_fields() (not mutated).
+        config: Application configuration.
+
+    Returns:
+        Final ColumnMapping for extraction.
+
+    Raises:
+        ProcessingError: ERR_020 listing all missing required column names.
+    """
+    snap = snapshot_of(sheet)
+    sheet_type = header_mapping.sheet_type
+    columns_config = config.invoice_columns if sheet_type == "invoice" else config.packing_columns
+    field_map = dict(header_mapping.field_map)
+
     # Step 3: Currency data-row fallback (invoice only)
     if sheet_type == "invoice" and "currency" not in field_map:
-        _currency_data_row_fallback(sheet, header_row, field_map)
+        _currency_data_row_fallback(snap, header_mapping.header_row, field_map)
 
     # Step 4: Check all required fields are mapped (collect-then-report)
+    required_fields = {name for name, fp in columns_config.items() if fp.required}
     still_unmapped = sorted(required_fields - set(field_map.keys()))
     if still_unmapped:
         raise ProcessingError(
@@ -180,81 +246,140 @@ def map_columns(
     return ColumnMapping(
         sheet_type=sheet_type,
         field_map=field_map,
-        header_row=header_row,
-        effective_header_row=effective_header_row,
+        header_row=header_mapping.header_row,
+        effective_header_row=header_mapping.effective_header_row,
     )
 
 
-def extract_inv_no_from_header(sheet: Worksheet, config: AppConfig) -> str | None:
+def extract_inv_no_from_header(sheet: Worksheet | SheetSnapshot, config: AppConfig) -> str | None:
     """Scan invoice sheet rows 1-15 for invoice number via capture/label patterns.
 
     Args:
-        sheet: Invoice worksheet (already unmerged).
+        sheet: Invoice worksheet (already unmerged), or its SheetSnapshot.
         config: Application configuration with inv_no patterns.
 
     Returns:
         Cleaned invoice number string, or None if not found.
         Does NOT raise ERR_021 -- caller (batch.py) decides if error applies.
     """
-    max_col = sheet.max_column or 20
-    # Reason: Limit scan columns to a reasonable upper bound to avoid
-    # scanning phantom columns in sheets with excessive max_column.
-    scan_max_col = min(max_col, 20)
+    found = locate_inv_no_in_header(sheet, config)
+    return found[0] if found is not None else None
 
-    for row_idx in range(1, 16):
-        for col_idx in range(1, scan_max_col + 1):
-            raw = sheet.cell(row=row_idx, column=col_idx).value
-            if raw is None:
-                continue
-            text = str(raw).strip()
-            if not text:
-                continue
 
-            # Try capture-group patterns (value in same cell)
-            for pattern in config.inv_no_patterns:
-                match = pattern.search(text)
-                if match:
-                    # Use the first capture group if present, else whole match
-                    value = match.group(1) if match.lastindex else match.group(0)
-                    cleaned = _clean_inv_no(value)
-                    if cleaned and not _is_excluded_inv_no(cleaned, config):
-                        logger.debug(
-                            "inv_no capture match at row %d, col %d: %r -> %r",
-                            row_idx,
-                            col_idx,
-                            text,
-                            cleaned,
-                        )
-                        return cleaned
-
-            # Try label patterns (value in adjacent cell)
-            for pattern in config.inv_no_label_patterns:
-                if pattern.search(text):
-                    logger.debug(
-                        "inv_no label match at row %d, col %d: %r",
-                        row_idx,
-                        col_idx,
-                        text,
-                    )
-                    # Search right: up to +3 columns
-                    result = _search_adjacent_right(sheet, row_idx, col_idx, scan_max_col, config)
-                    if result:
-                        return result
-
-                    # Search below: row+1 AND row+2
-                    result = _search_adjacent_below(sheet, row_idx, col_idx, config)
-                    if result:
-                        return result
+def locate_inv_no_in_header(sheet: Worksheet | SheetSnapshot, config: AppConfig) -> tuple[str, int, int] | None:
+    """Like extract_inv_no_from_header(), but also report the cell that yielded it.
+
+    Args:
+        sheet: Invoice worksheet (already unmerged), or its SheetSnapshot.
+        config: Application configuration with inv_no patterns.
+
+    Returns:
+        (cleaned invoice number, row, column) of the capture or label cell
+        that produced the value, or None if not found.  Passing the row and
+        column to read_inv_no_at() repeats the lookup for that cell only.
+    """
+    snap = snapshot_of(sheet)
+    # Reason: Limit scan columns to a reasonable upper bound and to the data
+    # extent to avoid scanning phantom columns in sheets with excessive
+    # max_column.
+    scan_max_col = snap.data_columns(20)
+
+    for row_idx in snap.data_rows(1, 15):
+        for col_idx in range(1, scan_max_col + 1):
+            result = _inv_no_at_cell(snap, row_idx, col_idx, scan_max_col, config)
+            if result:
+                return result, row_idx, col_idx
 
     logger.debug("No invoice number found in header area (rows 1-15)")
     return None
 
 
+def read_inv_no_at(sheet: Worksheet | SheetSnapshot, row: int, column: int, config: AppConfig) -> str | None:
+    """Read the invoice number from one header cell found by locate_inv_no_in_header().
+
+    Args:
+        sheet: Invoice worksheet (already unmerged), or its SheetSnapshot.
+        row: 1-based row of the capture or label cell.
+        column: 1-based column of the capture or label cell.
+        config: Application configuration with inv_no patterns.
+
+    Returns:
+        Cleaned invoice number string, or None if that cell no longer yields one.
+    """
+    snap = snapshot_of(sheet)
+    return _inv_no_at_cell(snap, row, column, snap.data_columns(20), config)
+
+
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
 
+def _inv_no_at_cell(
+    sheet: SheetSnapshot,
+    row_idx: int,
+    col_idx: int,
+    scan_max_col: int,
+    config: AppConfig,
+) -> str | None:
+    """Try the capture and label patterns on one header cell.
+
+    Args:
+        sheet: Sheet snapshot to search.
+        row_idx: 1-based row of the cell.
+        col_idx: 1-based column of the cell.
+        scan_max_col: Rightmost column for the adjacent-right search.
+        config: Application configuration with inv_no patterns.
+
+    Returns:
+        Cleaned invoice number string, or None if the cell yields none.
+    """
+    raw = sheet.value(row_idx, col_idx)
+    if raw is None:
+        return None
+    text = str(raw).strip()
+    if not text:
+        return None
+
+    # Try capture-group patterns (value in same cell)
+    for pattern in config.inv_no_patterns:
+        match = pattern.search(text)
+        if match:
+            # Use the first capture group if present, else whole match
+            value = match.group(1) if match.lastindex else match.group(0)
+            cleaned = _clean_inv_no(value)
+            if cleaned and not _is_excluded_inv_no(cleaned, config):
+                logger.debug(
+                    "inv_no capture match at row %d, col %d: %r -> %r",
+                    row_idx,
+                    col_idx,
+                    text,
+                    cleaned,
+                )
+                return cleaned
+
+    # Try label patterns (value in adjacent cell)
+    for pattern in config.inv_no_label_patterns:
+        if pattern.search(text):
+            logger.debug(
+                "inv_no label match at row %d, col %d: %r",
+                row_idx,
+                col_idx,
+                text,
+            )
+            # Search right: up to +3 columns
+            result = _search_adjacent_right(sheet, row_idx, col_idx, scan_max_col, config)
+            if result:
+                return result
+
+            # Search below: row+1 AND row+2
+            result = _search_adjacent_below(sheet, row_idx, col_idx, config)
+            if result:
+                return result
+
+    return None
+
+
 def _classify_tier(cell_values: list[str]) -> int:
     """Classify a row into tier 0, 1, or 2 based on content.
 
@@ -293,70 +418,88 @@ def _classify_tier(cell_values: list[str]) -> int:
     return 1
 
 
+def _header_matcher(config: AppConfig, sheet_type: str) -> HeaderMatcher:
+    """Return the config's precompiled header matcher for a sheet type.
+
+    ``load_config`` builds both matchers; configs constructed directly (e.g. in
+    tests) get theirs built here on first use and cached on the config.
+
+    Args:
+        config: Application configuration.
+        sheet_type: "invoice" or "packing".
+
+    Returns:
+        HeaderMatcher over the sheet type's column patterns.
+    """
+    if sheet_type == "invoice":
+        if config.invoice_header_matcher is None:
+            config.invoice_header_matcher = HeaderMatcher(config.invoice_columns)
+        return config.invoice_header_matcher
+    if config.packing_header_matcher is None:
+        config.packing_header_matcher = HeaderMatcher(config.packing_columns)
+    return config.packing_header_matcher
+
+
 def _scan_row_for_fields(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     row_idx: int,
     columns_config: dict[str, FieldPattern],
+    matcher: HeaderMatcher,
 ) -> dict[str, int]:
     """Scan a single row and match cells against field regex patterns.
 
     Args:
-        sheet: Worksheet to scan.
+        sheet: Sheet snapshot to scan.
         row_idx: 1-based row number.
         columns_config: Dict of field_name -> FieldPattern to match against.
+        matcher: Precompiled matcher whose fields include ``columns_config``.
 
     Returns:
         Dict mapping matched field_name to 1-based column index. First match per field wins.
     """
     field_map: dict[str, int] = {}
-    max_col = sheet.max_column or _SCAN_COL_END
-    # Reason: Limit scan to avoid phantom columns.
-    scan_cols = min(max_col, 50)
+    # Reason: Limit scan to the data extent (max 50) to avoid phantom columns.
+    scan_cols = sheet.data_columns(50)
 
     for col_idx in range(1, scan_cols + 1):
-        raw = sheet.cell(row=row_idx, column=col_idx).value
+        raw = sheet.value(row_idx, col_idx)
         if raw is None:
             continue
         text = normalize_header(str(raw))
         if not text:
             continue
 
-        for field_name, field_pattern in columns_config.items():
-            if field_name in field_map:
-                continue  # Already mapped
-            for pattern_str in field_pattern.patterns:
-                compiled = re.compile(pattern_str, re.IGNORECASE)
-                if compiled.search(text):
-                    field_map[field_name] = col_idx
-                    logger.debug(
-                        "Matched field %r at row %d, col %d: header=%r, pattern=%r",
-                        field_name,
-                        row_idx,
-                        col_idx,
-                        text,
-                        pattern_str,
-                    )
-                    break
+        for field_name in matcher.match(text):
+            if field_name in field_map or field_name not in columns_config:
+                continue  # Already mapped, or not requested in this scan
+            field_map[field_name] = col_idx
+            logger.debug(
+                "Matched field %r at row %d, col %d: header=%r, pattern=%r",
+                field_name,
+                row_idx,
+                col_idx,
+                text,
+                matcher.matching_pattern(field_name, text),
+            )
 
     return field_map
 
 
-def _is_data_like_row(sheet: Worksheet, row_idx: int) -> bool:
+def _is_data_like_row(sheet: SheetSnapshot, row_idx: int) -> bool:
     """Check if a row is data-like (3+ numeric/code cells).
 
     Args:
-        sheet: Worksheet to check.
+        sheet: Sheet snapshot to check.
         row_idx: 1-based row number.
 
     Returns:
         True if the row has 3+ numeric/data-like cells.
     """
-    max_col = sheet.max_column or _SCAN_COL_END
-    scan_cols = min(max_col, 50)
+    scan_cols = sheet.data_columns(50)
     numeric_count = 0
 
     for col_idx in range(1, scan_cols + 1):
-        raw = sheet.cell(row=row_idx, column=col_idx).value
+        raw = sheet.value(row_idx, col_idx)
         if raw is None:
             continue
         text = str(raw).strip()
@@ -369,7 +512,7 @@ def _is_data_like_row(sheet: Worksheet, row_idx: int) -> bool:
 
 
 def _currency_data_row_fallback(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     header_row: int,
     field_map: dict[str, int],
 ) -> None:
@@ -379,17 +522,16 @@ def _currency_data_row_fallback(
     shift that field's mapping to col+1 (actual numeric value is one column right).
 
     Args:
-        sheet: Worksheet to scan.
+        sheet: Sheet snapshot to scan.
         header_row: 1-based header row number.
         field_map: Current field_map (mutated in place).
     """
-    max_col = sheet.max_column or _SCAN_COL_END
-    scan_cols = min(max_col, 50)
+    scan_cols = sheet.data_columns(50)
     currency_col: int | None = None
 
     for data_row in range(header_row + 1, header_row + 5):
         for col_idx in range(1, scan_cols + 1):
-            raw = sheet.cell(row=data_row, column=col_idx).value
+            raw = sheet.value(data_row, col_idx)
             if raw is None:
                 continue
             text = str(raw).strip()
@@ -435,7 +577,7 @@ def _currency_data_row_fallback(
 
 
 def _search_adjacent_right(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     row_idx: int,
     col_idx: int,
     max_col: int,
@@ -444,7 +586,7 @@ def _search_adjacent_right(
     """Search right of a label cell for invoice number (up to +3 columns).
 
     Args:
-        sheet: Worksheet to search.
+        sheet: Sheet snapshot to search.
         row_idx: Row of the label cell.
         col_idx: Column of the label cell.
         max_col: Maximum column to scan.
@@ -457,7 +599,7 @@ def _search_adjacent_right(
         adj_col = col_idx + offset
         if adj_col > max_col:
             break
-        raw = sheet.cell(row=row_idx, column=adj_col).value
+        raw = sheet.value(row_idx, adj_col)
         if raw is None:
             continue
         text = str(raw).strip()
@@ -476,7 +618,7 @@ def _search_adjacent_right(
 
 
 def _search_adjacent_below(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     row_idx: int,
     col_idx: int,
     config: AppConfig,
@@ -484,7 +626,7 @@ def _search_adjacent_below(
     """Search below a label cell for invoice number (row+1 and row+2).
 
     Args:
-        sheet: Worksheet to search.
+        sheet: Sheet snapshot to search.
         row_idx: Row of the label cell.
         col_idx: Column of the label cell.
         config: AppConfig with exclude patterns.
@@ -496,7 +638,7 @@ def _search_adjacent_below(
     # a date at row+1 and the actual invoice number at row+2.
     for row_offset in range(1, 3):
         below_row = row_idx + row_offset
-        raw = sheet.cell(row=below_row, column=col_idx).value
+        raw = sheet.value(below_row, col_idx)
         if raw is None:
             continue
         text = str(raw).strip()
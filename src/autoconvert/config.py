@@ -3,17 +3,28 @@
 Loads and validates all configuration files (YAML patterns, Excel lookup tables,
 output template). Compiles regex patterns, builds normalized lookup dictionaries,
 and returns an ``AppConfig`` instance used by all downstream modules.
+
+Parsing the YAML and opening three workbooks through openpyxl dominates
+start-up, so a validated configuration is also written to a snapshot file next
+to the config directory (``<config_dir>.snapshot``): the pattern sources,
+column definitions and lookup tables as a zlib-compressed ``marshal`` payload,
+tagged with the SHA-256 of every source file.  While the sources are unchanged
+``load_config`` rebuilds AppConfig from the snapshot; otherwise it runs the full
+validation (ERR_001–ERR_005) and rewrites the snapshot.  PyYAML and openpyxl
+are imported only on that full-load path.
 """
 
+import hashlib
 import logging
+import marshal
+import os
 import re
+import zlib
 from pathlib import Path
 from typing import Any
 
-import yaml
-from openpyxl import load_workbook
-
 from .errors import ConfigError, ErrorCode
+from .header_match import HeaderMatcher
 from .models import AppConfig, FieldPattern
 from .utils import normalize_lookup_key
 
@@ -53,6 +64,26 @@ _REQUIRED_PACKING_FIELDS: list[str] = [
     "pack",
 ]
 
+_SOURCE_FILES: tuple[str, ...] = (
+    "field_patterns.yaml",
+    "currency_rules.xlsx",
+    "country_rules.xlsx",
+    "output_template.xlsx",
+)
+
+# Reason: Bump whenever loading or normalization rules change, so that
+# snapshots written by an older build are rebuilt from the sources.
+_SNAPSHOT_MAGIC = b"ACCF"
+_SNAPSHOT_VERSION = 1
+
+_PATTERN_KEYS: tuple[str, ...] = (
+    "invoice_sheet_patterns",
+    "packing_sheet_patterns",
+    "inv_no_patterns",
+    "inv_no_label_patterns",
+    "inv_no_exclude_patterns",
+)
+
 
 def load_config(config_dir: Path) -> AppConfig:
     """Load and validate all configuration files from config_dir.
@@ -60,6 +91,11 @@ def load_config(config_dir: Path) -> AppConfig:
     Compiles regex patterns, builds normalized lookup tables, and validates
     the output template structure. Raises ConfigError on any failure.
 
+    If the config snapshot matches the current bytes of every source file,
+    the AppConfig is rebuilt from it without re-reading the sources; a
+    missing, stale or unreadable snapshot falls back to full validation and
+    is rewritten afterwards.
+
     Args:
         config_dir: Path to the directory containing field_patterns.yaml,
             currency_rules.xlsx, country_rules.xlsx, and output_template.xlsx.
@@ -67,6 +103,32 @@ def load_config(config_dir: Path) -> AppConfig:
     Returns:
         AppConfig with compiled patterns, lookup tables, and template path.
 
+    Raises:
+        ConfigError: ERR_001 through ERR_005 on validation failures.
+    """
+    snapshot_path = _snapshot_path(config_dir)
+    fingerprint = _source_fingerprint(config_dir)
+    if fingerprint is not None:
+        config = _load_snapshot(snapshot_path, fingerprint, config_dir)
+        if config is not None:
+            logger.debug("Loaded configuration snapshot %s", snapshot_path)
+            return config
+
+    config = _load_config_from_sources(config_dir)
+    if fingerprint is not None:
+        _save_snapshot(snapshot_path, fingerprint, config)
+    return config
+
+
+def _load_config_from_sources(config_dir: Path) -> AppConfig:
+    """Load and validate every configuration file (the full load_config path).
+
+    Args:
+        config_dir: Configuration directory.
+
+    Returns:
+        AppConfig with compiled patterns, lookup tables, and template path.
+
     Raises:
         ConfigError: ERR_001 through ERR_005 on validation failures.
     """
@@ -155,6 +217,8 @@ def load_config(config_dir: Path) -> AppConfig:
         currency_lookup=currency_lookup,
         country_lookup=country_lookup,
         template_path=template_path,
+        invoice_header_matcher=HeaderMatcher(invoice_columns),
+        packing_header_matcher=HeaderMatcher(packing_columns),
     )
 
 
@@ -163,6 +227,107 @@ def load_config(config_dir: Path) -> AppConfig:
 # ---------------------------------------------------------------------------
 
 
+def _snapshot_path(config_dir: Path) -> Path:
+    """Return the snapshot file path for a config directory (``<config_dir>.snapshot``)."""
+    return config_dir.with_name(f"{config_dir.name}.snapshot")
+
+
+def _source_fingerprint(config_dir: Path) -> list[str] | None:
+    """Return the SHA-256 of each source file, or None if any cannot be read.
+
+    Args:
+        config_dir: Configuration directory.
+
+    Returns:
+        Hex digests in _SOURCE_FILES order, or None (full load reports why).
+    """
+    digests: list[str] = []
+    for name in _SOURCE_FILES:
+        try:
+            digests.append(hashlib.sha256((config_dir / name).read_bytes()).hexdigest())
+        except OSError:
+            return None
+    return digests
+
+
+def _save_snapshot(snapshot_path: Path, fingerprint: list[str], config: AppConfig) -> None:
+    """Write the snapshot of a freshly validated config; failures are only logged.
+
+    Args:
+        snapshot_path: Destination file.
+        fingerprint: Source digests from _source_fingerprint().
+        config: AppConfig built from those sources.
+    """
+    payload: dict[str, Any] = {key: [p.pattern for p in getattr(config, key)] for key in _PATTERN_KEYS}
+    for key in ("invoice_columns", "packing_columns"):
+        columns: dict[str, FieldPattern] = getattr(config, key)
+        payload[key] = [(name, list(fp.patterns), fp.type, fp.required) for name, fp in columns.items()]
+    payload["currency_lookup"] = config.currency_lookup
+    payload["country_lookup"] = config.country_lookup
+    payload["template_name"] = config.template_path.name
+    data = _SNAPSHOT_MAGIC + bytes([_SNAPSHOT_VERSION]) + zlib.compress(marshal.dumps((fingerprint, payload)))
+    tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, snapshot_path)
+    except OSError as exc:
+        logger.debug("Could not write configuration snapshot %s: %s", snapshot_path, exc)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _load_snapshot(snapshot_path: Path, fingerprint: list[str], config_dir: Path) -> AppConfig | None:
+    """Rebuild AppConfig from the snapshot if it was written for these sources.
+
+    Args:
+        snapshot_path: Snapshot file.
+        fingerprint: Current source digests.
+        config_dir: Configuration directory (template path is resolved in it).
+
+    Returns:
+        AppConfig, or None if the snapshot is missing, stale or unreadable.
+    """
+    try:
+        data = snapshot_path.read_bytes()
+    except OSError:
+        return None
+    header = len(_SNAPSHOT_MAGIC) + 1
+    if data[: len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC or data[header - 1 : header] != bytes([_SNAPSHOT_VERSION]):
+        return None
+    try:
+        stored_fingerprint, payload = marshal.loads(zlib.decompress(data[header:]))
+        if stored_fingerprint != fingerprint:
+            logger.debug("Configuration snapshot is stale; reloading sources")
+            return None
+        patterns = {key: [re.compile(p, re.IGNORECASE) for p in payload[key]] for key in _PATTERN_KEYS}
+        columns = {
+            key: {
+                name: FieldPattern(patterns=field_patterns, type=field_type, required=required)
+                for name, field_patterns, field_type, required in payload[key]
+            }
+            for key in ("invoice_columns", "packing_columns")
+        }
+        return AppConfig(
+            invoice_sheet_patterns=patterns["invoice_sheet_patterns"],
+            packing_sheet_patterns=patterns["packing_sheet_patterns"],
+            invoice_columns=columns["invoice_columns"],
+            packing_columns=columns["packing_columns"],
+            inv_no_patterns=patterns["inv_no_patterns"],
+            inv_no_label_patterns=patterns["inv_no_label_patterns"],
+            inv_no_exclude_patterns=patterns["inv_no_exclude_patterns"],
+            currency_lookup=payload["currency_lookup"],
+            country_lookup=payload["country_lookup"],
+            template_path=config_dir / payload["template_name"],
+            invoice_header_matcher=HeaderMatcher(columns["invoice_columns"]),
+            packing_header_matcher=HeaderMatcher(columns["packing_columns"]),
+        )
+    except (ValueError, EOFError, TypeError, KeyError, zlib.error, re.error) as exc:
+        logger.debug("Ignoring unreadable configuration snapshot %s: %s", snapshot_path, exc)
+        return None
+
+
 def _load_yaml(yaml_path: Path) -> dict[str, Any]:
     """Load YAML file. Raises ERR_001 if missing, ERR_004 if not a dict.
 
@@ -178,6 +343,9 @@ def _load_yaml(yaml_path: Path) -> dict[str, Any]:
             message=f"Required configuration file not found: {yaml_path}",
             path=str(yaml_path),
         )
+    # Reason: Imported on the full-load path only; a snapshot hit never needs it.
+    import yaml
+
     with open(yaml_path, encoding="utf-8") as fh:
         data: Any = yaml.safe_load(fh)
     # Reason: yaml.safe_load returns Any; must verify top-level is dict.
@@ -386,6 +554,8 @@ def _load_lookup_table(
             message=f"Required configuration file not found: {xlsx_path}",
             path=str(xlsx_path),
         )
+    from openpyxl import load_workbook
+
     wb = load_workbook(xlsx_path, data_only=True, read_only=True)
     try:
         if sheet_name not in wb.sheetnames:
@@ -461,6 +631,8 @@ def _validate_template(template_path: Path) -> None:
             message=f"Required configuration file not found: {template_path}",
             path=str(template_path),
         )
+    from openpyxl import load_workbook
+
     wb = load_workbook(template_path, data_only=True, read_only=True)
     try:
         required_sheet = "\u5de5\u4f5c\u88681"  # 工作表1
@@ -79,6 +79,16 @@ class ProcessingError(Exception):
         self.message = message
         self.context = context
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling across process boundaries (batch worker pool).
+
+        Returns:
+            Constructor and arguments that rebuild an equivalent error.
+        """
+        # Reason: Exception's default reduce replays ``self.args`` (the message
+        # only), which does not match this three-argument constructor.
+        return (self.__class__, (self.code, self.message, self.context))
+
 
 class ConfigError(Exception):
     """Fatal configuration error raised during startup config loading (FR-002).
@@ -104,3 +114,11 @@ class ConfigError(Exception):
         self.code = code
         self.message = message
         self.path = path
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Support pickling across process boundaries.
+
+        Returns:
+            Constructor and arguments that rebuild an equivalent error.
+        """
+        return (self.__class__, (self.code, self.message, self.path))
@@ -12,13 +12,13 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from .errors import ErrorCode, ProcessingError
 from .merge_tracker import MergeTracker
-from .models import ColumnMapping, InvoiceItem
+from .models import ColumnMapping, InvoiceRecord
+from .numeric import cell_decimal, cell_precision
+from .sheet_snapshot import SheetSnapshot, snapshot_of
 from .utils import (
     FOOTER_KEYWORDS,
     STOP_KEYWORD_COL_COUNT,
-    detect_cell_precision,
     is_stop_keyword,
-    safe_decimal,
     strip_unit_suffix,
 )
 
@@ -29,15 +29,16 @@ _INV_PREFIX_RE = re.compile(r"^(INV#|NO\.)\s*", re.IGNORECASE)
 
 
 def extract_invoice_items(
-    sheet: Worksheet,
+    sheet: Worksheet | SheetSnapshot,
     column_map: ColumnMapping,
     merge_tracker: MergeTracker,
     inv_no: str | None,
-) -> list[InvoiceItem]:
+) -> list[InvoiceRecord]:
     """Extract 13 per-item fields from the invoice sheet.
 
     Args:
-        sheet: Invoice worksheet (already unmerged by MergeTracker).
+        sheet: Invoice worksheet (already unmerged by MergeTracker), or its
+            SheetSnapshot.
         column_map: Column index mapping with header_row and effective_header_row.
         merge_tracker: Pre-initialized MergeTracker for merged cell propagation.
         inv_no: Invoice number from batch orchestration (column or header fallback);
@@ -45,29 +46,36 @@ def extract_invoice_items(
                 field_map.
 
     Returns:
-        List of InvoiceItem records in extraction order.
+        List of InvoiceRecord items in extraction order.
 
     Raises:
         ProcessingError: ERR_030 for empty required field; ERR_031 for invalid
             numeric.
     """
+    snap = snapshot_of(sheet)
     field_map = column_map.field_map
     header_row = column_map.header_row
     start_row = column_map.effective_header_row + 1
 
-    items: list[InvoiceItem] = []
+    items: list[InvoiceRecord] = []
     found_first_data = False
+    # Reason: Currencies, countries, brands, POs and part numbers repeat over
+    # thousands of lines; one shared str per distinct value keeps the
+    # records small and lets transform work per distinct value.
+    strings: dict[str, str] = {}
 
     # Determine whether inv_no comes from a column or the parameter.
     has_inv_no_column = "inv_no" in field_map
 
-    for row in range(start_row, sheet.max_row + 1):
+    # Reason: Bounded by the data extent, not max_row -- formatting can push
+    # max_row to 1,048,576 and every row past the extent is blank anyway.
+    for row in snap.data_rows(start_row):
         # --- Step 1: Read part_no and qty raw values for blank / stop checks ---
         part_no_col = field_map.get("part_no")
         qty_col = field_map.get("qty")
 
-        raw_part_no = _get_string(sheet, merge_tracker, row, part_no_col, header_row)
-        raw_qty_str = _raw_cell_str(sheet, row, qty_col)
+        raw_part_no = _get_string(snap, merge_tracker, row, part_no_col, header_row)
+        raw_qty_str = _raw_cell_str(snap, row, qty_col)
 
         # --- Leading blank row skip ---
         # Reason: A "blank" row has both part_no empty AND qty cell empty.
@@ -80,8 +88,7 @@ def extract_invoice_items(
             # non-part_no column (e.g., TOTAL in the PO No. column). Scan cols
             # A-J before skipping, so TOTAL rows are caught even when
             # part_no/qty are both empty.
-            for col_idx in range(1, STOP_KEYWORD_COL_COUNT + 1):
-                cell_val = sheet.cell(row=row, column=col_idx).value
+            for col_idx, cell_val in enumerate(snap.row_values(row)[:STOP_KEYWORD_COL_COUNT], start=1):
                 if cell_val is not None and is_stop_keyword(str(cell_val)):
                     logger.debug("Row %d: blank row with stop keyword in col %d, ending extraction.", row, col_idx)
                     break
@@ -97,20 +104,21 @@ def extract_invoice_items(
             continue
 
         # --- Step 2: Stop conditions ---
-        if _should_stop(sheet, row, raw_part_no, raw_qty_str, found_first_data):
+        if _should_stop(snap, row, raw_part_no, raw_qty_str, found_first_data):
             logger.debug("Row %d: stop condition met, ending extraction.", row)
             break
 
         # --- Step 3: Process data row ---
         found_first_data = True
         item = _extract_row(
-            sheet,
+            snap,
             merge_tracker,
             row,
             field_map,
             header_row,
             has_inv_no_column,
             inv_no,
+            strings,
         )
         items.append(item)
         logger.debug(
@@ -132,7 +140,7 @@ def extract_invoice_items(
 
 
 def _should_stop(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     row: int,
     part_no: str,
     qty_str: str,
@@ -141,7 +149,7 @@ def _should_stop(
     """Evaluate stop conditions for the current row.
 
     Args:
-        sheet: The worksheet.
+        sheet: Sheet snapshot.
         row: Current 1-based row number.
         part_no: Stripped part_no string for this row.
         qty_str: Raw qty string (stripped, unit-suffix removed) for this row.
@@ -173,8 +181,7 @@ def _should_stop(
             return True
 
     # Condition 4: any cell in columns A-J contains stop keyword.
-    for col_idx in range(1, STOP_KEYWORD_COL_COUNT + 1):
-        cell_val = sheet.cell(row=row, column=col_idx).value
+    for col_idx, cell_val in enumerate(sheet.row_values(row)[:STOP_KEYWORD_COL_COUNT], start=1):
         if cell_val is not None and is_stop_keyword(str(cell_val)):
             logger.debug(
                 "Row %d, Col %d: stop — cell contains stop keyword '%s'.",
@@ -188,27 +195,29 @@ def _should_stop(
 
 
 def _extract_row(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     merge_tracker: MergeTracker,
     row: int,
     field_map: dict[str, int],
     header_row: int,
     has_inv_no_column: bool,
     inv_no_param: str | None,
-) -> InvoiceItem:
-    """Extract a single data row into an InvoiceItem.
+    strings: dict[str, str],
+) -> InvoiceRecord:
+    """Extract a single data row into an InvoiceRecord.
 
     Args:
-        sheet: The worksheet.
+        sheet: Sheet snapshot.
         merge_tracker: MergeTracker for merged cell propagation.
         row: 1-based row number.
         field_map: Column index mapping.
         header_row: 1-based header row for merge_tracker.
         has_inv_no_column: Whether inv_no is in field_map.
         inv_no_param: Fallback inv_no from batch orchestration.
+        strings: Intern table of the file's repeated string values (updated).
 
     Returns:
-        An InvoiceItem with all 13 fields populated.
+        An InvoiceRecord with all 13 fields populated.
 
     Raises:
         ProcessingError: ERR_030 or ERR_031.
@@ -263,26 +272,28 @@ def _extract_row(
                 context={"row": row, "field_name": field_name},
             )
 
-    return InvoiceItem(
-        part_no=part_no,
-        po_no=po_no,
+    intern = strings.setdefault
+    return InvoiceRecord(
+        part_no=intern(part_no, part_no),
+        po_no=intern(po_no, po_no),
         qty=qty,
         price=price,
         amount=amount,
-        currency=currency,
-        coo=coo,
-        cod=cod,
-        brand=brand,
-        brand_type=brand_type,
-        model_no=model_no,
+        currency=intern(currency, currency),
+        coo=intern(coo, coo),
+        cod=intern(cod, cod),
+        brand=intern(brand, brand),
+        brand_type=intern(brand_type, brand_type),
+        model_no=intern(model_no, model_no),
         inv_no=inv_no_val,
         serial=serial,
         allocated_weight=None,
+        row=row,
     )
 
 
 def _get_string(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     merge_tracker: MergeTracker,
     row: int,
     col: int | None,
@@ -291,7 +302,7 @@ def _get_string(
     """Get a string field value via merge_tracker propagation.
 
     Args:
-        sheet: The worksheet.
+        sheet: Sheet snapshot.
         merge_tracker: MergeTracker instance.
         row: 1-based row number.
         col: 1-based column index, or None if field not in field_map.
@@ -311,11 +322,11 @@ def _get_string(
         return ""
 
 
-def _raw_cell_str(sheet: Worksheet, row: int, col: int | None) -> str:
+def _raw_cell_str(sheet: SheetSnapshot, row: int, col: int | None) -> str:
     """Get raw cell value as stripped string for blank/stop checks.
 
     Args:
-        sheet: The worksheet.
+        sheet: Sheet snapshot.
         row: 1-based row number.
         col: 1-based column index, or None.
 
@@ -324,7 +335,7 @@ def _raw_cell_str(sheet: Worksheet, row: int, col: int | None) -> str:
     """
     if col is None:
         return ""
-    val = sheet.cell(row=row, column=col).value
+    val = sheet.value(row, col)
     if val is None:
         return ""
     try:
@@ -334,7 +345,7 @@ def _raw_cell_str(sheet: Worksheet, row: int, col: int | None) -> str:
 
 
 def _parse_numeric(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     row: int,
     col: int | None,
     field_name: str,
@@ -342,10 +353,10 @@ def _parse_numeric(
     precision_from_cell: bool = False,
     fixed_precision: int = 0,
 ) -> Decimal:
-    """Parse a numeric field from a cell, applying unit suffix stripping and safe_decimal.
+    """Parse a numeric field from a cell, applying unit suffix stripping and cell_decimal.
 
     Args:
-        sheet: The worksheet.
+        sheet: Sheet snapshot.
         row: 1-based row number.
         col: 1-based column index.
         field_name: Field name for error reporting.
@@ -365,8 +376,7 @@ def _parse_numeric(
             context={"row": row, "column": col, "field_name": field_name},
         )
 
-    cell = sheet.cell(row=row, column=col)
-    raw_value = cell.value
+    raw_value = sheet.value(row, col)
 
     if raw_value is None:
         raise ProcessingError(
@@ -375,17 +385,15 @@ def _parse_numeric(
             context={"row": row, "column": col, "field_name": field_name},
         )
 
-    # Convert to string and strip unit suffixes.
-    raw_str = strip_unit_suffix(str(raw_value))
-
     # Determine precision.
     if precision_from_cell:
-        decimals = detect_cell_precision(cell)
+        decimals = cell_precision(raw_value, sheet.number_format(row, col))
     else:
         decimals = fixed_precision
 
+    # Unit suffixes are stripped from string values.
     try:
-        result = safe_decimal(raw_str, decimals)
+        result = cell_decimal(raw_value, decimals)
     except (ValueError, TypeError) as exc:
         raise ProcessingError(
             code=ErrorCode.ERR_031,
@@ -394,12 +402,11 @@ def _parse_numeric(
         ) from exc
 
     logger.debug(
-        "Row %d, Col %d (%s): raw=%r, stripped=%r, decimals=%d, parsed=%s",
+        "Row %d, Col %d (%s): raw=%r, decimals=%d, parsed=%s",
         row,
         col,
         field_name,
         raw_value,
-        raw_str,
         decimals,
         result,
     )
@@ -7,14 +7,13 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from .errors import ErrorCode, ProcessingError
 from .merge_tracker import MergeTracker
-from .models import ColumnMapping, PackingItem
+from .models import ColumnMapping, PackingRecord
+from .numeric import cell_decimal, cell_precision
+from .sheet_snapshot import SheetSnapshot, snapshot_of
 from .utils import (
     DITTO_MARKS,
     STOP_KEYWORD_COL_COUNT,
-    detect_cell_precision,
     is_stop_keyword,
-    safe_decimal,
-    strip_unit_suffix,
     try_float,
 )
 
@@ -26,25 +25,27 @@ _HEADER_CONTINUATION = "part no"
 
 
 def extract_packing_items(
-    sheet: Worksheet,
+    sheet: Worksheet | SheetSnapshot,
     column_map: ColumnMapping,
     merge_tracker: MergeTracker,
-) -> tuple[list[PackingItem], int]:
+) -> tuple[list[PackingRecord], int]:
     """Extract packing items (part_no, qty, nw) from the packing sheet.
 
     Args:
-        sheet: Packing worksheet (already unmerged by MergeTracker).
+        sheet: Packing worksheet (already unmerged by MergeTracker), or its
+            SheetSnapshot.
         column_map: Column index mapping with header_row and effective_header_row.
         merge_tracker: Pre-initialized MergeTracker for merged cell propagation.
 
     Returns:
-        Tuple of (list of PackingItem, last_data_row). last_data_row is the 1-based
+        Tuple of (list of PackingRecord, last_data_row). last_data_row is the 1-based
         row number of the last extracted item, used by extract_totals.detect_total_row().
 
     Raises:
         ProcessingError: ERR_030 for empty required field (non-continuation rows);
                          ERR_031 for invalid numeric value.
     """
+    snap = snapshot_of(sheet)
     part_no_col = column_map.field_map["part_no"]
     qty_col = column_map.field_map["qty"]
     nw_col = column_map.field_map["nw"]
@@ -53,25 +54,26 @@ def extract_packing_items(
     header_row = column_map.header_row
     start_row = column_map.effective_header_row + 1
 
-    items: list[PackingItem] = []
+    items: list[PackingRecord] = []
     last_data_row = start_row  # fallback if no items extracted
     found_first_data = False
 
-    for row in range(start_row, sheet.max_row + 1):  # type: ignore[operator]
+    # Reason: Bounded by the data extent, not max_row (formatting-inflated).
+    for row in snap.data_rows(start_row):
         # Stop condition check — BEFORE blank/filter checks (FR-012 CRITICAL)
-        if _check_stop_keyword(sheet, row):
+        if _check_stop_keyword(snap, row):
             logger.debug("Row %d: stop keyword detected in columns A–J.", row)
             break
 
-        raw_part_no = sheet.cell(row=row, column=part_no_col).value
+        raw_part_no = snap.value(row, part_no_col)
         raw_nw = merge_tracker.get_weight_value(row, nw_col, header_row)
-        raw_gw_value = sheet.cell(row=row, column=gw_col).value if gw_col else None
+        raw_gw_value = snap.value(row, gw_col) if gw_col else None
 
         # Merged part_no propagation (FR-012)
         part_no_str = _resolve_part_no(raw_part_no, row, part_no_col, merge_tracker, header_row)
 
         # Stop condition 2: truly blank row (after first data row)
-        raw_qty = sheet.cell(row=row, column=qty_col).value
+        raw_qty = snap.value(row, qty_col)
         if found_first_data and _is_truly_blank(part_no_str, raw_qty, raw_nw):
             logger.debug("Row %d: truly blank row after first data — stopping.", row)
             break
@@ -98,18 +100,18 @@ def extract_packing_items(
         found_first_data = True
 
         nw_value, is_first = _parse_nw(raw_nw, row, nw_col, part_no_str, items, merge_tracker, header_row)
-        qty_value = _parse_qty(raw_qty, row, qty_col, part_no_str, items, merge_tracker, header_row)
+        qty_value = _parse_qty(snap, raw_qty, row, qty_col, part_no_str, items, merge_tracker)
 
         # Skip rows where qty=0 AND nw=0 (PO-reference rows)
         if qty_value == Decimal(0) and nw_value == Decimal("0.00000"):
             logger.debug("Row %d: qty=0 and nw=0 — skipping PO-reference row.", row)
             continue
 
-        item = PackingItem(part_no=part_no_str, qty=qty_value, nw=nw_value, is_first_row_of_merge=is_first)
+        item = PackingRecord(part_no=part_no_str, qty=qty_value, nw=nw_value, is_first_row_of_merge=is_first)
         items.append(item)
         last_data_row = row
         logger.debug(
-            "Row %d: extracted PackingItem(part_no=%r, qty=%s, nw=%s, first=%s)",
+            "Row %d: extracted PackingRecord(part_no=%r, qty=%s, nw=%s, first=%s)",
             row,
             part_no_str,
             qty_value,
@@ -122,7 +124,7 @@ def extract_packing_items(
 
 
 def validate_merged_weights(
-    packing_items: list[PackingItem],
+    packing_items: list[PackingRecord],
     merge_tracker: MergeTracker,
     column_map: ColumnMapping,
 ) -> None:
@@ -143,18 +145,16 @@ def validate_merged_weights(
     part_no_col = column_map.field_map["part_no"]
     header_row = column_map.header_row
 
-    # Reason: Iterate all captured merge ranges. For each NW-column data-area
-    # merge, read part_no values from the sheet for all rows in the range.
-    for mr in merge_tracker._ranges:  # noqa: SLF001
-        if not (mr.min_col <= nw_col <= mr.max_col):
-            continue
+    # Reason: For each NW-column data-area merge (looked up through the
+    # tracker's column index), collect the propagated part_no values of its
+    # rows; a merged part_no run contributes its anchor value once.
+    for mr in merge_tracker.ranges_in_column(nw_col):
         # Only data-area merges (starting after header_row)
         if mr.min_row <= header_row:
             continue
 
         part_nos_in_range: set[str] = set()
-        for row in range(mr.min_row, mr.max_row + 1):
-            propagated = merge_tracker.get_string_value(row, part_no_col, header_row)
+        for propagated in merge_tracker.get_string_values(part_no_col, mr.min_row, mr.max_row, header_row):
             part_no_str = _to_str(propagated)
             if part_no_str:
                 part_nos_in_range.add(part_no_str)
@@ -179,10 +179,9 @@ def validate_merged_weights(
 # ---------------------------------------------------------------------------
 
 
-def _check_stop_keyword(sheet: Worksheet, row: int) -> bool:
+def _check_stop_keyword(sheet: SheetSnapshot, row: int) -> bool:
     """Return True if any cell in columns A-J contains a stop keyword."""
-    for col in range(1, STOP_KEYWORD_COL_COUNT + 1):
-        cell_value = sheet.cell(row=row, column=col).value
+    for cell_value in sheet.row_values(row)[:STOP_KEYWORD_COL_COUNT]:
         if cell_value is not None and is_stop_keyword(str(cell_value)):
             return True
     return False
@@ -256,7 +255,7 @@ def _parse_nw(
     row: int,
     nw_col: int,
     part_no_str: str,
-    items: list[PackingItem],
+    items: list[PackingRecord],
     merge_tracker: MergeTracker,
     header_row: int,
 ) -> tuple[Decimal, bool]:
@@ -291,10 +290,9 @@ def _parse_nw(
             context={"row": row, "column": nw_col, "field_name": "nw"},
         )
 
-    # Normal numeric NW parsing — strip unit suffix before parsing
-    nw_str = strip_unit_suffix(str(raw_nw))
+    # Normal numeric NW parsing — unit suffix stripped before parsing
     try:
-        nw_value = safe_decimal(nw_str, _NW_DECIMALS)
+        nw_value = cell_decimal(raw_nw, _NW_DECIMALS)
     except (ValueError, InvalidOperation) as exc:
         raise ProcessingError(
             code=ErrorCode.ERR_031,
@@ -307,13 +305,13 @@ def _parse_nw(
 
 
 def _parse_qty(
+    sheet: SheetSnapshot,
     raw_qty: object,
     row: int,
     qty_col: int,
     part_no_str: str,
-    items: list[PackingItem],
+    items: list[PackingRecord],
     merge_tracker: MergeTracker,
-    header_row: int,
 ) -> Decimal:
     """Parse QTY value with merge/continuation handling.
 
@@ -344,11 +342,9 @@ def _parse_qty(
         )
 
     # Normal numeric QTY parsing
-    qty_str = strip_unit_suffix(str(raw_qty))
-    cell = merge_tracker._sheet.cell(row=row, column=qty_col)  # noqa: SLF001
-    precision = detect_cell_precision(cell)
+    precision = cell_precision(raw_qty, sheet.number_format(row, qty_col))
     try:
-        qty_value = safe_decimal(qty_str, precision)
+        qty_value = cell_decimal(raw_qty, precision)
     except (ValueError, InvalidOperation) as exc:
         raise ProcessingError(
             code=ErrorCode.ERR_031,
@@ -9,6 +9,7 @@ from openpyxl.worksheet.worksheet import Worksheet
 from .errors import ErrorCode, ProcessingError
 from .merge_tracker import MergeTracker
 from .models import ColumnMapping, PackingTotals
+from .sheet_snapshot import SheetSnapshot, snapshot_of
 from .utils import (
     STOP_KEYWORD_COL_COUNT,
     WEIGHT_PRECISION_MAX,
@@ -53,7 +54,7 @@ _PALLET_VS_BOX_RE = re.compile(r"共(\d+)托")
 
 
 def detect_total_row(
-    sheet: Worksheet,
+    sheet: Worksheet | SheetSnapshot,
     last_data_row: int,
     column_map: ColumnMapping,
     merge_tracker: MergeTracker,
@@ -61,7 +62,7 @@ def detect_total_row(
     """Detect total row using two-strategy approach.
 
     Args:
-        sheet: Packing worksheet (already unmerged).
+        sheet: Packing worksheet (already unmerged), or its SheetSnapshot.
         last_data_row: 1-based row number of last extracted packing item.
         column_map: Column index mapping including nw, gw, part_no indices.
         merge_tracker: For excluding merged continuation rows in Strategy 2.
@@ -72,17 +73,18 @@ def detect_total_row(
     Raises:
         ProcessingError: ERR_032 if both strategies fail to find a total row.
     """
+    snap = snapshot_of(sheet)
     start_row = last_data_row + 1
     end_row = last_data_row + _MAX_SEARCH_OFFSET
 
     # Strategy 1 — keyword search
-    result = _strategy1_keyword(sheet, start_row, end_row)
+    result = _strategy1_keyword(snap, start_row, end_row)
     if result is not None:
         logger.info("Total row detected via Strategy 1 (keyword) at row %d", result)
         return result
 
     # Strategy 2 — implicit detection (only runs when Strategy 1 returns None)
-    result = _strategy2_implicit(sheet, start_row, end_row, column_map, merge_tracker)
+    result = _strategy2_implicit(snap, start_row, end_row, column_map, merge_tracker)
     if result is not None:
         logger.info("Total row detected via Strategy 2 (implicit) at row %d", result)
         return result
@@ -96,14 +98,14 @@ def detect_total_row(
 
 
 def extract_totals(
-    sheet: Worksheet,
+    sheet: Worksheet | SheetSnapshot,
     total_row: int,
     column_map: ColumnMapping,
 ) -> PackingTotals:
     """Extract total_nw (FR-015), total_gw (FR-016), total_packets (FR-017).
 
     Args:
-        sheet: Packing worksheet (already unmerged).
+        sheet: Packing worksheet (already unmerged), or its SheetSnapshot.
         total_row: 1-based row number of the total row from detect_total_row().
         column_map: Column index mapping.
 
@@ -117,16 +119,18 @@ def extract_totals(
         ProcessingError: ERR_033 if total_nw is non-numeric or missing;
                          ERR_034 if total_gw is non-numeric or missing.
     """
+    snap = snapshot_of(sheet)
+
     # FR-015 — total_nw
     nw_col = column_map.field_map["nw"]
-    total_nw, total_nw_precision = _extract_weight(sheet, total_row, nw_col, "total_nw", ErrorCode.ERR_033)
+    total_nw, total_nw_precision = _extract_weight(snap, total_row, nw_col, "total_nw", ErrorCode.ERR_033)
 
     # FR-016 — total_gw (with packaging weight addition check)
     gw_col = column_map.field_map["gw"]
-    total_gw, total_gw_precision = _extract_gw_with_packaging_check(sheet, total_row, gw_col)
+    total_gw, total_gw_precision = _extract_gw_with_packaging_check(snap, total_row, gw_col)
 
     # FR-017 — total_packets
-    total_packets = _extract_total_packets(sheet, total_row, column_map)
+    total_packets = _extract_total_packets(snap, total_row, column_map)
 
     logger.info(
         "Packing total row at row %d, NW= %s, GW= %s, Packets= %s",
@@ -150,20 +154,19 @@ def extract_totals(
 # ---------------------------------------------------------------------------
 
 
-def _strategy1_keyword(sheet: Worksheet, start_row: int, end_row: int) -> int | None:
+def _strategy1_keyword(sheet: SheetSnapshot, start_row: int, end_row: int) -> int | None:
     """Search for total row by keyword match in columns A-J.
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         start_row: First row to search (1-based).
         end_row: Last row to search (1-based).
 
     Returns:
         1-based row number of the first row containing a stop keyword, or None.
     """
-    for row in range(start_row, end_row + 1):
-        for col in range(1, STOP_KEYWORD_COL_COUNT + 1):
-            cell_value = sheet.cell(row=row, column=col).value
+    for row in sheet.data_rows(start_row, end_row):
+        for cell_value in sheet.row_values(row)[:STOP_KEYWORD_COL_COUNT]:
             if cell_value is not None and is_stop_keyword(str(cell_value)):
                 return row
     return None
@@ -175,7 +178,7 @@ def _strategy1_keyword(sheet: Worksheet, start_row: int, end_row: int) -> int |
 
 
 def _strategy2_implicit(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     start_row: int,
     end_row: int,
     column_map: ColumnMapping,
@@ -184,7 +187,7 @@ def _strategy2_implicit(
     """Search for total row by implicit pattern (empty part_no + numeric NW/GW).
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         start_row: First row to search (1-based).
         end_row: Last row to search (1-based).
         column_map: Column index mapping.
@@ -197,9 +200,9 @@ def _strategy2_implicit(
     nw_col = column_map.field_map["nw"]
     gw_col = column_map.field_map["gw"]
 
-    for row in range(start_row, end_row + 1):
+    for row in sheet.data_rows(start_row, end_row):
         # Check part_no is empty
-        part_no_value = sheet.cell(row=row, column=part_no_col).value
+        part_no_value = sheet.value(row, part_no_col)
         if part_no_value is not None and str(part_no_value).strip() != "":
             continue
 
@@ -208,12 +211,12 @@ def _strategy2_implicit(
             continue
 
         # Check NW > 0
-        nw_value = try_float(sheet.cell(row=row, column=nw_col).value)
+        nw_value = try_float(sheet.value(row, nw_col))
         if nw_value is None or nw_value <= 0:
             continue
 
         # Check GW > 0
-        gw_value = try_float(sheet.cell(row=row, column=gw_col).value)
+        gw_value = try_float(sheet.value(row, gw_col))
         if gw_value is None or gw_value <= 0:
             continue
 
@@ -228,7 +231,7 @@ def _strategy2_implicit(
 
 
 def _extract_weight(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     row: int,
     col: int,
     field_name: str,
@@ -237,7 +240,7 @@ def _extract_weight(
     """Extract a weight value from a cell with precision detection.
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         row: 1-based row number.
         col: 1-based column number.
         field_name: Field name for error messages (e.g. "total_nw").
@@ -315,7 +318,7 @@ def _normalize_precision(precision: int, cell: object, raw_value: object) -> int
 
 
 def _extract_gw_with_packaging_check(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     total_row: int,
     gw_col: int,
 ) -> tuple[Decimal, int]:
@@ -325,7 +328,7 @@ def _extract_gw_with_packaging_check(
     as final total_gw (handles pallet weight addition).
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         total_row: 1-based total row number.
         gw_col: 1-based GW column index.
 
@@ -339,13 +342,13 @@ def _extract_gw_with_packaging_check(
     total_gw, total_gw_precision = _extract_weight(sheet, total_row, gw_col, "total_gw", ErrorCode.ERR_034)
 
     # Check +1 row
-    plus1_value = try_float(sheet.cell(row=total_row + 1, column=gw_col).value)
+    plus1_value = try_float(sheet.value(total_row + 1, gw_col))
     if plus1_value is None:
         # No additional rows — use total_row value
         return total_gw, total_gw_precision
 
     # Check +2 row
-    plus2_value = try_float(sheet.cell(row=total_row + 2, column=gw_col).value)
+    plus2_value = try_float(sheet.value(total_row + 2, gw_col))
     if plus2_value is None:
         # Only +1 is numeric (but not +2) — use total_row value
         return total_gw, total_gw_precision
@@ -395,14 +398,14 @@ def _extract_gw_with_packaging_check(
 
 
 def _extract_total_packets(
-    sheet: Worksheet,
+    sheet: SheetSnapshot,
     total_row: int,
     column_map: ColumnMapping,
 ) -> int | None:
     """Extract total_packets using multi-priority search (FR-017).
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         total_row: 1-based total row number.
         column_map: Column index mapping.
 
@@ -410,7 +413,8 @@ def _extract_total_packets(
         Total packets as integer, or None if not found.
     """
     nw_col = column_map.field_map["nw"]
-    max_col = max(nw_col + 2, 11)
+    # Reason: Nothing to find past the data extent.
+    max_col = sheet.data_columns(max(nw_col + 2, 11))
 
     # Priority 1 — 件数/件數 label
     result = _priority1_jian_shu(sheet, total_row, max_col)
@@ -474,11 +478,11 @@ def _parse_int_from_match(text: str) -> int | None:
     return None
 
 
-def _priority1_jian_shu(sheet: Worksheet, total_row: int, max_col: int) -> int | None:
+def _priority1_jian_shu(sheet: SheetSnapshot, total_row: int, max_col: int) -> int | None:
     """Priority 1: Search for 件数/件數 label and extract adjacent value.
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         total_row: 1-based total row number.
         max_col: Maximum column to search.
 
@@ -487,7 +491,7 @@ def _priority1_jian_shu(sheet: Worksheet, total_row: int, max_col: int) -> int |
     """
     for row in range(total_row + 1, total_row + 4):
         for col in range(1, max_col + 1):
-            cell_value = sheet.cell(row=row, column=col).value
+            cell_value = sheet.value(row, col)
             if cell_value is None:
                 continue
             cell_str = str(cell_value)
@@ -502,7 +506,7 @@ def _priority1_jian_shu(sheet: Worksheet, total_row: int, max_col: int) -> int |
                 adj_col = col + adj_offset
                 if adj_col > max_col:
                     break
-                adj_value = sheet.cell(row=row, column=adj_col).value
+                adj_value = sheet.value(row, adj_col)
                 if adj_value is not None:
                     parsed = _parse_int_from_match(str(adj_value))
                     result = _validate_packets(parsed)
@@ -519,11 +523,11 @@ def _priority1_jian_shu(sheet: Worksheet, total_row: int, max_col: int) -> int |
     return None
 
 
-def _priority2_plt_g(sheet: Worksheet, total_row: int, max_col: int) -> int | None:
+def _priority2_plt_g(sheet: SheetSnapshot, total_row: int, max_col: int) -> int | None:
     """Priority 2: Search for PLT.G indicator above total row.
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         total_row: 1-based total row number.
         max_col: Maximum column to search.
 
@@ -534,7 +538,7 @@ def _priority2_plt_g(sheet: Worksheet, total_row: int, max_col: int) -> int | No
         if row < 1:
             continue
         for col in range(1, max_col + 1):
-            cell_value = sheet.cell(row=row, column=col).value
+            cell_value = sheet.value(row, col)
             if cell_value is None:
                 continue
             cell_str = str(cell_value).strip()
@@ -551,7 +555,7 @@ def _priority2_plt_g(sheet: Worksheet, total_row: int, max_col: int) -> int | No
             if _PLT_NUMBER_AFTER_RE.search(cell_str) and not _PLT_NUMBER_BEFORE_RE.search(cell_str):
                 # Check cell immediately to the right
                 if col + 1 <= max_col:
-                    right_value = sheet.cell(row=row, column=col + 1).value
+                    right_value = sheet.value(row, col + 1)
                     if right_value is not None:
                         parsed = _parse_int_from_match(str(right_value))
                         result = _validate_packets(parsed)
@@ -561,7 +565,7 @@ def _priority2_plt_g(sheet: Worksheet, total_row: int, max_col: int) -> int | No
     return None
 
 
-def _priority3_below_total(sheet: Worksheet, total_row: int, max_col: int) -> int | None:
+def _priority3_below_total(sheet: SheetSnapshot, total_row: int, max_col: int) -> int | None:
     """Priority 3: Search below-total rows for various patterns.
 
     Patterns searched in order per row:
@@ -571,7 +575,7 @@ def _priority3_below_total(sheet: Worksheet, total_row: int, max_col: int) -> in
     (d) Pallet range: "PLT#1(1~34)" -> 34
 
     Args:
-        sheet: Packing worksheet.
+        sheet: Packing sheet snapshot.
         total_row: 1-based total row number.
         max_col: Maximum column to search.
 
@@ -580,7 +584,7 @@ def _priority3_below_total(sheet: Worksheet, total_row: int, max_col: int) -> in
     """
     for row in range(total_row + 1, total_row + 4):
         for col in range(1, max_col + 1):
-            cell_value = sheet.cell(row=row, column=col).value
+            cell_value = sheet.value(row, col)
             if cell_value is None:
                 continue
             cell_str = str(cell_value).strip()
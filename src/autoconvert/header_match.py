@@ -0,0 +1,141 @@
+"""header_match — Precompiled header-to-field matcher used by column_map.
+
+``FieldPattern`` keeps raw pattern strings (so the config stays readable and
+hashable for the manifest).  ``HeaderMatcher`` compiles them once into a single
+combined regex with one named group per field, so one ``match()`` call reports
+every field whose patterns hit a header cell.  Results are memoized by the
+normalized header text, so headers that recur across supplier files resolve
+with a dict lookup.
+"""
+
+import logging
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import FieldPattern
+
+logger = logging.getLogger(__name__)
+
+# Reason: Bound the memo so a pathological workbook (e.g. thousands of
+# distinct sub-header strings) cannot grow it without limit.
+_MAX_MEMO_ENTRIES = 4096
+
+# Backreferences are numbered/named per pattern; inside the combined regex the
+# numbering shifts, so such patterns force the per-field fallback.
+_BACKREFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class HeaderMatcher:
+    """Match normalized header text against every configured field at once.
+
+    The combined regex is ``\\A`` followed by one optional lookahead per field,
+    ``(?:(?=[\\s\\S]*?(?P<f0>p1|p2)))?``.  Each lookahead behaves exactly like
+    ``re.search`` of the field's alternation, and because all lookaheads are
+    anchored at position 0 a single match records every field that hits.
+
+    If the patterns cannot be combined (a pattern with inline global flags,
+    backreferences, or duplicate group names), matching falls back to the
+    per-field compiled patterns with identical results.
+
+    Args:
+        columns: Mapping of field name to FieldPattern, in config order.
+    """
+
+    def __init__(self, columns: "dict[str, FieldPattern]") -> None:
+        self._fields: tuple[str, ...] = tuple(columns)
+        self._compiled: dict[str, tuple[tuple[str, re.Pattern[str]], ...]] = {
+            name: tuple((p, re.compile(p, re.IGNORECASE)) for p in fp.patterns) for name, fp in columns.items()
+        }
+        self._combined, self._groups = _build_combined(self._fields, columns)
+        self._memo: dict[str, tuple[str, ...]] = {}
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names in config order."""
+        return self._fields
+
+    def match(self, text: str) -> tuple[str, ...]:
+        """Return every field whose patterns match the header text, in config order.
+
+        Args:
+            text: Header text, already passed through ``normalize_header``.
+
+        Returns:
+            Tuple of matching field names (empty if none match).
+        """
+        hit = self._memo.get(text)
+        if hit is not None:
+            return hit
+
+        if self._combined is not None:
+            m = self._combined.match(text)
+            groups = m.groupdict() if m is not None else {}
+            hit = tuple(field for field, group in self._groups if groups.get(group) is not None)
+        else:
+            hit = tuple(field for field in self._fields if any(rx.search(text) for _, rx in self._compiled[field]))
+
+        if len(self._memo) >= _MAX_MEMO_ENTRIES:
+            self._memo.clear()
+        self._memo[text] = hit
+        return hit
+
+    def matching_pattern(self, field: str, text: str) -> str | None:
+        """Return the first configured pattern of a field that matches the text.
+
+        Used for debug logging only; matching itself goes through ``match()``.
+
+        Args:
+            field: Field name.
+            text: Normalized header text.
+
+        Returns:
+            The raw pattern string, or None if no pattern of the field matches.
+        """
+        for pattern_str, rx in self._compiled.get(field, ()):
+            if rx.search(text):
+                return pattern_str
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _build_combined(
+    fields: tuple[str, ...],
+    columns: "dict[str, FieldPattern]",
+) -> tuple[re.Pattern[str] | None, tuple[tuple[str, str], ...]]:
+    """Compile all field patterns into one regex of optional named lookaheads.
+
+    Args:
+        fields: Field names in config order.
+        columns: Mapping of field name to FieldPattern.
+
+    Returns:
+        Tuple of (combined regex or None if the patterns cannot be combined,
+        ((field, group_name), ...) for fields that have at least one pattern).
+    """
+    parts: list[str] = []
+    groups: list[tuple[str, str]] = []
+    for idx, field in enumerate(fields):
+        patterns = columns[field].patterns
+        # Reason: A field without patterns never matches; an empty alternation
+        # would match everything.
+        if not patterns:
+            continue
+        if any(_BACKREFERENCE_RE.search(p) for p in patterns):
+            logger.debug("Header patterns for %r use backreferences; using per-field matching", field)
+            return None, ()
+        group = f"f{idx}"
+        alternation = "|".join(f"(?:{p})" for p in patterns)
+        parts.append(f"(?:(?=[\\s\\S]*?(?P<{group}>{alternation})))?")
+        groups.append((field, group))
+
+    try:
+        combined = re.compile(r"\A" + "".join(parts), re.IGNORECASE)
+    except re.error as exc:
+        logger.debug("Header patterns cannot be combined (%s); using per-field matching", exc)
+        return None, ()
+    return combined, tuple(groups)
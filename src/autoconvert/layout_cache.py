@@ -0,0 +1,193 @@
+"""layout_cache — Persistent cache of supplier header layouts.
+
+Most files come from a small set of supplier templates.  For each converted
+file the cache records where the invoice and packing header rows are, the
+header-derived column mappings, and the header cell the invoice number was
+read from, keyed by a fingerprint of the sheet names plus the normalized
+text of those header rows.
+
+A lookup checks the stored layouts for the same pair of sheet names and
+re-reads only their header rows; if the fingerprint still matches, header
+detection and the header scans of column mapping are skipped.  Anything
+else is a miss and the file goes through full detection.  The cache is
+discarded when the configuration digest changes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from .models import ColumnMapping, FileLayout
+from .sheet_snapshot import SheetSnapshot
+from .utils import normalize_header
+
+logger = logging.getLogger(__name__)
+
+_LAYOUT_CACHE_VERSION = 1
+
+# Reason: Same column bound as column_map's header scan; cells beyond it
+# cannot influence the mapping.
+_HEADER_SCAN_COLS = 50
+
+# Layouts kept per (invoice sheet, packing sheet) name pair, most recent first.
+_MAX_LAYOUTS_PER_SHEETS = 8
+
+
+def layout_fingerprint(
+    inv_sheet: SheetSnapshot,
+    pack_sheet: SheetSnapshot,
+    inv_mapping: ColumnMapping,
+    pack_mapping: ColumnMapping,
+) -> str:
+    """Return the fingerprint of two sheets at the header rows of the given mappings.
+
+    Args:
+        inv_sheet: Invoice sheet snapshot.
+        pack_sheet: Packing sheet snapshot.
+        inv_mapping: Invoice mapping whose header_row/effective_header_row are read.
+        pack_mapping: Packing mapping whose header_row/effective_header_row are read.
+
+    Returns:
+        Hex digest string.
+    """
+    payload: list[object] = [inv_sheet.title, pack_sheet.title]
+    for sheet, mapping in ((inv_sheet, inv_mapping), (pack_sheet, pack_mapping)):
+        for row in sorted({mapping.header_row, mapping.effective_header_row}):
+            payload.append([row, _header_text(sheet, row)])
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def build_layout(
+    inv_sheet: SheetSnapshot,
+    pack_sheet: SheetSnapshot,
+    inv_mapping: ColumnMapping,
+    pack_mapping: ColumnMapping,
+    inv_no_cell: tuple[int, int] | None,
+) -> FileLayout:
+    """Build the cache record for a freshly mapped file.
+
+    Args:
+        inv_sheet: Invoice sheet snapshot.
+        pack_sheet: Packing sheet snapshot.
+        inv_mapping: Header-derived invoice mapping (map_header_fields()).
+        pack_mapping: Header-derived packing mapping (map_header_fields()).
+        inv_no_cell: (row, column) the header invoice number came from, or None.
+
+    Returns:
+        FileLayout ready for LayoutCache.record().
+    """
+    return FileLayout(
+        fingerprint=layout_fingerprint(inv_sheet, pack_sheet, inv_mapping, pack_mapping),
+        invoice_sheet=inv_sheet.title,
+        packing_sheet=pack_sheet.title,
+        invoice=inv_mapping,
+        packing=pack_mapping,
+        inv_no_cell=inv_no_cell,
+    )
+
+
+class LayoutCache:
+    """Persistent list of FileLayouts, bucketed by sheet names and stored as JSON.
+
+    Instances are read-only inside pool workers; only the parent process
+    records results and saves.
+    """
+
+    def __init__(self, path: Path, cfg_digest: str) -> None:
+        """Load the cache from path (an unreadable, missing or stale file yields an empty cache).
+
+        Args:
+            path: Cache JSON file location.
+            cfg_digest: Current manifest.config_digest(); layouts recorded
+                under a different configuration are dropped.
+        """
+        self._path = path
+        self._cfg_digest = cfg_digest
+        self._layouts: dict[tuple[str, str], list[FileLayout]] = {}
+
+        if not path.exists():
+            return
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("version") != _LAYOUT_CACHE_VERSION or raw.get("config_digest") != cfg_digest:
+                logger.info("Configuration or cache version changed; layout cache starts empty")
+                return
+            for entry in raw["layouts"]:
+                layout = FileLayout.model_validate(entry)
+                self._layouts.setdefault((layout.invoice_sheet, layout.packing_sheet), []).append(layout)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            # Reason: A damaged cache only costs full header detection; it
+            # must never abort the batch.
+            logger.warning("Ignoring unreadable layout cache %s (%s)", path, exc)
+            self._layouts = {}
+
+    def __len__(self) -> int:
+        """Return the number of stored layouts."""
+        return sum(len(bucket) for bucket in self._layouts.values())
+
+    def lookup(self, inv_sheet: SheetSnapshot, pack_sheet: SheetSnapshot) -> FileLayout | None:
+        """Return the stored layout whose header rows still match these sheets.
+
+        Args:
+            inv_sheet: Invoice sheet snapshot.
+            pack_sheet: Packing sheet snapshot.
+
+        Returns:
+            The matching FileLayout, or None on a miss.
+        """
+        for layout in self._layouts.get((inv_sheet.title, pack_sheet.title), ()):
+            if layout_fingerprint(inv_sheet, pack_sheet, layout.invoice, layout.packing) == layout.fingerprint:
+                logger.debug(
+                    "Layout cache hit: invoice header row %d, packing header row %d",
+                    layout.invoice.header_row,
+                    layout.packing.header_row,
+                )
+                return layout
+        logger.debug("Layout cache miss for sheets %r / %r", inv_sheet.title, pack_sheet.title)
+        return None
+
+    def record(self, layout: FileLayout) -> None:
+        """Store a layout as the most recent one for its sheet names.
+
+        Args:
+            layout: Layout returned in FileResult.layout.
+        """
+        bucket = self._layouts.setdefault((layout.invoice_sheet, layout.packing_sheet), [])
+        bucket[:] = [entry for entry in bucket if entry.fingerprint != layout.fingerprint]
+        bucket.insert(0, layout)
+        del bucket[_MAX_LAYOUTS_PER_SHEETS:]
+
+    def save(self) -> None:
+        """Write the cache atomically (temp file + replace)."""
+        payload = {
+            "version": _LAYOUT_CACHE_VERSION,
+            "config_digest": self._cfg_digest,
+            "layouts": [layout.model_dump() for _, bucket in sorted(self._layouts.items()) for layout in bucket],
+        }
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self._path)
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _header_text(sheet: SheetSnapshot, row: int) -> list[str]:
+    """Return the normalized text of a row's first cells, trailing blanks dropped.
+
+    Args:
+        sheet: Sheet snapshot.
+        row: 1-based row number.
+
+    Returns:
+        List of normalized cell strings ("" for empty cells).
+    """
+    values = sheet.row_values(row)[:_HEADER_SCAN_COLS]
+    texts = ["" if value is None else normalize_header(str(value)) for value in values]
+    while texts and not texts[-1]:
+        texts.pop()
+    return texts
@@ -0,0 +1,201 @@
+"""manifest — Incremental batch mode: content-hash manifest for ``data/finished/``.
+
+The manifest records, per input file, the SHA-256 of its bytes, the digest of
+the configuration it was converted with, the output file it produced, and the
+resulting status (plus warnings, so an unchanged Attention file still reports
+them).  ``batch.run_batch(..., incremental=True)`` uses it to skip
+``process_file`` for unchanged inputs instead of wiping ``data/finished/``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from .errors import ProcessingError, WarningCode
+from .models import AppConfig, FileResult, ManifestEntry
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_VERSION = 1
+_CHUNK_SIZE = 1 << 20
+
+
+def file_digest(filepath: Path) -> str:
+    """Return the hex SHA-256 digest of a file's contents.
+
+    Args:
+        filepath: File to hash.
+
+    Returns:
+        Hex digest string.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_digest(config: AppConfig) -> str:
+    """Return a digest of everything in AppConfig that can change an output.
+
+    Covers sheet/column/inv_no pattern sources, the currency and country
+    lookup tables, and the bytes of the output template.
+
+    Args:
+        config: Application configuration.
+
+    Returns:
+        Hex digest string.
+    """
+    payload = {
+        "invoice_sheet_patterns": [p.pattern for p in config.invoice_sheet_patterns],
+        "packing_sheet_patterns": [p.pattern for p in config.packing_sheet_patterns],
+        "invoice_columns": {name: fp.model_dump() for name, fp in config.invoice_columns.items()},
+        "packing_columns": {name: fp.model_dump() for name, fp in config.packing_columns.items()},
+        "inv_no_patterns": [p.pattern for p in config.inv_no_patterns],
+        "inv_no_label_patterns": [p.pattern for p in config.inv_no_label_patterns],
+        "inv_no_exclude_patterns": [p.pattern for p in config.inv_no_exclude_patterns],
+        "currency_lookup": config.currency_lookup,
+        "country_lookup": config.country_lookup,
+    }
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    if config.template_path.exists():
+        digest.update(file_digest(config.template_path).encode("ascii"))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Persistent map of input filename -> ManifestEntry, stored as JSON.
+
+    The manifest lives next to ``data/finished/`` and only ever references
+    outputs inside that directory.
+    """
+
+    def __init__(self, path: Path, finished_dir: Path) -> None:
+        """Load the manifest from path (an unreadable or missing file yields an empty manifest).
+
+        Args:
+            path: Manifest JSON file location.
+            finished_dir: Directory holding the output files it references.
+        """
+        self._path = path
+        self._finished_dir = finished_dir
+        self._entries: dict[str, ManifestEntry] = {}
+
+        if not path.exists():
+            return
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("version") != _MANIFEST_VERSION:
+                logger.info("Manifest version changed; reprocessing all files")
+                return
+            self._entries = {name: ManifestEntry.model_validate(entry) for name, entry in raw["files"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+            # Reason: A damaged manifest only costs a full reconversion; it
+            # must never abort the batch.
+            logger.warning("Ignoring unreadable manifest %s (%s)", path, exc)
+            self._entries = {}
+
+    def needs_processing(self, filename: str, content_hash: str, cfg_digest: str) -> bool:
+        """Return True unless the file is unchanged, converted with the same config, and not failed.
+
+        Args:
+            filename: Input file name.
+            content_hash: Current SHA-256 of the input file.
+            cfg_digest: Current config_digest().
+
+        Returns:
+            True when process_file must run for this input.
+        """
+        entry = self._entries.get(filename)
+        if entry is None or entry.status == "Failed":
+            return True
+        if entry.content_hash != content_hash or entry.config_digest != cfg_digest:
+            return True
+        # Reason: An output deleted by hand must be regenerated.
+        return entry.output is None or not (self._finished_dir / entry.output).exists()
+
+    def cached_result(self, filename: str) -> FileResult:
+        """Rebuild a FileResult for an unchanged input from its manifest entry.
+
+        Extracted items are not stored, so the lists are empty; status and
+        warnings match the run that produced the output.
+
+        Args:
+            filename: Input file name (must be present in the manifest).
+
+        Returns:
+            FileResult carrying the recorded status and warnings.
+        """
+        entry = self._entries[filename]
+        warnings = [
+            ProcessingError(code=WarningCode(code), message=message, context={"filename": filename})
+            for code, message in entry.warnings
+        ]
+        return FileResult(
+            filename=filename,
+            status=entry.status,
+            errors=[],
+            warnings=warnings,
+            invoice_items=[],
+            packing_items=[],
+            packing_totals=None,
+        )
+
+    def discard_output(self, filename: str) -> None:
+        """Delete the previous output of an input that is about to be reprocessed.
+
+        Args:
+            filename: Input file name.
+        """
+        entry = self._entries.get(filename)
+        if entry is not None and entry.output is not None:
+            (self._finished_dir / entry.output).unlink(missing_ok=True)
+
+    def record(self, filename: str, content_hash: str, cfg_digest: str, result: FileResult, output: str) -> None:
+        """Store the outcome of processing one input.
+
+        Args:
+            filename: Input file name.
+            content_hash: SHA-256 of the input that was processed.
+            cfg_digest: config_digest() used for the run.
+            result: FileResult returned by process_file().
+            output: Output file name inside finished_dir (ignored when Failed).
+        """
+        has_output = result.status != "Failed" and (self._finished_dir / output).exists()
+        self._entries[filename] = ManifestEntry(
+            content_hash=content_hash,
+            config_digest=cfg_digest,
+            output=output if has_output else None,
+            status=result.status,
+            warnings=[(w.code.value, w.message) for w in result.warnings],
+        )
+
+    def prune(self, current_files: set[str]) -> list[str]:
+        """Drop entries (and their outputs) whose source file no longer exists.
+
+        Args:
+            current_files: Names of the input files found by the current scan.
+
+        Returns:
+            Names of the pruned input files.
+        """
+        pruned = sorted(name for name in self._entries if name not in current_files)
+        for name in pruned:
+            self.discard_output(name)
+            del self._entries[name]
+            logger.info("Pruned output of removed source file: %s", name)
+        return pruned
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + replace)."""
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "files": {name: entry.model_dump() for name, entry in sorted(self._entries.items())},
+        }
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self._path)
@@ -3,18 +3,31 @@
 Captures merged cell ranges before unmerging, provides value propagation for
 string and weight fields per FR-010.  One ``MergeTracker`` instance is created
 per sheet, BEFORE any extraction begins.
+
+The tracker accepts either an openpyxl ``Worksheet`` or a ``SheetSnapshot``.
+A snapshot already presents non-anchor cells as empty and is never mutated.
+A Worksheet is unmerged in place by default; with ``unmerge=False`` the
+tracker only records the ranges and reads the still-merged sheet, whose
+non-anchor cells openpyxl already reports as ``None``.
 """
 
 import logging
+from bisect import bisect_right
+from collections.abc import Callable, Collection
 from decimal import Decimal
 from typing import Any
 
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .models import MergeRange
+from .sheet_snapshot import SheetSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Ranges wider than this many columns are kept out of the per-column index
+# (one entry per covered column) and scanned linearly instead.
+_MAX_INDEXED_WIDTH = 64
+
 
 class MergeTracker:
     """Captures merged cell ranges before unmerging, provides value propagation
@@ -22,60 +35,76 @@ class MergeTracker:
 
     The constructor performs two actions in strict order:
     1. Capture every merged range (bounds + anchor value) into an internal list.
-    2. Unmerge all cells in the sheet so downstream code sees flat cells.
+    2. Unmerge all cells in the sheet so downstream code sees flat cells
+       (Worksheet input with ``unmerge=True`` only; otherwise reads go
+       through a flat view and the sheet is not modified).
 
     Public query methods then use the captured data to answer merge-related
     questions without touching the (now unmerged) sheet's merge metadata.
+    Lookups go through a per-column index of row intervals (binary search)
+    and an anchor dict, so they stay O(log n) on sheets with thousands of
+    merges.
     """
 
-    def __init__(self, sheet: Worksheet) -> None:
+    def __init__(
+        self,
+        sheet: Worksheet | SheetSnapshot,
+        *,
+        unmerge: bool = True,
+        columns: Collection[int] | None = None,
+    ) -> None:
         """Capture all merge ranges (with anchor values), then unmerge all
         cells in the sheet.
 
         Args:
-            sheet: The openpyxl Worksheet to process.  The sheet is mutated
-                in-place: all merged regions are removed.
+            sheet: The openpyxl Worksheet to process, or a SheetSnapshot of
+                it.  A snapshot is only read.
+            unmerge: For a Worksheet, remove all merged regions in place
+                (default).  When False the Worksheet is left untouched and
+                only read.
+            columns: If given, only ranges intersecting one of these 1-based
+                columns (e.g. the mapped columns of a ``ColumnMapping``) are
+                captured; the rest are skipped.  Queries must then be limited
+                to those columns.
         """
         self._sheet = sheet
         self._ranges: list[MergeRange] = []
-
-        # Reason: Must snapshot merged_cells.ranges into a plain list BEFORE
-        # calling unmerge_cells, because unmerge mutates the underlying set
-        # and iterating while mutating raises RuntimeError / skips entries.
-        raw_ranges = list(sheet.merged_cells.ranges)  # type: ignore[attr-defined]
+        wanted = None if columns is None else sorted(set(columns))
+        raw_ranges: list[Any] = []
+
+        if isinstance(sheet, SheetSnapshot):
+            self._value = sheet.value
+            bounds = list(sheet.merged_ranges)
+        else:
+            self._value = _worksheet_reader(sheet)
+            # Reason: Must snapshot merged_cells.ranges into a plain list BEFORE
+            # calling unmerge_cells, because unmerge mutates the underlying set
+            # and iterating while mutating raises RuntimeError / skips entries.
+            raw_ranges = list(sheet.merged_cells.ranges)  # type: ignore[attr-defined]
+            bounds = [(cr.min_row, cr.min_col, cr.max_row, cr.max_col) for cr in raw_ranges]
 
         # Phase 1 — capture
-        for cell_range in raw_ranges:
-            min_row: int = cell_range.min_row
-            max_row: int = cell_range.max_row
-            min_col: int = cell_range.min_col
-            max_col: int = cell_range.max_col
-            anchor_value: Any = sheet.cell(row=min_row, column=min_col).value
-
-            mr = MergeRange(
-                min_row=min_row,
-                max_row=max_row,
-                min_col=min_col,
-                max_col=max_col,
-                value=anchor_value,
-            )
-            self._ranges.append(mr)
-            logger.debug(
-                "Captured merge range: rows %d-%d, cols %d-%d, anchor=%r",
-                min_row,
-                max_row,
-                min_col,
-                max_col,
-                anchor_value,
-            )
+        skipped = 0
+        for min_row, min_col, max_row, max_col in bounds:
+            if wanted is not None and not _intersects(min_col, max_col, wanted):
+                skipped += 1
+                continue
+            self._capture(min_row, min_col, max_row, max_col, self._value(min_row, min_col))
 
         # Phase 2 — unmerge (using the snapshot so we don't modify while iterating)
-        for cell_range in raw_ranges:
-            sheet.unmerge_cells(str(cell_range))
-
+        # Reason: Only real worksheets can be unmerged; a snapshot is immutable.
+        unmerged = False
+        if isinstance(sheet, Worksheet) and unmerge:
+            for cell_range in raw_ranges:
+                sheet.unmerge_cells(str(cell_range))
+            unmerged = True
+
+        self._build_index()
         logger.debug(
-            "MergeTracker initialised: %d range(s) captured and unmerged.",
+            "MergeTracker initialised: %d range(s) captured (%d skipped), %s.",
             len(self._ranges),
+            skipped,
+            "sheet unmerged" if unmerged else "sheet not modified",
         )
 
     # ------------------------------------------------------------------
@@ -93,10 +122,7 @@ class MergeTracker:
             True when the cell is the anchor (min_row, min_col) of a captured
             merge range.
         """
-        for mr in self._ranges:
-            if mr.min_row == row and mr.min_col == col:
-                return True
-        return False
+        return (row, col) in self._anchors
 
     def is_in_merge(self, row: int, col: int) -> bool:
         """Return True if (row, col) falls within any merge range (anchor or
@@ -179,7 +205,7 @@ class MergeTracker:
             # that non-anchor cells (which are None after unmerge) receive the
             # correct string content.
             return self.get_anchor_value(row, col)
-        return self._sheet.cell(row=row, column=col).value
+        return self._value(row, col)
 
     def get_weight_value(self, row: int, col: int, header_row: int) -> Any:
         """For data-area merges: anchor row returns captured numeric value;
@@ -201,7 +227,7 @@ class MergeTracker:
         if mr is None:
             # Reason: Cell is not part of any merge — return raw sheet value
             # and let the caller decide how to parse it.
-            return self._sheet.cell(row=row, column=col).value
+            return self._value(row, col)
 
         # Cell is inside a merge range.
         if mr.min_row <= header_row:
@@ -214,10 +240,108 @@ class MergeTracker:
             return mr.value
         return Decimal("0.0")
 
+    def ranges_in_column(self, col: int) -> list[MergeRange]:
+        """Return every captured range covering column ``col``, in capture order.
+
+        Args:
+            col: 1-based column index.
+
+        Returns:
+            List of ``MergeRange`` objects whose column span includes ``col``.
+        """
+        if not self._indexed:
+            return [mr for mr in self._ranges if mr.min_col <= col <= mr.max_col]
+        positions = [pos for _, pos in self._by_col.get(col, ())]
+        positions.extend(pos for pos in self._wide if self._ranges[pos].min_col <= col <= self._ranges[pos].max_col)
+        return [self._ranges[pos] for pos in sorted(positions)]
+
+    def get_string_values(self, col: int, first_row: int, last_row: int, header_row: int) -> list[Any]:
+        """Return the propagated string values of a column over a row span.
+
+        Equivalent to calling ``get_string_value`` for every row, except that
+        a data-area merge contributes its anchor value once for all the rows
+        it covers.  Intended for set-style checks such as ERR_046.
+
+        Args:
+            col: 1-based column index.
+            first_row: First 1-based row (inclusive).
+            last_row: Last 1-based row (inclusive).
+            header_row: 1-based header row number.
+
+        Returns:
+            Values in row order, one per unmerged row or merged run.
+        """
+        values: list[Any] = []
+        row = first_row
+        while row <= last_row:
+            mr = self._find_range(row, col)
+            if mr is not None and mr.min_row > header_row:
+                values.append(mr.value)
+                row = mr.max_row + 1
+                continue
+            values.append(self._value(row, col))
+            row += 1
+        return values
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _build_index(self) -> None:
+        """Index captured ranges by anchor and by column.
+
+        Each column maps to ``(min_row, position)`` entries sorted by
+        ``min_row``, where position refers to ``self._ranges``.  Ranges wider
+        than ``_MAX_INDEXED_WIDTH`` columns (header banners) are kept in a
+        short list and checked linearly.  If two ranges overlap in a column
+        (never the case for merges loaded from a valid workbook), lookups
+        fall back to the linear scan so first-match order is preserved.
+        """
+        self._anchors: dict[tuple[int, int], MergeRange] = {}
+        self._by_col: dict[int, list[tuple[int, int]]] = {}
+        self._row_starts: dict[int, list[int]] = {}
+        self._wide: list[int] = []
+        self._indexed = True
+
+        for pos, mr in enumerate(self._ranges):
+            self._anchors.setdefault((mr.min_row, mr.min_col), mr)
+            if mr.max_col - mr.min_col + 1 > _MAX_INDEXED_WIDTH:
+                self._wide.append(pos)
+                continue
+            for col in range(mr.min_col, mr.max_col + 1):
+                self._by_col.setdefault(col, []).append((mr.min_row, pos))
+
+        for col, entries in self._by_col.items():
+            entries.sort()
+            previous_end = 0
+            for min_row, pos in entries:
+                if min_row <= previous_end:
+                    self._indexed = False
+                previous_end = max(previous_end, self._ranges[pos].max_row)
+            self._row_starts[col] = [min_row for min_row, _ in entries]
+
+    def _capture(self, min_row: int, min_col: int, max_row: int, max_col: int, anchor_value: Any) -> None:
+        """Record one merge range with its anchor value.
+
+        Args:
+            min_row: First row of the range (1-based).
+            min_col: First column of the range (1-based).
+            max_row: Last row of the range (1-based).
+            max_col: Last column of the range (1-based).
+            anchor_value: Value of the top-left anchor cell.
+        """
+        self._ranges.append(
+            MergeRange(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, value=anchor_value)
+        )
+        logger.debug(
+            "Captured merge range: rows %d-%d, cols %d-%d, anchor=%r",
+            min_row,
+            max_row,
+            min_col,
+            max_col,
+            anchor_value,
+        )
+
     def _find_range(self, row: int, col: int) -> MergeRange | None:
         """Return the first MergeRange that contains ``(row, col)``.
 
@@ -228,7 +352,57 @@ class MergeTracker:
         Returns:
             The matching ``MergeRange``, or ``None``.
         """
-        for mr in self._ranges:
+        if not self._indexed:
+            for mr in self._ranges:
+                if mr.min_row <= row <= mr.max_row and mr.min_col <= col <= mr.max_col:
+                    return mr
+            return None
+
+        found = len(self._ranges)
+        starts = self._row_starts.get(col)
+        if starts:
+            i = bisect_right(starts, row) - 1
+            if i >= 0:
+                pos = self._by_col[col][i][1]
+                if row <= self._ranges[pos].max_row:
+                    found = pos
+        # Reason: A wide range listed before the indexed hit would have been
+        # the first match of a linear scan.
+        for pos in self._wide:
+            if pos >= found:
+                break
+            mr = self._ranges[pos]
             if mr.min_row <= row <= mr.max_row and mr.min_col <= col <= mr.max_col:
                 return mr
-        return None
+        return self._ranges[found] if found < len(self._ranges) else None
+
+
+def _intersects(min_col: int, max_col: int, columns: list[int]) -> bool:
+    """Return True if the column span [min_col, max_col] contains any of ``columns``.
+
+    Args:
+        min_col: First column of the span.
+        max_col: Last column of the span.
+        columns: Sorted 1-based column indexes.
+
+    Returns:
+        True when at least one column falls inside the span.
+    """
+    i = bisect_right(columns, max_col) - 1
+    return i >= 0 and columns[i] >= min_col
+
+
+def _worksheet_reader(sheet: Worksheet) -> Callable[[int, int], Any]:
+    """Return a (row, col) -> value reader over a live openpyxl Worksheet.
+
+    Args:
+        sheet: The worksheet to read.
+
+    Returns:
+        Reader function with the same signature as ``SheetSnapshot.value``.
+    """
+
+    def read(row: int, col: int) -> Any:
+        return sheet.cell(row=row, column=col).value
+
+    return read
@@ -1,6 +1,16 @@
-"""models — Pydantic data models for all entities (InvoiceItem, PackingItem, etc.)."""
+"""models — Pydantic data models for all entities (InvoiceItem, PackingItem, etc.).
+
+The per-file pipeline (extraction -> transformation -> allocation -> output)
+builds one object per invoice/packing row and one per merged range.  Those
+use the ``__slots__`` dataclasses ``InvoiceRecord``, ``PackingRecord`` and
+``MergeRange`` (no validation, no per-instance ``__dict__``);
+``InvoiceRecord`` / ``PackingRecord`` carry the same fields as
+``InvoiceItem`` / ``PackingItem`` and are converted with ``to_model()`` where
+``batch.process_file`` builds the ``FileResult``.
+"""
 
 import re
+from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
@@ -8,6 +18,7 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict
 
 from .errors import ProcessingError
+from .header_match import HeaderMatcher
 
 
 class InvoiceItem(BaseModel):
@@ -70,6 +81,54 @@ class PackingItem(BaseModel):
     is_first_row_of_merge: bool
 
 
+@dataclass(slots=True)
+class InvoiceRecord:
+    """Pipeline-internal invoice line with the fields of ``InvoiceItem``.
+
+    Built by extract_invoice.py; transform.py and weight_alloc.py update it in
+    place.  Values are not validated: extraction already produces the types
+    ``InvoiceItem`` declares.  ``row`` (the 1-based sheet row, 0 when unknown)
+    is only used for warnings and is not carried into ``InvoiceItem``.
+    """
+
+    part_no: str
+    po_no: str
+    qty: Decimal
+    price: Decimal
+    amount: Decimal
+    currency: str
+    coo: str
+    cod: str
+    brand: str
+    brand_type: str
+    model_no: str
+    inv_no: str
+    serial: str
+    allocated_weight: Decimal | None = None
+    row: int = 0
+
+    def to_model(self) -> InvoiceItem:
+        """Return the validated ``InvoiceItem`` with the same field values."""
+        return InvoiceItem.model_validate(self, from_attributes=True)
+
+
+@dataclass(slots=True)
+class PackingRecord:
+    """Pipeline-internal packing line with the fields of ``PackingItem``.
+
+    Built by extract_packing.py.
+    """
+
+    part_no: str
+    qty: Decimal
+    nw: Decimal
+    is_first_row_of_merge: bool
+
+    def to_model(self) -> PackingItem:
+        """Return the validated ``PackingItem`` with the same field values."""
+        return PackingItem.model_validate(self, from_attributes=True)
+
+
 class PackingTotals(BaseModel):
     """Totals extracted from the packing sheet totals row (FR-015/FR-016/FR-017).
 
@@ -108,9 +167,13 @@ class ColumnMapping(BaseModel):
     effective_header_row: int
 
 
-class MergeRange(BaseModel):
+@dataclass(slots=True)
+class MergeRange:
     """Represents a merged cell range captured before unmerging (FR-010).
 
+    A ``__slots__`` dataclass rather than a pydantic model: MergeTracker
+    builds one per merged range and it never leaves the pipeline.
+
     All indices are 1-based (openpyxl convention).
     ``value`` is the anchor cell's value at time of capture; may be None, str,
     int, float, or datetime.
@@ -123,8 +186,6 @@ class MergeRange(BaseModel):
         value: The anchor cell's value (Any type — not constrained).
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     min_row: int
     max_row: int
     min_col: int
@@ -163,6 +224,14 @@ class AppConfig(BaseModel):
         currency_lookup: Maps normalized currency keys (uppercase) to output codes.
         country_lookup: Maps normalized country keys (uppercase) to output codes.
         template_path: Path to the Excel output template file.
+        invoice_header_matcher: Precompiled matcher over ``invoice_columns``.
+            Built by ``load_config``; None means column_map builds it on first use.
+        packing_header_matcher: Precompiled matcher over ``packing_columns``.
+        reader: .xlsx reader backend, ``"openpyxl"`` (default) or ``"fast"``
+            (xlsx_reader); set from ``--reader``, not from the YAML files.
+        sheet_cache_dir: Directory of the parsed-sheet cache (sheet_cache.py),
+            or None to always parse; set from ``--sheet-cache``.
+        sheet_cache_max_bytes: Size cap of the parsed-sheet cache.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -177,6 +246,33 @@ class AppConfig(BaseModel):
     currency_lookup: dict[str, str]
     country_lookup: dict[str, str]
     template_path: Path
+    invoice_header_matcher: HeaderMatcher | None = None
+    packing_header_matcher: HeaderMatcher | None = None
+    reader: str = "openpyxl"
+    sheet_cache_dir: Path | None = None
+    sheet_cache_max_bytes: int = 256 * 1024 * 1024
+
+
+class FileLayout(BaseModel):
+    """Header layout of one supplier format, stored by the layout cache (see layout_cache.py).
+
+    Fields:
+        fingerprint: Digest of the sheet names and the normalized text of the
+            header rows recorded below.
+        invoice_sheet: Invoice sheet title.
+        packing_sheet: Packing sheet title.
+        invoice: Header-derived invoice ColumnMapping (before data-row fallbacks).
+        packing: Header-derived packing ColumnMapping.
+        inv_no_cell: (row, column) of the header cell the invoice number was
+            read from; None when it comes from a column or was not found.
+    """
+
+    fingerprint: str
+    invoice_sheet: str
+    packing_sheet: str
+    invoice: ColumnMapping
+    packing: ColumnMapping
+    inv_no_cell: tuple[int, int] | None = None
 
 
 class FileResult(BaseModel):
@@ -193,6 +289,10 @@ class FileResult(BaseModel):
         invoice_items: Extracted invoice line items.
         packing_items: Extracted packing line items.
         packing_totals: Extracted packing totals; None if extraction failed.
+        layout: Header layout the file was mapped with; only set when the
+            layout cache is enabled and both sheets were mapped.
+        layout_cache_hit: True if the layout came from the layout cache,
+            False on a cache miss, None if the cache was not consulted.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -204,6 +304,8 @@ class FileResult(BaseModel):
     invoice_items: list[InvoiceItem]
     packing_items: list[PackingItem]
     packing_totals: PackingTotals | None = None
+    layout: FileLayout | None = None
+    layout_cache_hit: bool | None = None
 
 
 class BatchResult(BaseModel):
@@ -217,6 +319,8 @@ class BatchResult(BaseModel):
         processing_time: Total processing time in seconds.
         file_results: Per-file results in processing order.
         log_path: Absolute path string of the generated log file.
+        layout_cache_lookups: Files whose layout was looked up in the layout cache.
+        layout_cache_hits: Lookups answered by the layout cache.
     """
 
     total_files: int
@@ -226,3 +330,24 @@ class BatchResult(BaseModel):
     processing_time: float
     file_results: list[FileResult]
     log_path: str
+    layout_cache_lookups: int = 0
+    layout_cache_hits: int = 0
+
+
+class ManifestEntry(BaseModel):
+    """Incremental-mode record of one converted input file (see manifest.py).
+
+    Fields:
+        content_hash: SHA-256 hex digest of the input file's bytes.
+        config_digest: Digest of the AppConfig the file was converted with.
+        output: Output file name inside ``data/finished/``; None when no
+            output was written (Failed status).
+        status: One of ``"Success"``, ``"Attention"``, ``"Failed"``.
+        warnings: (code_value, message) pairs of the recorded ATT_xxx warnings.
+    """
+
+    content_hash: str
+    config_digest: str
+    output: str | None
+    status: str
+    warnings: list[tuple[str, str]]
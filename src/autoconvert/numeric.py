@@ -0,0 +1,188 @@
+"""numeric — Cell-to-Decimal conversion for the per-cell extraction paths.
+
+Every qty, price, amount and NW cell is converted with ``utils.safe_decimal``
+(float -> scale -> ``str()`` -> Decimal -> round -> divide by a fresh
+``Decimal(10**decimals)``) at the precision ``utils.detect_cell_precision``
+finds (a regex over the number format, or an f-string round trip of the
+value).  The functions here return exactly the same results with:
+
+- precomputed powers of ten (int and Decimal),
+- a cache of the precision of each distinct number format string,
+- a fast path for int/float cell values that rounds the scaled float
+  directly instead of going through ``str()``.
+
+Values the fast path cannot decide exactly (strings, negatives, non-finite
+or very large values, exact .5 ties) take the original utils functions.
+"""
+
+import math
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Any
+
+from .sheet_snapshot import SnapshotCell
+from .utils import detect_cell_precision, safe_decimal, strip_unit_suffix
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+SCALE: tuple[int, ...] = tuple(10**d for d in range(16))
+"""Powers of ten 10**0 .. 10**15 (index = number of decimals)."""
+
+DECIMAL_SCALE: tuple[Decimal, ...] = tuple(Decimal(scale) for scale in SCALE)
+"""SCALE as Decimals, the divisors safe_decimal / round_half_up build per call."""
+
+EPSILON = 1e-9
+"""Float safety epsilon, the same as utils.safe_decimal / utils.round_half_up."""
+
+TIE_MARGIN = 1e-12
+"""Products this close (relative) to a .5 tie may round differently from the exact value."""
+
+SHARE_LIMIT = float(2**51)
+"""Scaled float shares (weight_alloc._share_units) below this, away from a tie, round as the Decimal formula does."""
+
+# Scaled floats below this have an exact fractional part.
+_EXACT_LIMIT = float(2**52)
+# Ints below this convert to float exactly (no str() round trip needed).
+_INT_LIMIT = 2**53
+# Decimals of General-format values (f"{value:.5f}" in utils).
+_VALUE_DECIMALS = 5
+_VALUE_SCALE = float(SCALE[_VALUE_DECIMALS])
+_FORMAT_CACHE_SIZE = 1024
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def round_units(value: float, decimals: int) -> int:
+    """Round a float to a whole number of 10**-decimals units.
+
+    Returns exactly ``round_half_up(value, decimals) * 10**decimals`` (same
+    float scaling and epsilon) without the str() -> Decimal round trip.
+
+    Args:
+        value: The value to round, already converted to float.
+        decimals: Number of decimal places (an index into SCALE).
+
+    Returns:
+        The rounded value as an integer count of units.
+    """
+    scaled = value * SCALE[decimals] + EPSILON
+    if 0.0 <= scaled < _EXACT_LIMIT:
+        whole = int(scaled)
+        # Reason: Below 2**52 the fraction is exact, and repr(scaled) (which
+        # round_half_up rounds) is never on the other side of .5 than scaled.
+        return whole + 1 if scaled - whole >= 0.5 else whole
+    return int(Decimal(str(scaled)).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def units_to_decimal(units: int, decimals: int) -> Decimal:
+    """Convert a count of 10**-decimals units to the Decimal safe_decimal returns.
+
+    Args:
+        units: Integer count of units.
+        decimals: Number of decimal places (an index into SCALE).
+
+    Returns:
+        Decimal value, represented as safe_decimal() / round_half_up()
+        represent it (below 2**52 units; equal in value beyond that).
+    """
+    return Decimal(units) / DECIMAL_SCALE[decimals]
+
+
+def cell_decimal(value: Any, decimals: int) -> Decimal:
+    """Convert a raw cell value to Decimal at the given precision.
+
+    Equivalent to ``safe_decimal(strip_unit_suffix(str(value)), decimals)``.
+
+    Args:
+        value: Raw cell value (int, float, str, ...).
+        decimals: Number of decimal places for the result.
+
+    Returns:
+        Decimal value rounded ROUND_HALF_UP to ``decimals`` places.
+
+    Raises:
+        ValueError: If the value cannot be converted to a numeric type.
+    """
+    value_type = type(value)
+    # Reason: Exact type checks keep bool (str() gives "True") on the slow path.
+    if (value_type is float or (value_type is int and -_INT_LIMIT < value < _INT_LIMIT)) and decimals < len(SCALE):
+        scaled = value * SCALE[decimals] + EPSILON
+        if 0.0 <= scaled < _EXACT_LIMIT:
+            whole = int(scaled)
+            return Decimal(whole + 1 if scaled - whole >= 0.5 else whole) / DECIMAL_SCALE[decimals]
+    return safe_decimal(strip_unit_suffix(str(value)), decimals)
+
+
+def cell_precision(value: Any, number_format: str | None) -> int:
+    """Return the decimal places of a cell from its number format and value.
+
+    Equivalent to ``detect_cell_precision`` on a cell with this value and
+    number format; the format part is cached per format string.
+
+    Args:
+        value: Cell value.
+        number_format: Excel number format code (None means General).
+
+    Returns:
+        The number of decimal places.
+    """
+    precision = _format_precision("General" if number_format is None else number_format)
+    if precision is not None:
+        return precision
+    return _value_precision(value, number_format)
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _format_precision(number_format: str) -> int | None:
+    """Return the precision a number format specifies, or None for General/text.
+
+    Args:
+        number_format: Excel number format code.
+
+    Returns:
+        Decimal places of the format, or None when the value decides.
+    """
+    if number_format in ("General", "@"):
+        return None
+    return detect_cell_precision(SnapshotCell(None, number_format))
+
+
+def _value_precision(value: Any, number_format: str | None) -> int:
+    """Return the display precision of a General-format value (see utils._precision_from_value).
+
+    Args:
+        value: Cell value.
+        number_format: The cell's number format, for the slow path.
+
+    Returns:
+        Decimal places (0-5) after rounding the value to 5 decimals.
+    """
+    value_type = type(value)
+    if value_type is int and -_INT_LIMIT < value < _INT_LIMIT:
+        return 0
+    if value_type is float and math.isfinite(value):
+        if value.is_integer():
+            return 0
+        scaled = abs(value) * _VALUE_SCALE
+        whole = int(scaled)
+        fraction = scaled - whole
+        # Reason: f"{value:.5f}" rounds the exact binary value; the float
+        # product can only disagree with it right at a .5 tie.
+        if scaled < _EXACT_LIMIT and abs(fraction - 0.5) > TIE_MARGIN * (scaled + 1.0):
+            digits = (whole + 1 if fraction > 0.5 else whole) % SCALE[_VALUE_DECIMALS]
+            precision = _VALUE_DECIMALS if digits else 0
+            while digits and digits % 10 == 0:
+                digits //= 10
+                precision -= 1
+            return precision
+    return detect_cell_precision(SnapshotCell(value, "General" if number_format is None else number_format))
@@ -1,12 +1,21 @@
 """output — FR-029, FR-030: Template population and output file generation."""
 
 import logging
+import os
+import pickle
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from types import TracebackType
+from typing import Any
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 
 from .errors import ErrorCode, ProcessingError
-from .models import AppConfig, InvoiceItem, PackingTotals
+from .models import AppConfig, InvoiceRecord, PackingTotals
+from .xlsx_writer import SheetTemplate, UnsupportedTemplateError
 
 logger = logging.getLogger(__name__)
 
@@ -49,19 +58,32 @@ _FIXED_T = "142"
 # Template sheet name (Chinese characters are part of the name)
 _SHEET_NAME = "工作表1"
 
+# Per-process template cache: template path -> ((st_mtime_ns, st_size), pickled
+# Workbook).  The pickled bytes are None when the template cannot be pickled,
+# in which case every call parses the file as before.
+_template_cache: dict[Path, tuple[tuple[int, int], bytes | None]] = {}
+
+# Per-process streaming template cache: template path -> ((st_mtime_ns,
+# st_size), SheetTemplate or None when the template cannot be streamed).
+_sheet_template_cache: dict[Path, tuple[tuple[int, int], SheetTemplate | None]] = {}
+
 
 def write_template(
-    invoice_items: list[InvoiceItem],
+    invoice_items: list[InvoiceRecord],
     packing_totals: PackingTotals,
     config: AppConfig,
     output_path: Path,
 ) -> None:
     """Populate 40-column template and write to output_path.
 
-    Loads the template from config.template_path fresh for each call (no
-    caching) to avoid state contamination between files in a batch.  Rows 1–4
-    are preserved as-is from the template.  One data row is written per item in
-    invoice_items, starting at row 5.
+    The template is split once per process (and again only if the file
+    changes) into raw zip parts plus the 工作表1 sheet XML; each output copies
+    the untouched parts byte-for-byte and streams a new sheetData in which
+    written cells keep the template's style ids (e.g. the 0.00000_ formats of
+    columns L/M).  Templates the streaming writer cannot split are populated
+    through a private openpyxl copy instead.  Outputs never share state.
+    Rows 1–4 are preserved as-is from the template.  One data row is written
+    per item in invoice_items, starting at row 5.
 
     Args:
         invoice_items: Fully processed invoice items with allocated_weight populated.
@@ -78,10 +100,11 @@ def write_template(
                          ERR_052 if the output file cannot be written.
     """
     # ------------------------------------------------------------------
-    # Load the template workbook (ERR_051 on failure)
+    # Load the template (ERR_051 on failure)
     # ------------------------------------------------------------------
     try:
-        wb = load_workbook(config.template_path)
+        template = _sheet_template(config.template_path)
+        wb = _load_template(config.template_path) if template is None else None
     except Exception as exc:
         raise ProcessingError(
             code=ErrorCode.ERR_051,
@@ -89,31 +112,46 @@ def write_template(
             context={"template_path": str(config.template_path)},
         ) from exc
 
-    ws = wb[_SHEET_NAME]
-
     # ------------------------------------------------------------------
-    # Write one data row per InvoiceItem (rows 1–4 preserved)
+    # Build one data row per invoice item (rows 1–4 preserved)
     # ------------------------------------------------------------------
-    for item_index, item in enumerate(invoice_items):
-        row = _DATA_START_ROW + item_index
-        _write_item_row(ws, row, item)
+    cells: dict[int, dict[int, Any]] = {
+        _DATA_START_ROW + item_index: _item_cells(item) for item_index, item in enumerate(invoice_items)
+    }
 
     # ------------------------------------------------------------------
     # Row-5-only fields: total_gw (col P) and total_packets (col AK)
     # ------------------------------------------------------------------
     if invoice_items:
         # total_gw is always present on PackingTotals
-        ws.cell(row=_DATA_START_ROW, column=_COL_P).value = packing_totals.total_gw
+        cells[_DATA_START_ROW][_COL_P] = packing_totals.total_gw
 
         # total_packets may be None (ATT_002 case) — write nothing if absent
         if packing_totals.total_packets is not None:
-            ws.cell(row=_DATA_START_ROW, column=_COL_AK).value = packing_totals.total_packets
+            cells[_DATA_START_ROW][_COL_AK] = packing_totals.total_packets
+
+    # Reason: Populate before the save step so invalid cell values raise
+    # exactly as they did when every cell went through openpyxl.
+    sheet_xml: bytes | None = None
+    if template is not None:
+        sheet_xml = template.render_sheet(cells)
+    else:
+        assert wb is not None
+        ws = wb[_SHEET_NAME]
+        for row, row_cells in cells.items():
+            for col, value in row_cells.items():
+                ws.cell(row=row, column=col).value = value
 
     # ------------------------------------------------------------------
     # Save the workbook (ERR_052 on failure)
     # ------------------------------------------------------------------
     try:
-        wb.save(output_path)
+        if template is not None:
+            assert sheet_xml is not None
+            _save_atomically(output_path, partial(template.write, sheet_xml=sheet_xml))
+        else:
+            assert wb is not None
+            _save_atomically(output_path, wb.save)
     except Exception as exc:
         raise ProcessingError(
             code=ErrorCode.ERR_052,
@@ -124,52 +162,235 @@ def write_template(
     logger.info("Output successfully written to: %s", output_path.name)
 
 
-def _write_item_row(ws, row: int, item: InvoiceItem) -> None:  # type: ignore[no-untyped-def]
-    """Write a single invoice item into the given worksheet row.
+class OutputWriterPool:
+    """Bounded background thread pool for write_template() calls.
+
+    ``submit()`` hands one output to a writer thread and returns at once, so
+    the caller can start on the next file while the previous output is
+    rendered, compressed and written.  At most ``max_pending`` outputs may be
+    queued or in flight; further submits block until one finishes, which
+    keeps the memory held by queued items bounded when writes fall behind.
+
+    Use as a context manager; ``collect()`` waits for every submitted write
+    and returns the ERR_051/ERR_052 failures by key.
+
+    Args:
+        max_workers: Number of writer threads.
+        max_pending: Maximum outputs queued or being written at once.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="output-writer")
+        self._slots = threading.BoundedSemaphore(max(max_pending, 1))
+        self._futures: dict[str, Future[None]] = {}
+
+    def __enter__(self) -> "OutputWriterPool":
+        """Return the pool itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Wait for outstanding writes and stop the writer threads."""
+        self._executor.shutdown(wait=True)
+
+    def submit(
+        self,
+        key: str,
+        invoice_items: list[InvoiceRecord],
+        packing_totals: PackingTotals,
+        config: AppConfig,
+        output_path: Path,
+    ) -> None:
+        """Queue one write_template() call, blocking while the queue is full.
+
+        Args:
+            key: Identifier the failure is reported under (the input filename).
+            invoice_items: Items to write (must not be mutated afterwards).
+            packing_totals: Packing totals for row 5.
+            config: Application configuration with template_path.
+            output_path: Output file path.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(write_template, invoice_items, packing_totals, config, output_path)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures[key] = future
+
+    def collect(self) -> dict[str, ProcessingError]:
+        """Wait for all submitted writes and return their failures.
+
+        Returns:
+            Dict of key -> ProcessingError (ERR_051/ERR_052) for failed writes.
+
+        Raises:
+            Exception: Any non-ProcessingError raised by write_template, as it
+                would have been raised by a synchronous call.
+        """
+        failures: dict[str, ProcessingError] = {}
+        for key, future in self._futures.items():
+            try:
+                future.result()
+            except ProcessingError as exc:
+                failures[key] = exc
+        self._futures.clear()
+        return failures
+
+
+def _save_atomically(output_path: Path, save: Callable[[Path], None]) -> None:
+    """Save through a temporary file in the output directory, then replace.
+
+    Reason: Writer threads and worker processes may produce the same
+    ``{stem}_template.xlsx`` at once (``a.xls`` and ``a.xlsx`` in one
+    batch); each writes its own temporary file, so the output is always
+    one complete workbook, never an interleaved zip.
+
+    Args:
+        output_path: Final output path.
+        save: Writes a complete workbook to the path it is given.
+
+    Raises:
+        Exception: Whatever ``save`` or ``os.replace`` raises; the temporary
+            file is removed first.
+    """
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        save(tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _sheet_template(template_path: Path) -> SheetTemplate | None:
+    """Return the cached streaming template, or None if it cannot be streamed.
+
+    Args:
+        template_path: Path to the output template.
+
+    Returns:
+        SheetTemplate for 工作表1, or None when the template's layout is not
+        supported by the streaming writer (callers then use openpyxl).
+
+    Raises:
+        Exception: Any error from stat() or reading the zip archive (mapped
+            to ERR_051 by the caller).
+    """
+    signature = _file_signature(template_path)
+    cached = _sheet_template_cache.get(template_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    template: SheetTemplate | None
+    try:
+        template = SheetTemplate.load(template_path, _SHEET_NAME)
+    except UnsupportedTemplateError as exc:
+        logger.debug("Output template cannot be streamed (%s); using openpyxl", exc)
+        template = None
+    _sheet_template_cache[template_path] = (signature, template)
+    return template
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    """Return (st_mtime_ns, st_size) of a file, used to notice template edits."""
+    file_stat = path.stat()
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _load_template(template_path: Path) -> Workbook:
+    """Return a private, writable copy of the template workbook.
+
+    The first call (per process and template version) parses the file with
+    load_workbook() and keeps a pickled snapshot of the pristine workbook;
+    later calls unpickle that snapshot, which is several times cheaper than
+    re-parsing the xlsx and yields a fully independent object graph.
+
+    Args:
+        template_path: Path to the output template.
+
+    Returns:
+        A Workbook that the caller may modify freely.
+
+    Raises:
+        Exception: Any error from stat() or load_workbook() (mapped to ERR_051
+            by the caller).
+    """
+    signature = _file_signature(template_path)
+    cached = _template_cache.get(template_path)
+    if cached is not None and cached[0] == signature and cached[1] is not None:
+        return pickle.loads(cached[1])
+
+    wb = load_workbook(template_path)
+    if cached is None or cached[0] != signature:
+        try:
+            snapshot: bytes | None = pickle.dumps(wb, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as exc:
+            # Reason: Exotic template parts may not pickle; fall back to
+            # parsing the template for every output.
+            logger.debug("Output template cannot be cached (%s); loading it per file", exc)
+            snapshot = None
+        _template_cache[template_path] = (signature, snapshot)
+    return wb
+
+
+def _item_cells(item: InvoiceRecord) -> dict[int, Any]:
+    """Return the cells of a single invoice item's output row.
 
     Columns I, J, K, O, Q, and U–AJ are intentionally left empty (not written).
     Columns P and AK are written separately (row-5-only logic) and must NOT be
     written here.
 
     Args:
-        ws: openpyxl Worksheet (output sheet).
-        row: 1-based row number for this item.
-        item: The InvoiceItem to write.
+        item: The invoice item to write.
+
+    Returns:
+        Dict of 1-based column index -> cell value.
     """
+    cells: dict[int, Any] = {}
+
     # Column A — part_no
-    ws.cell(row=row, column=_COL_A).value = item.part_no
+    cells[_COL_A] = item.part_no
 
     # Column B — po_no
-    ws.cell(row=row, column=_COL_B).value = item.po_no
+    cells[_COL_B] = item.po_no
 
     # Column C — fixed "3" (征免方式)
-    ws.cell(row=row, column=_COL_C).value = _FIXED_C
+    cells[_COL_C] = _FIXED_C
 
     # Column D — currency (raw string; ATT_003 passthrough requires no special logic)
-    ws.cell(row=row, column=_COL_D).value = item.currency
+    cells[_COL_D] = item.currency
 
     # Column E — qty
-    ws.cell(row=row, column=_COL_E).value = item.qty
+    cells[_COL_E] = item.qty
 
     # Column F — price
-    ws.cell(row=row, column=_COL_F).value = item.price
+    cells[_COL_F] = item.price
 
     # Column G — amount
-    ws.cell(row=row, column=_COL_G).value = item.amount
+    cells[_COL_G] = item.amount
 
     # Column H — coo (raw string; ATT_004 passthrough requires no special logic)
-    ws.cell(row=row, column=_COL_H).value = item.coo
+    cells[_COL_H] = item.coo
 
     # Columns I (9), J (10), K (11) — reserved; intentionally left empty
 
     # Column L — serial (报关单商品序号); format 0.00000_ set in template
-    ws.cell(row=row, column=_COL_L).value = item.serial
+    cells[_COL_L] = item.serial
 
     # Column M — allocated_weight (净重); format 0.00000_ set in template
-    ws.cell(row=row, column=_COL_M).value = item.allocated_weight
+    cells[_COL_M] = item.allocated_weight
 
     # Column N — inv_no
-    ws.cell(row=row, column=_COL_N).value = item.inv_no
+    cells[_COL_N] = item.inv_no
 
     # Column O (15) — reserved; intentionally left empty
 
@@ -178,23 +399,25 @@ def _write_item_row(ws, row: int, item: InvoiceItem) -> None:  # type: ignore[no
     # Column Q (17) — reserved; intentionally left empty
 
     # Column R — fixed "32052"
-    ws.cell(row=row, column=_COL_R).value = _FIXED_R
+    cells[_COL_R] = _FIXED_R
 
     # Column S — fixed "320506"
-    ws.cell(row=row, column=_COL_S).value = _FIXED_S
+    cells[_COL_S] = _FIXED_S
 
     # Column T — fixed "142"
-    ws.cell(row=row, column=_COL_T).value = _FIXED_T
+    cells[_COL_T] = _FIXED_T
 
     # Columns U (21) through AJ (36) — reserved; intentionally left empty
 
     # Column AK (37) — total_packets; written ONLY at row 5 (handled by caller)
 
     # Column AL — brand
-    ws.cell(row=row, column=_COL_AL).value = item.brand
+    cells[_COL_AL] = item.brand
 
     # Column AM — brand_type
-    ws.cell(row=row, column=_COL_AM).value = item.brand_type
+    cells[_COL_AM] = item.brand_type
 
     # Column AN — model_no (PRD name: 型号; Python attr: model_no)
-    ws.cell(row=row, column=_COL_AN).value = item.model_no
+    cells[_COL_AN] = item.model_no
+
+    return cells
@@ -2,9 +2,12 @@
 
 import logging
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
 from .errors import ProcessingError
-from .models import BatchResult
+
+if TYPE_CHECKING:
+    from .models import BatchResult
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +53,8 @@ def _condense_warnings(warnings: list[ProcessingError]) -> list[tuple[str, str]]
 
     Warnings are not condensed by the spec (no occurrence count shown for
     attention items), so each warning is emitted as a separate entry.
+    ATT_003/ATT_004 arrive already aggregated per distinct value by
+    transform.py, with their own occurrence count in the message.
 
     Args:
         warnings (list[ProcessingError]): Raw list of warnings from a FileResult.
@@ -60,7 +65,7 @@ def _condense_warnings(warnings: list[ProcessingError]) -> list[tuple[str, str]]
     return [(w.code.value, w.message) for w in warnings]
 
 
-def print_batch_summary(batch_result: BatchResult) -> None:
+def print_batch_summary(batch_result: "BatchResult") -> None:
     """Format and print batch summary to console per FR-033 format.
 
     Produces the summary always, even if all files failed or total_files == 0.
@@ -69,6 +74,7 @@ def print_batch_summary(batch_result: BatchResult) -> None:
 
     The separator line is exactly 75 '=' characters.
     Processing time is formatted to exactly 2 decimal places.
+    A layout cache hit-rate line is added only when the cache was consulted.
     Error condensing: repeated error codes per file are shown as
     "{code}: {message} (N occurrences)" with representative part_no from first.
 
@@ -89,6 +95,13 @@ def print_batch_summary(batch_result: BatchResult) -> None:
     logger.info("Failed:             %d", batch_result.failed_count)
     logger.info("Processing time:    %.2f seconds", batch_result.processing_time)
     logger.info("Log file:           %s", batch_result.log_path)
+    if batch_result.layout_cache_lookups:
+        logger.info(
+            "Layout cache:       %d/%d hits (%.0f%%)",
+            batch_result.layout_cache_hits,
+            batch_result.layout_cache_lookups,
+            100.0 * batch_result.layout_cache_hits / batch_result.layout_cache_lookups,
+        )
     logger.info(_SEPARATOR)
 
     # --- Failed files section (ERROR) — omitted if no failed files ---
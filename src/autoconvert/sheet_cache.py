@@ -0,0 +1,294 @@
+"""sheet_cache — Persistent cache of parsed Invoice/Packing sheets.
+
+Re-running a batch after a ``field_patterns.yaml`` tweak, a ``--diagnostic``
+run or a retry parses the same input bytes again.  The cache stores the two
+sheet snapshots of each successfully read file (values, number formats,
+merged ranges, dimensions) under a key derived from the SHA-256 of the file
+contents and the sheet-name patterns, so a re-read of unchanged bytes skips
+decompression and XML/BIFF parsing entirely.  Column, invoice-number and
+lookup settings are not part of the key: they act on the snapshots, not on
+how they are read.
+
+Each entry is one file ``<key>.sheets`` in the cache directory:
+``_MAGIC`` + version byte + zlib-compressed ``marshal`` payload.  ``marshal``
+only rebuilds plain data (it cannot run code the way pickle can), so date
+and time cell values are stored as tagged tuples.  Entries are evicted least
+recently used first (file mtime, refreshed on every hit) once the directory
+exceeds its size cap.  Each process writes through a temporary file and
+``os.replace``, so pool workers can share one directory.
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import zlib
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from typing import Any
+
+from .manifest import file_digest
+from .models import AppConfig
+from .sheet_snapshot import SheetSnapshot
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"ACSC"
+_VERSION = 1
+_SUFFIX = ".sheets"
+
+# Tags of encoded cell values (the first item of the tuple).
+_TAG_DATETIME = 0
+_TAG_TIME = 1
+_TAG_TIMEDELTA = 2
+
+
+class SheetCache:
+    """Content-addressed, size-capped on-disk store of sheet snapshots.
+
+    Args:
+        directory: Cache directory (created on first store).
+        max_bytes: Size cap of all entries together.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        """Bind the cache directory and size cap; nothing is read yet.
+
+        Args:
+            directory: Cache directory.
+            max_bytes: Size cap in bytes.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, filepath: Path, config: AppConfig) -> str:
+        """Return the cache key of an input file under the current sheet patterns.
+
+        Args:
+            filepath: Input Excel file.
+            config: Application configuration (sheet-name patterns).
+
+        Returns:
+            Hex digest string.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        payload = "\n".join(
+            [file_digest(filepath)]
+            + [p.pattern for p in config.invoice_sheet_patterns]
+            + ["--"]
+            + [p.pattern for p in config.packing_sheet_patterns]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> tuple[SheetSnapshot, SheetSnapshot] | None:
+        """Return the snapshots stored under ``key``, or None on a miss.
+
+        Unreadable, truncated or outdated entries count as misses and are
+        removed.
+
+        Args:
+            key: Cache key from key().
+
+        Returns:
+            (invoice snapshot, packing snapshot), or None.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            snapshots = _decode_entry(data)
+        except (ValueError, EOFError, TypeError, IndexError, zlib.error) as exc:
+            logger.debug("Dropping unreadable sheet cache entry %s: %s", path.name, exc)
+            _unlink(path)
+            return None
+        try:
+            # Reason: mtime is the LRU clock; a hit makes the entry recent.
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug("Sheet cache hit: %s", key[:12])
+        return snapshots
+
+    def store(self, key: str, inv_snap: SheetSnapshot, pack_snap: SheetSnapshot) -> None:
+        """Persist the snapshots under ``key`` and evict old entries over the cap.
+
+        ``pack_snap`` may be ``inv_snap.without_merges()`` (one sheet matched
+        both patterns); that case is stored once.  Failures are logged and
+        otherwise ignored: the cache never fails a file.
+
+        Args:
+            key: Cache key from key().
+            inv_snap: Invoice sheet snapshot.
+            pack_snap: Packing sheet snapshot.
+        """
+        try:
+            data = _encode_entry(inv_snap, pack_snap)
+        except TypeError as exc:
+            logger.debug("Sheet cache skipped for %s: %s", key[:12], exc)
+            return
+        if len(data) > self.max_bytes:
+            logger.debug("Sheet cache skipped for %s: entry exceeds the size cap", key[:12])
+            return
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not write sheet cache entry %s: %s", path, exc)
+            _unlink(tmp_path)
+            return
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        """Return the entry file path of a key."""
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the directory fits the cap."""
+        entries: list[tuple[float, int, str]] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(_SUFFIX):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        evicted = 0
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            _unlink(Path(entry_path))
+            total -= size
+            evicted += 1
+        logger.debug("Sheet cache: evicted %d entr%s", evicted, "y" if evicted == 1 else "ies")
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _unlink(path: Path) -> None:
+    """Remove a file, ignoring errors (it may already be gone)."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _encode_entry(inv_snap: SheetSnapshot, pack_snap: SheetSnapshot) -> bytes:
+    """Serialize two snapshots into the cache entry format.
+
+    Args:
+        inv_snap: Invoice sheet snapshot.
+        pack_snap: Packing sheet snapshot.
+
+    Returns:
+        Entry bytes.
+
+    Raises:
+        TypeError: If a cell holds a value type the format cannot store.
+    """
+    inv_state, pack_state = inv_snap.state(), pack_snap.state()
+    # Reason: A without_merges() view shares the invoice grid; store it once.
+    same_sheet = pack_state[1] is inv_state[1] and not pack_snap.merged_ranges
+    payload = marshal.dumps((_encode_state(inv_state), None if same_sheet else _encode_state(pack_state)))
+    return _MAGIC + bytes([_VERSION]) + zlib.compress(payload)
+
+
+def _decode_entry(data: bytes) -> tuple[SheetSnapshot, SheetSnapshot]:
+    """Rebuild the two snapshots of a cache entry.
+
+    Args:
+        data: Entry bytes.
+
+    Returns:
+        (invoice snapshot, packing snapshot).
+
+    Raises:
+        ValueError: If the header or payload is not a current-version entry.
+    """
+    header = len(_MAGIC) + 1
+    if data[: len(_MAGIC)] != _MAGIC or data[len(_MAGIC)] != _VERSION:
+        raise ValueError("not a current sheet cache entry")
+    inv_state, pack_state = marshal.loads(zlib.decompress(data[header:]))
+    inv_snap = SheetSnapshot(*_decode_state(inv_state))
+    if pack_state is None:
+        return inv_snap, inv_snap.without_merges()
+    return inv_snap, SheetSnapshot(*_decode_state(pack_state))
+
+
+def _encode_state(state: tuple) -> tuple:  # type: ignore[type-arg]
+    """Replace date/time cell values of a snapshot state with tagged tuples.
+
+    Args:
+        state: SheetSnapshot.state() tuple.
+
+    Returns:
+        The state with marshal-safe rows.
+
+    Raises:
+        TypeError: If a cell holds any other non-plain value.
+    """
+    title, rows, fmt_rows, formats, max_row, max_column, merged = state
+    encoded = [[_encode_value(v) for v in row] if any(not _is_plain(v) for v in row) else row for row in rows]
+    return title, encoded, fmt_rows, formats, max_row, max_column, [tuple(b) for b in merged]
+
+
+def _decode_state(state: tuple) -> tuple:  # type: ignore[type-arg]
+    """Inverse of _encode_state(); returns SheetSnapshot constructor arguments."""
+    title, rows, fmt_rows, formats, max_row, max_column, merged = state
+    decoded = [[_decode_value(v) for v in row] if any(type(v) is tuple for v in row) else row for row in rows]
+    return title, decoded, fmt_rows, formats, max_row, max_column, [tuple(b) for b in merged]
+
+
+def _is_plain(value: Any) -> bool:
+    """Return True for values marshal stores as they are."""
+    return value is None or type(value) in (str, int, float, bool)
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode one cell value (see _encode_state)."""
+    if _is_plain(value):
+        return value
+    if type(value) is datetime and value.tzinfo is None:
+        return (
+            _TAG_DATETIME,
+            value.year,
+            value.month,
+            value.day,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond,
+        )
+    if type(value) is time and value.tzinfo is None:
+        return _TAG_TIME, value.hour, value.minute, value.second, value.microsecond
+    if type(value) is timedelta:
+        return _TAG_TIMEDELTA, value.days, value.seconds, value.microseconds
+    raise TypeError(f"cannot cache cell value of type {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    """Decode one cell value (see _encode_value)."""
+    if type(value) is not tuple:
+        return value
+    tag, *fields = value
+    if tag == _TAG_DATETIME:
+        return datetime(*fields)
+    if tag == _TAG_TIME:
+        return time(*fields)
+    if tag == _TAG_TIMEDELTA:
+        return timedelta(*fields)
+    raise ValueError(f"unknown cell value tag {tag!r}")
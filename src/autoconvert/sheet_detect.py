@@ -29,59 +29,79 @@ def detect_sheets(workbook: Workbook, config: AppConfig) -> tuple[Worksheet, Wor
         ProcessingError: ERR_012 if no invoice sheet found.
         ProcessingError: ERR_013 if no packing sheet found.
     """
-    invoice_sheet: Worksheet | None = None
-    packing_sheet: Worksheet | None = None
+    invoice_name, packing_name = match_sheet_names(workbook.sheetnames, config)
+    return workbook[invoice_name], workbook[packing_name]
 
-    # Scan all sheets in the workbook
-    for worksheet in workbook.sheetnames:
-        sheet = workbook[worksheet]
 
+def match_sheet_names(sheet_names: list[str], config: AppConfig) -> tuple[str, str]:
+    """Pick the Invoice and Packing sheet names from a workbook's sheet list.
+
+    Same rules as detect_sheets(), applied to names only, so a loader can
+    decide which sheets to parse before reading any cell data.
+
+    Args:
+        sheet_names: Sheet names in workbook order.
+        config: Application configuration with compiled sheet patterns.
+
+    Returns:
+        A tuple of (invoice_sheet_name, packing_sheet_name); both may be the
+        same name when one sheet matches both pattern lists.
+
+    Raises:
+        ProcessingError: ERR_012 if no invoice sheet found.
+        ProcessingError: ERR_013 if no packing sheet found.
+    """
+    invoice_name: str | None = None
+    packing_name: str | None = None
+
+    # Scan all sheet names in workbook order
+    for name in sheet_names:
         # Strip whitespace from sheet name for pattern matching
-        normalized_name = worksheet.strip()
+        normalized_name = name.strip()
 
         # Check invoice patterns first
-        if invoice_sheet is None:
+        if invoice_name is None:
             for pattern in config.invoice_sheet_patterns:
                 if pattern.match(normalized_name):
-                    invoice_sheet = sheet
+                    invoice_name = name
                     logger.debug(
                         "Detected invoice sheet: '%s' matched pattern %s",
-                        worksheet,
+                        name,
                         pattern.pattern,
                     )
                     break
 
         # Check packing patterns
-        if packing_sheet is None:
+        if packing_name is None:
             for pattern in config.packing_sheet_patterns:
                 if pattern.match(normalized_name):
-                    packing_sheet = sheet
+                    packing_name = name
                     logger.debug(
                         "Detected packing sheet: '%s' matched pattern %s",
-                        worksheet,
+                        name,
                         pattern.pattern,
                     )
                     break
 
         # Early exit if both found
-        if invoice_sheet is not None and packing_sheet is not None:
+        if invoice_name is not None and packing_name is not None:
             break
 
     # Validate that both sheets were found
-    if invoice_sheet is None:
+    if invoice_name is None:
         logger.error("ERR_012: Invoice sheet not found in workbook")
         raise ProcessingError(
             code=ErrorCode.ERR_012,
             message="Invoice sheet not found in workbook",
-            context={"sheet_names": workbook.sheetnames},
+            context={"sheet_names": list(sheet_names)},
         )
 
-    if packing_sheet is None:
+    if packing_name is None:
         logger.error("ERR_013: Packing sheet not found in workbook")
         raise ProcessingError(
             code=ErrorCode.ERR_013,
             message="Packing sheet not found in workbook",
-            context={"sheet_names": workbook.sheetnames},
+            context={"sheet_names": list(sheet_names)},
         )
 
-    return invoice_sheet, packing_sheet
+    return invoice_name, packing_name
@@ -0,0 +1,795 @@
+"""sheet_snapshot — Read-only, row-major value grid of a worksheet.
+
+Extraction reads a sheet cell by cell.  Going through openpyxl's
+``sheet.cell(row=..., column=...)`` for every read costs a dict lookup, a
+``Cell`` object (created on demand for empty positions) and a style lookup
+for ``number_format``.  ``SheetSnapshot`` copies a worksheet once into plain
+Python lists so that the hot loops in column_map / extract_* / MergeTracker
+read values with two list indexes.
+
+The snapshot presents the sheet the way the pipeline sees it after
+``MergeTracker`` unmerges it: non-anchor cells of merged ranges are empty
+(``None``, ``General`` format) and the merged ranges themselves are kept as
+plain bounds in ``merged_ranges``.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from openpyxl.worksheet.worksheet import Worksheet
+
+logger = logging.getLogger(__name__)
+
+_GENERAL = "General"
+_GENERAL_ID = 0
+
+# (min_row, min_col, max_row, max_col), all 1-based and inclusive.
+MergeBounds = tuple[int, int, int, int]
+
+# (row, col, value, number_format) of one stored cell, all indexes 1-based.
+CellTuple = tuple[int, int, Any, str | None]
+
+
+class SnapshotCell:
+    """Minimal cell exposing ``value`` and ``number_format``.
+
+    Returned by ``SheetSnapshot.cell()`` for callers that need a cell-like
+    object, e.g. ``utils.detect_cell_precision``.
+    """
+
+    __slots__ = ("value", "number_format")
+
+    def __init__(self, value: Any, number_format: str) -> None:
+        """Store the cell value and its number format string.
+
+        Args:
+            value: Cell value.
+            number_format: Excel number format code.
+        """
+        self.value = value
+        self.number_format = number_format
+
+
+class SheetSnapshot:
+    """Immutable copy of a worksheet's values and number formats.
+
+    Rows are stored as ragged lists (trailing empty cells and rows are not
+    stored).  Number formats are stored as small integer ids into a
+    per-sheet format table (id 0 is ``General``); rows whose cells are all
+    ``General`` store ``None`` instead of an id list.
+
+    ``max_row`` / ``max_column`` mirror openpyxl and count styled-but-empty
+    cells, which some supplier files carry down to row 1,048,576.  The data
+    extent (``data_max_row`` / ``data_max_column``) is the last row / column
+    that holds a value or is covered by a merged range with a non-empty
+    anchor; past it every read is empty, so scan loops stop there.
+
+    Attributes:
+        title: Worksheet title.
+        max_row: ``max_row`` of the source worksheet at snapshot time.
+        max_column: ``max_column`` of the source worksheet at snapshot time.
+        merged_ranges: Merged ranges of the source worksheet as
+            ``(min_row, min_col, max_row, max_col)`` tuples.
+        data_max_row: Last row of the data extent (0 for an empty sheet).
+        data_max_column: Last column of the data extent (0 for an empty sheet).
+    """
+
+    __slots__ = (
+        "title",
+        "merged_ranges",
+        "_max_row",
+        "_max_column",
+        "_data_max_row",
+        "_data_max_column",
+        "_rows",
+        "_fmt_rows",
+        "_formats",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        rows: list[list[Any]],
+        fmt_rows: list[list[int] | None],
+        formats: list[str],
+        max_row: int,
+        max_column: int,
+        merged_ranges: list[MergeBounds],
+    ) -> None:
+        """Build a snapshot from pre-computed grids (see ``from_worksheet``).
+
+        Args:
+            title: Worksheet title.
+            rows: Row-major values; ``rows[r - 1][c - 1]`` is cell (r, c).
+            fmt_rows: Per-row number format ids parallel to ``rows``, or
+                ``None`` for rows whose cells are all ``General``.
+            formats: Format table indexed by format id; ``formats[0]`` is
+                ``General``.
+            max_row: Source worksheet ``max_row``.
+            max_column: Source worksheet ``max_column``.
+            merged_ranges: Merged range bounds.
+        """
+        self.title = title
+        self._max_row = max_row
+        self._max_column = max_column
+        self.merged_ranges = merged_ranges
+        self._rows = rows
+        self._fmt_rows = fmt_rows
+        self._formats = formats
+        self._data_max_row, self._data_max_column = _data_extent(rows, merged_ranges)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_worksheet(cls, sheet: Worksheet) -> "SheetSnapshot":
+        """Copy all values and number formats of a worksheet in one pass.
+
+        Only cells holding a value are stored, so styled-but-empty cells
+        (which inflate ``max_row`` / ``max_column``) cost nothing.
+
+        Args:
+            sheet: openpyxl Worksheet (merged or already unmerged).
+
+        Returns:
+            A new SheetSnapshot.
+        """
+        merged = [
+            (cell_range.min_row, cell_range.min_col, cell_range.max_row, cell_range.max_col)
+            for cell_range in sheet.merged_cells.ranges  # type: ignore[attr-defined]
+        ]
+        return cls.from_cells(sheet.title, _iter_cells(sheet), merged, sheet.max_row, sheet.max_column)
+
+    @classmethod
+    def from_cells(
+        cls,
+        title: str,
+        cells: Iterable[CellTuple],
+        merged_ranges: list[MergeBounds],
+        max_row: int | None = None,
+        max_column: int | None = None,
+    ) -> "SheetSnapshot":
+        """Build a snapshot from a stream of (row, col, value, number_format) cells.
+
+        ``merged_ranges`` is read only after ``cells`` is exhausted, so a
+        streaming parser may fill the list while it yields cells.
+
+        Args:
+            title: Worksheet title.
+            cells: Every stored cell of the sheet, in any order.
+            merged_ranges: Merged range bounds.
+            max_row: Sheet ``max_row``; None derives it the way openpyxl
+                does, from the stored cells and merged ranges.
+            max_column: Sheet ``max_column``; None derives it likewise.
+
+        Returns:
+            A new SheetSnapshot.
+        """
+        grid = _GridBuilder()
+        for row_idx, col_idx, value, number_format in cells:
+            grid.add(row_idx, col_idx, value, number_format)
+
+        merged = list(merged_ranges)
+        for bounds in merged:
+            _clear_non_anchor(grid.rows, grid.fmt_rows, bounds)
+        if merged:
+            _trim(grid.rows)
+        seen_row, seen_col = grid.dimensions(merged)
+
+        snapshot = cls(
+            title,
+            grid.rows,
+            grid.fmt_rows,
+            grid.formats,
+            seen_row if max_row is None else max_row,
+            seen_col if max_column is None else max_column,
+            merged,
+        )
+        logger.debug(
+            "Snapshot of '%s': data extent %d x %d (sheet %d x %d, %d trailing blank rows), "
+            "%d merged range(s), %d format(s)",
+            title,
+            snapshot.data_max_row,
+            snapshot.data_max_column,
+            snapshot.max_row,
+            snapshot.max_column,
+            snapshot.trailing_blank_rows,
+            len(merged),
+            len(grid.formats),
+        )
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Dimensions
+    # ------------------------------------------------------------------
+
+    @property
+    def max_row(self) -> int:
+        """``max_row`` of the source worksheet."""
+        return self._max_row
+
+    @property
+    def max_column(self) -> int:
+        """``max_column`` of the source worksheet."""
+        return self._max_column
+
+    @property
+    def data_max_row(self) -> int:
+        """Last row of the data extent (0 for an empty sheet)."""
+        return self._data_max_row
+
+    @property
+    def data_max_column(self) -> int:
+        """Last column of the data extent (0 for an empty sheet)."""
+        return self._data_max_column
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def value(self, row: int, col: int) -> Any:
+        """Return the value of cell (row, col), or None when empty or out of range.
+
+        Args:
+            row: 1-based row index.
+            col: 1-based column index.
+
+        Returns:
+            The cell value.
+        """
+        if row < 1 or col < 1 or row > len(self._rows):
+            return None
+        values = self._rows[row - 1]
+        if col > len(values):
+            return None
+        return values[col - 1]
+
+    def number_format(self, row: int, col: int) -> str:
+        """Return the number format code of cell (row, col).
+
+        Args:
+            row: 1-based row index.
+            col: 1-based column index.
+
+        Returns:
+            The format code; ``General`` for unformatted or out-of-range cells.
+        """
+        if row < 1 or col < 1 or row > len(self._fmt_rows):
+            return _GENERAL
+        fmt_row = self._fmt_rows[row - 1]
+        if fmt_row is None or col > len(fmt_row):
+            return _GENERAL
+        return self._formats[fmt_row[col - 1]]
+
+    def cell(self, row: int, column: int) -> SnapshotCell:
+        """Return a light cell object, mirroring ``Worksheet.cell()`` reads.
+
+        Args:
+            row: 1-based row index.
+            column: 1-based column index.
+
+        Returns:
+            SnapshotCell with the value and number format of (row, column).
+        """
+        return SnapshotCell(self.value(row, column), self.number_format(row, column))
+
+    def row_values(self, row: int) -> list[Any]:
+        """Return the stored values of a row (trailing empty cells omitted).
+
+        Args:
+            row: 1-based row index.
+
+        Returns:
+            The row's value list; empty for blank or out-of-range rows.
+            Callers must not mutate it.
+        """
+        if row < 1 or row > len(self._rows):
+            return []
+        return self._rows[row - 1]
+
+    @property
+    def trailing_blank_rows(self) -> int:
+        """Number of rows between the data extent and ``max_row``."""
+        return max(self.max_row - self.data_max_row, 0)
+
+    def data_rows(self, start_row: int, end_row: int | None = None) -> Iterable[int]:
+        """Return the rows from ``start_row`` to the end of the data extent.
+
+        Callers that stop early (stop keywords, total rows) should iterate
+        this instead of reading ``data_max_row``, so that a lazily parsed
+        snapshot never has to parse the rest of the sheet.
+
+        Args:
+            start_row: First 1-based row to visit.
+            end_row: Optional last row to visit.
+
+        Returns:
+            ``range(start_row, min(end_row, data_max_row) + 1)``; empty if
+            start_row is past it.
+        """
+        last = self.data_max_row if end_row is None else min(end_row, self.data_max_row)
+        return range(start_row, last + 1)
+
+    def data_columns(self, limit: int) -> int:
+        """Return the last column worth scanning, capped at ``limit``.
+
+        Columns past the data extent are always empty, so scanning up to
+        the returned column reads the same values as scanning up to ``limit``.
+
+        Args:
+            limit: Upper bound on the number of columns to scan.
+
+        Returns:
+            ``min(data_max_column, limit)``.
+        """
+        return min(self.data_max_column, limit)
+
+    def without_merges(self) -> "SheetSnapshot":
+        """Return a snapshot sharing this one's grids but with no merged ranges.
+
+        Returns:
+            A SheetSnapshot whose ``merged_ranges`` is empty.
+        """
+        return SheetSnapshot(self.title, self._rows, self._fmt_rows, self._formats, self.max_row, self.max_column, [])
+
+    def state(self) -> tuple[str, list[list[Any]], list[list[int] | None], list[str], int, int, list[MergeBounds]]:
+        """Return the constructor arguments that rebuild this snapshot.
+
+        ``SheetSnapshot(*snapshot.state())`` reads exactly like ``snapshot``;
+        sheet_cache persists snapshots this way.
+
+        Returns:
+            (title, rows, fmt_rows, formats, max_row, max_column, merged_ranges).
+        """
+        # Reason: Reading the dimensions first makes a lazy snapshot parse
+        # its remaining rows before the grids are handed out.
+        max_row, max_column = self.max_row, self.max_column
+        return self.title, self._rows, self._fmt_rows, self._formats, max_row, max_column, self.merged_ranges
+
+
+class LazySheetSnapshot(SheetSnapshot):
+    """SheetSnapshot whose rows are pulled from a forward-only source on demand.
+
+    Reads of row ``r`` consume the source only until row ``r`` (plus the
+    next stored row) has been seen, so a caller that stops at the total row
+    never causes the rows below it to be parsed.  Merged ranges must be known
+    up front; their non-anchor cells are blanked as rows arrive.  Reading a
+    dimension (``max_row``, ``data_max_row``, ...) drains the source.
+
+    Args:
+        title: Worksheet title.
+        row_source: Iterator of ``(row, [(row, col, value, number_format), ...])``
+            in ascending row order, covering every stored cell.
+        merged_ranges: Merged range bounds of the sheet.
+    """
+
+    __slots__ = ("_source", "_loaded_row", "_grid", "_pending_merges", "_active_merges", "_owner")
+
+    def __init__(
+        self,
+        title: str,
+        row_source: Iterator[tuple[int, list[CellTuple]]],
+        merged_ranges: list[MergeBounds],
+    ) -> None:
+        """Bind the row source; nothing is parsed yet.
+
+        Args:
+            title: Worksheet title.
+            row_source: Forward-only row iterator (see class docstring).
+            merged_ranges: Merged range bounds.
+        """
+        grid = _GridBuilder()
+        self.title = title
+        self.merged_ranges = merged_ranges
+        self._rows = grid.rows
+        self._fmt_rows = grid.fmt_rows
+        self._formats = grid.formats
+        self._grid: _GridBuilder | None = grid
+        self._source: Iterator[tuple[int, list[CellTuple]]] | None = row_source
+        self._loaded_row = 0
+        self._pending_merges = sorted(merged_ranges, reverse=True)
+        self._active_merges: list[MergeBounds] = []
+        self._owner = self
+
+    @property
+    def max_row(self) -> int:
+        """``max_row`` as openpyxl would report it (drains the source)."""
+        self._owner._load_all()
+        return self._owner._max_row
+
+    @property
+    def max_column(self) -> int:
+        """``max_column`` as openpyxl would report it (drains the source)."""
+        self._owner._load_all()
+        return self._owner._max_column
+
+    @property
+    def data_max_row(self) -> int:
+        """Last row of the data extent (drains the source)."""
+        self._load_all()
+        return self._data_max_row
+
+    @property
+    def data_max_column(self) -> int:
+        """Last column of the data extent (drains the source)."""
+        self._load_all()
+        return self._data_max_column
+
+    def value(self, row: int, col: int) -> Any:
+        """Return the value of cell (row, col), parsing up to ``row`` if needed.
+
+        Args:
+            row: 1-based row index.
+            col: 1-based column index.
+
+        Returns:
+            The cell value.
+        """
+        self._owner._load_through(row)
+        return SheetSnapshot.value(self, row, col)
+
+    def number_format(self, row: int, col: int) -> str:
+        """Return the number format of cell (row, col), parsing up to ``row`` if needed.
+
+        Args:
+            row: 1-based row index.
+            col: 1-based column index.
+
+        Returns:
+            The format code.
+        """
+        self._owner._load_through(row)
+        return SheetSnapshot.number_format(self, row, col)
+
+    def row_values(self, row: int) -> list[Any]:
+        """Return the stored values of a row, parsing up to ``row`` if needed.
+
+        Args:
+            row: 1-based row index.
+
+        Returns:
+            The row's value list (see ``SheetSnapshot.row_values``).
+        """
+        self._owner._load_through(row)
+        return SheetSnapshot.row_values(self, row)
+
+    def data_rows(self, start_row: int, end_row: int | None = None) -> Iterator[int]:
+        """Yield rows from ``start_row`` while the sheet may still hold data.
+
+        Until the source is drained, rows are yielded one at a time as they
+        are parsed; rows past the data extent that are yielded before the end
+        of the sheet is known are blank, so readers treat them as such.
+
+        Args:
+            start_row: First 1-based row to visit.
+            end_row: Optional last row to visit.
+
+        Yields:
+            1-based row numbers.
+        """
+        owner = self._owner
+        row = start_row
+        while end_row is None or row <= end_row:
+            owner._load_through(row)
+            if owner._source is None and row > self._data_extent_row():
+                return
+            yield row
+            row += 1
+
+    def data_columns(self, limit: int) -> int:
+        """Return ``limit`` until the data extent is known, then clamp to it.
+
+        Args:
+            limit: Upper bound on the number of columns to scan.
+
+        Returns:
+            Last column worth scanning.
+        """
+        if self._owner._source is not None:
+            return limit
+        return min(self.data_max_column, limit)
+
+    def without_merges(self) -> "SheetSnapshot":
+        """Return a view sharing this snapshot's rows and source, with no merged ranges.
+
+        Returns:
+            A LazySheetSnapshot whose ``merged_ranges`` is empty.
+        """
+        view = LazySheetSnapshot.__new__(LazySheetSnapshot)
+        view.title = self.title
+        view.merged_ranges = []
+        view._rows = self._rows
+        view._fmt_rows = self._fmt_rows
+        view._formats = self._formats
+        view._grid = None
+        view._source = None
+        view._loaded_row = 0
+        view._pending_merges = []
+        view._active_merges = []
+        view._owner = self._owner
+        return view
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _data_extent_row(self) -> int:
+        """Return data_max_row once the owner has been drained."""
+        self._load_all()
+        return self._data_max_row
+
+    def _load_all(self) -> None:
+        """Drain the source (if any) and compute this snapshot's extents."""
+        owner = self._owner
+        owner._load_through(None)
+        if self is not owner and not hasattr(self, "_data_max_row"):
+            self._data_max_row, self._data_max_column = _data_extent(self._rows, self.merged_ranges)
+
+    def _load_through(self, row: int | None) -> None:
+        """Consume the source until ``row`` has been passed (None: to the end).
+
+        Args:
+            row: 1-based row that must be available, or None for all rows.
+        """
+        source = self._source
+        if source is None or (row is not None and row <= self._loaded_row):
+            return
+        grid = self._grid
+        assert grid is not None
+        for row_idx, cells in source:
+            for cell_row, col_idx, value, number_format in cells:
+                grid.add(cell_row, col_idx, value, number_format)
+            if row_idx > self._loaded_row:
+                self._loaded_row = row_idx
+            self._apply_merges(row_idx)
+            if row is not None and row_idx >= row:
+                return
+
+        # Reason: Source drained -- finish exactly as from_cells() would
+        # (clearing is idempotent for the rows already handled).
+        self._source = None
+        for bounds in self.merged_ranges:
+            _clear_non_anchor(grid.rows, grid.fmt_rows, bounds)
+        if self.merged_ranges:
+            _trim(grid.rows)
+        self._max_row, self._max_column = grid.dimensions(self.merged_ranges)
+        self._data_max_row, self._data_max_column = _data_extent(grid.rows, self.merged_ranges)
+        self._grid = None
+
+    def _apply_merges(self, row_idx: int) -> None:
+        """Blank the non-anchor cells of merged ranges in a freshly parsed row.
+
+        Args:
+            row_idx: 1-based row that was just added.
+        """
+        pending = self._pending_merges
+        while pending and pending[-1][0] <= row_idx:
+            self._active_merges.append(pending.pop())
+        if not self._active_merges:
+            return
+        self._active_merges = [bounds for bounds in self._active_merges if bounds[2] >= row_idx]
+        for bounds in self._active_merges:
+            _clear_non_anchor_in_row(self._rows, self._fmt_rows, bounds, row_idx)
+
+
+def snapshot_of(sheet: "Worksheet | SheetSnapshot") -> SheetSnapshot:
+    """Return ``sheet`` if it is already a snapshot, else snapshot it.
+
+    Lets extraction functions accept either an openpyxl Worksheet or a
+    pre-built SheetSnapshot.
+
+    Args:
+        sheet: Worksheet or SheetSnapshot.
+
+    Returns:
+        A SheetSnapshot of the sheet.
+    """
+    if isinstance(sheet, SheetSnapshot):
+        return sheet
+    return SheetSnapshot.from_worksheet(sheet)
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _iter_cells(sheet: Worksheet) -> Iterator[CellTuple]:
+    """Yield (row, col, value, number_format) for every stored cell.
+
+    Args:
+        sheet: openpyxl Worksheet.
+
+    Yields:
+        Tuples for each cell present in the worksheet.
+    """
+    cells = getattr(sheet, "_cells", None)
+    if cells is None:
+        # Reason: Read-only worksheets have no cell dict; fall back to
+        # bulk row iteration.
+        for row in sheet.iter_rows():
+            for cell in row:
+                # Reason: openpyxl types row/column as optional (read-only
+                # EmptyCell has neither); skip those instead of yielding None.
+                row_idx = getattr(cell, "row", None)
+                col_idx = getattr(cell, "column", None)
+                if row_idx is None or col_idx is None:
+                    continue
+                yield row_idx, col_idx, cell.value, getattr(cell, "number_format", _GENERAL)
+        return
+
+    # Reason: Resolving number_format goes through the workbook's style
+    # tables; cache the resolved string per style id.
+    fmt_by_style: dict[int, str] = {}
+    for (row_idx, col_idx), cell in cells.items():
+        style = getattr(cell, "_style", None)
+        style_id = getattr(style, "numFmtId", None)
+        if style_id is None:
+            number_format = cell.number_format
+        else:
+            number_format = fmt_by_style.get(style_id)
+            if number_format is None:
+                number_format = fmt_by_style[style_id] = cell.number_format
+        yield row_idx, col_idx, cell.value, number_format
+
+
+class _GridBuilder:
+    """Accumulates cells into the ragged value / format-id grids of a snapshot."""
+
+    __slots__ = ("rows", "fmt_rows", "formats", "format_ids", "seen_row", "seen_col")
+
+    def __init__(self) -> None:
+        """Start with empty grids and a format table holding only ``General``."""
+        self.rows: list[list[Any]] = []
+        self.fmt_rows: list[list[int] | None] = []
+        self.formats: list[str] = [_GENERAL]
+        self.format_ids: dict[str, int] = {_GENERAL: _GENERAL_ID}
+        self.seen_row = 1
+        self.seen_col = 1
+
+    def add(self, row_idx: int, col_idx: int, value: Any, number_format: str | None) -> None:
+        """Store one cell (empty cells only widen the seen dimensions).
+
+        Args:
+            row_idx: 1-based row.
+            col_idx: 1-based column.
+            value: Cell value.
+            number_format: Number format code, or None for ``General``.
+        """
+        if row_idx > self.seen_row:
+            self.seen_row = row_idx
+        if col_idx > self.seen_col:
+            self.seen_col = col_idx
+        # Reason: The number format of an empty cell is never read
+        # (precision is only detected for cells with a value).
+        if value is None:
+            return
+        rows = self.rows
+        if len(rows) < row_idx:
+            rows.extend([] for _ in range(row_idx - len(rows)))
+            self.fmt_rows.extend([None] * (row_idx - len(self.fmt_rows)))
+        row = rows[row_idx - 1]
+        if len(row) < col_idx:
+            row.extend([None] * (col_idx - len(row)))
+        row[col_idx - 1] = value
+        if number_format is None or number_format == _GENERAL:
+            return
+        fmt_id = self.format_ids.get(number_format)
+        if fmt_id is None:
+            fmt_id = len(self.formats)
+            self.formats.append(number_format)
+            self.format_ids[number_format] = fmt_id
+        fmt_row = self.fmt_rows[row_idx - 1]
+        if fmt_row is None:
+            fmt_row = self.fmt_rows[row_idx - 1] = []
+        if len(fmt_row) < col_idx:
+            fmt_row.extend([_GENERAL_ID] * (col_idx - len(fmt_row)))
+        fmt_row[col_idx - 1] = fmt_id
+
+    def dimensions(self, merged_ranges: list[MergeBounds]) -> tuple[int, int]:
+        """Return (max_row, max_column) the way openpyxl derives them.
+
+        openpyxl counts every stored cell plus the placeholder cells it
+        creates for merged ranges.
+
+        Args:
+            merged_ranges: Merged range bounds.
+
+        Returns:
+            (max_row, max_column), at least (1, 1).
+        """
+        max_row, max_col = self.seen_row, self.seen_col
+        for bounds in merged_ranges:
+            max_row = max(max_row, bounds[2])
+            max_col = max(max_col, bounds[3])
+        return max_row, max_col
+
+
+def _clear_non_anchor_in_row(
+    rows: list[list[Any]],
+    fmt_rows: list[list[int] | None],
+    bounds: MergeBounds,
+    row_idx: int,
+) -> None:
+    """Blank the non-anchor cells of a merged range within one row.
+
+    Args:
+        rows: Value grid (mutated).
+        fmt_rows: Format id grid (mutated).
+        bounds: Merged range bounds covering ``row_idx``.
+        row_idx: 1-based row to clear.
+    """
+    if row_idx > len(rows):
+        return
+    min_row, min_col, _, max_col = bounds
+    first_col = min_col + 1 if row_idx == min_row else min_col
+    values = rows[row_idx - 1]
+    for col_idx in range(first_col, min(max_col, len(values)) + 1):
+        values[col_idx - 1] = None
+    while values and values[-1] is None:
+        values.pop()
+    fmt_row = fmt_rows[row_idx - 1]
+    if fmt_row is not None:
+        for col_idx in range(first_col, min(max_col, len(fmt_row)) + 1):
+            fmt_row[col_idx - 1] = _GENERAL_ID
+
+
+def _clear_non_anchor(
+    rows: list[list[Any]],
+    fmt_rows: list[list[int] | None],
+    bounds: MergeBounds,
+) -> None:
+    """Blank every non-anchor cell of a merged range (value None, General).
+
+    Args:
+        rows: Value grid (mutated).
+        fmt_rows: Format id grid (mutated).
+        bounds: Merged range bounds.
+    """
+    min_row, min_col, max_row, max_col = bounds
+    for row_idx in range(min_row, min(max_row, len(rows)) + 1):
+        first_col = min_col + 1 if row_idx == min_row else min_col
+        values = rows[row_idx - 1]
+        for col_idx in range(first_col, min(max_col, len(values)) + 1):
+            values[col_idx - 1] = None
+        fmt_row = fmt_rows[row_idx - 1]
+        if fmt_row is not None:
+            for col_idx in range(first_col, min(max_col, len(fmt_row)) + 1):
+                fmt_row[col_idx - 1] = _GENERAL_ID
+
+
+def _trim(rows: list[list[Any]]) -> None:
+    """Drop trailing None values from each row and trailing empty rows.
+
+    Args:
+        rows: Value grid (mutated).
+    """
+    for values in rows:
+        while values and values[-1] is None:
+            values.pop()
+    while rows and not rows[-1]:
+        rows.pop()
+
+
+def _data_extent(rows: list[list[Any]], merged_ranges: list[MergeBounds]) -> tuple[int, int]:
+    """Compute the last data row and column of a snapshot.
+
+    Args:
+        rows: Trimmed value grid.
+        merged_ranges: Merged range bounds.
+
+    Returns:
+        (data_max_row, data_max_column).
+    """
+    max_row = len(rows)
+    max_col = max((len(values) for values in rows), default=0)
+    for min_r, min_c, max_r, max_c in merged_ranges:
+        # Reason: Non-anchor cells of a merge with a value propagate that
+        # value (FR-010), so the whole range is data even though only the
+        # anchor is stored.
+        if min_r <= len(rows) and min_c <= len(rows[min_r - 1]) and rows[min_r - 1][min_c - 1] is not None:
+            max_row = max(max_row, max_r)
+            max_col = max(max_col, max_c)
+    return max_row, max_col
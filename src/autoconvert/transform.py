@@ -1,18 +1,32 @@
-"""transform — FR-018, FR-019, FR-020: Currency/country conversion and PO number cleaning."""
+"""transform — FR-018, FR-019, FR-020: Currency/country conversion and PO number cleaning.
+
+An invoice repeats a handful of currencies, countries and POs over thousands
+of lines, so each lookup and PO cleaning runs once per distinct raw value and
+the result is mapped back to the items.  Unmatched values produce one warning
+per normalized value, with the occurrence count and a sample of rows.
+"""
 
 import logging
 
 from .errors import ProcessingError, WarningCode
-from .models import AppConfig, InvoiceItem
+from .models import AppConfig, InvoiceRecord
 from .utils import normalize_lookup_key
 
 logger = logging.getLogger(__name__)
 
+# Rows listed in an ATT_003/ATT_004 warning; the count covers the rest.
+_ROW_SAMPLE_SIZE = 5
+
+_WARNING_NAMES = {
+    WarningCode.ATT_003: "UNSTANDARDIZED_CURRENCY",
+    WarningCode.ATT_004: "UNSTANDARDIZED_COO",
+}
+
 
 def convert_currency(
-    items: list[InvoiceItem],
+    items: list[InvoiceRecord],
     config: AppConfig,
-) -> tuple[list[InvoiceItem], list[ProcessingError]]:
+) -> tuple[list[InvoiceRecord], list[ProcessingError]]:
     """Lookup currency -> numeric code; return warnings ATT_003 for unmatched.
 
     Args:
@@ -22,36 +36,27 @@ def convert_currency(
     Returns:
         Tuple of (updated items list, list of ATT_003 warnings for unmatched values).
         Matched items have currency replaced with Target_Code string.
-        Unmatched items preserve original currency value.
+        Unmatched items preserve original currency value; there is one
+        warning per distinct normalized value.
     """
-    warnings: list[ProcessingError] = []
+    resolved = _lookup_distinct([item.currency for item in items], config.currency_lookup, "currency")
+    unmatched: dict[str, list[int]] = {}
 
     for item in items:
-        raw = item.currency
-        normalized = normalize_lookup_key(raw)
-        logger.debug("currency lookup: raw=%r normalized=%r", raw, normalized)
-
-        if normalized in config.currency_lookup:
-            target = config.currency_lookup[normalized]
-            logger.debug("currency matched: %r -> %r", raw, target)
+        normalized, target = resolved[item.currency]
+        if target is not None:
             item.currency = target
         else:
-            msg = f"Currency value {raw!r} (normalized: {normalized!r}) not found in currency_lookup"
-            logger.warning("[ATT_003] UNSTANDARDIZED_CURRENCY: %s", msg)
-            warning = ProcessingError(
-                code=WarningCode.ATT_003,
-                message=msg,
-                context={"raw_value": raw, "normalized_key": normalized},
-            )
-            warnings.append(warning)
+            unmatched.setdefault(normalized, []).append(item.row)
 
+    warnings = _unmatched_warnings(resolved, unmatched, WarningCode.ATT_003, "Currency", "currency_lookup")
     return items, warnings
 
 
 def convert_country(
-    items: list[InvoiceItem],
+    items: list[InvoiceRecord],
     config: AppConfig,
-) -> tuple[list[InvoiceItem], list[ProcessingError]]:
+) -> tuple[list[InvoiceRecord], list[ProcessingError]]:
     """Lookup COO -> numeric code; return warnings ATT_004 for unmatched.
 
     Args:
@@ -61,35 +66,26 @@ def convert_country(
     Returns:
         Tuple of (updated items list, list of ATT_004 warnings for unmatched values).
         Matched items have coo replaced with Target_Code string.
-        Unmatched items preserve original coo value.
+        Unmatched items preserve original coo value; there is one warning
+        per distinct normalized value.
     """
-    warnings: list[ProcessingError] = []
+    resolved = _lookup_distinct([item.coo for item in items], config.country_lookup, "country")
+    unmatched: dict[str, list[int]] = {}
 
     for item in items:
-        raw = item.coo
-        normalized = normalize_lookup_key(raw)
-        logger.debug("country lookup: raw=%r normalized=%r", raw, normalized)
-
-        if normalized in config.country_lookup:
-            target = config.country_lookup[normalized]
-            logger.debug("country matched: %r -> %r", raw, target)
+        normalized, target = resolved[item.coo]
+        if target is not None:
             item.coo = target
         else:
-            msg = f"COO value {raw!r} (normalized: {normalized!r}) not found in country_lookup"
-            logger.warning("[ATT_004] UNSTANDARDIZED_COO: %s", msg)
-            warning = ProcessingError(
-                code=WarningCode.ATT_004,
-                message=msg,
-                context={"raw_value": raw, "normalized_key": normalized},
-            )
-            warnings.append(warning)
+            unmatched.setdefault(normalized, []).append(item.row)
 
+    warnings = _unmatched_warnings(resolved, unmatched, WarningCode.ATT_004, "COO", "country_lookup")
     return items, warnings
 
 
 def clean_po_number(
-    items: list[InvoiceItem],
-) -> list[InvoiceItem]:
+    items: list[InvoiceRecord],
+) -> list[InvoiceRecord]:
     """Strip suffix after first '-', '.', '/' delimiter; preserve if empty result.
 
     Args:
@@ -99,8 +95,13 @@ def clean_po_number(
         List of items with po_no cleaned. Items with po_no already empty or
         with delimiter at position 0 are unchanged.
     """
+    cleaned: dict[str, str] = {}
     for item in items:
-        item.po_no = _clean_po(item.po_no)
+        po_no = item.po_no
+        result = cleaned.get(po_no)
+        if result is None:
+            result = cleaned[po_no] = _clean_po(po_no)
+        item.po_no = result
     return items
 
 
@@ -109,6 +110,84 @@ def clean_po_number(
 # ---------------------------------------------------------------------------
 
 
+def _lookup_distinct(
+    raw_values: list[str],
+    lookup: dict[str, str],
+    label: str,
+) -> dict[str, tuple[str, str | None]]:
+    """Normalize and look up each distinct raw value once.
+
+    Args:
+        raw_values: Raw field values of all items (with repeats).
+        lookup: Normalized key -> target code table.
+        label: Field name for debug logging ("currency" / "country").
+
+    Returns:
+        Dict of raw value -> (normalized key, target code or None if unmatched).
+    """
+    resolved: dict[str, tuple[str, str | None]] = {}
+    for raw in dict.fromkeys(raw_values):
+        normalized = normalize_lookup_key(raw)
+        target = lookup.get(normalized)
+        logger.debug("%s lookup: raw=%r normalized=%r", label, raw, normalized)
+        if target is not None:
+            logger.debug("%s matched: %r -> %r", label, raw, target)
+        resolved[raw] = (normalized, target)
+    return resolved
+
+
+def _unmatched_warnings(
+    resolved: dict[str, tuple[str, str | None]],
+    unmatched: dict[str, list[int]],
+    code: WarningCode,
+    label: str,
+    table: str,
+) -> list[ProcessingError]:
+    """Build and log one warning per unmatched normalized value.
+
+    Args:
+        resolved: Raw value -> (normalized key, target code or None) from _lookup_distinct().
+        unmatched: Normalized key -> rows of the unmatched items, in item order.
+        code: ATT_003 (currency) or ATT_004 (COO).
+        label: Field label for the message ("Currency" / "COO").
+        table: Lookup table name for the message.
+
+    Returns:
+        Warnings in order of first occurrence.
+    """
+    raw_by_key: dict[str, list[str]] = {}
+    for raw, (normalized, target) in resolved.items():
+        if target is None:
+            raw_by_key.setdefault(normalized, []).append(raw)
+
+    warnings: list[ProcessingError] = []
+    for normalized, rows in unmatched.items():
+        raw_values = raw_by_key[normalized]
+        sample = rows[:_ROW_SAMPLE_SIZE]
+        values = ", ".join(repr(raw) for raw in raw_values)
+        msg = f"{label} value {values} (normalized: {normalized!r}) not found in {table}"
+        if len(rows) > 1:
+            more = ", ..." if len(rows) > len(sample) else ""
+            msg += f" ({len(rows)} occurrences, rows {', '.join(map(str, sample))}{more})"
+        else:
+            msg += f" (row {rows[0]})"
+        logger.warning("[%s] %s: %s", code.value, _WARNING_NAMES[code], msg)
+        warnings.append(
+            ProcessingError(
+                code=code,
+                message=msg,
+                context={
+                    "raw_value": raw_values[0],
+                    "raw_values": raw_values,
+                    "normalized_key": normalized,
+                    "occurrences": len(rows),
+                    "rows": sample,
+                },
+            )
+        )
+    return warnings
+
+
 def _clean_po(po_no: str) -> str:
     """Clean a single PO number by stripping after the first delimiter.
 
@@ -0,0 +1,164 @@
+"""watch — Watch mode: process files as they arrive in ``data/``.
+
+Keeps the loaded ``AppConfig`` in memory and polls ``data/`` for new or
+modified ``.xlsx``/``.xls`` files using only ``os.stat`` (mtime + size), so it
+works on network shares without inotify.  A file is processed once its
+signature has been unchanged for ``stable_polls`` consecutive polls, which
+avoids picking up files that are still being copied.  Outputs accumulate in
+``data/finished/`` (never cleared) and a rolling summary is logged after
+every file.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from . import batch as _batch
+from .models import AppConfig, BatchResult, FileResult
+from .report import print_batch_summary
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_POLL_INTERVAL = 2.0
+_DEFAULT_STABLE_POLLS = 2
+
+# (st_mtime_ns, st_size) — cheap change signature for one file.
+_Signature = tuple[int, int]
+
+
+def watch_directory(
+    config: AppConfig,
+    poll_interval: float = _DEFAULT_POLL_INTERVAL,
+    stable_polls: int = _DEFAULT_STABLE_POLLS,
+    max_polls: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> BatchResult:
+    """Poll data/ and run process_file on each new or modified file once it is stable.
+
+    Runs until interrupted (KeyboardInterrupt) or until ``max_polls`` polls
+    have completed, then prints the batch summary of the latest result per
+    file.
+
+    Args:
+        config: Application configuration, loaded once and reused for every file.
+        poll_interval: Seconds to sleep between polls.
+        stable_polls: Number of consecutive polls a file's (mtime, size) must
+            stay identical before it is processed (minimum 1).
+        max_polls: Stop after this many polls; None watches until interrupted.
+        sleep: Sleep function (injectable for tests).
+
+    Returns:
+        BatchResult with the latest FileResult of every processed file,
+        sorted by filename.
+    """
+    _batch._ensure_directories()  # noqa: SLF001
+    logger.info("Watching %s for new files (poll every %.1fs) ...", _batch._DATA_DIR, poll_interval)  # noqa: SLF001
+
+    processed: dict[str, _Signature] = {}
+    candidates: dict[str, tuple[_Signature, int]] = {}
+    latest: dict[str, FileResult] = {}
+    busy_time = 0.0
+    polls = 0
+
+    try:
+        while max_polls is None or polls < max_polls:
+            polls += 1
+            present: set[str] = set()
+            for filepath in _batch._scan_files():  # noqa: SLF001
+                present.add(filepath.name)
+                signature = _signature(filepath)
+                if signature is None or processed.get(filepath.name) == signature:
+                    continue
+
+                previous = candidates.get(filepath.name)
+                count = previous[1] + 1 if previous is not None and previous[0] == signature else 1
+                if count < max(stable_polls, 1):
+                    candidates[filepath.name] = (signature, count)
+                    continue
+
+                candidates.pop(filepath.name, None)
+                start = time.monotonic()
+                logger.info(_batch._SEPARATOR)  # noqa: SLF001
+                logger.info("[watch] Processing: %s ...", filepath.name)
+                latest[filepath.name] = _batch.process_file(filepath, config)
+                busy_time += time.monotonic() - start
+                processed[filepath.name] = signature
+                _log_rolling_summary(latest)
+
+            # Reason: Forget removed files so a later file with the same name
+            # is treated as new.
+            for name in list(processed):
+                if name not in present:
+                    del processed[name]
+            for name in list(candidates):
+                if name not in present:
+                    del candidates[name]
+
+            if max_polls is None or polls < max_polls:
+                sleep(poll_interval)
+    except KeyboardInterrupt:
+        logger.info("Watch mode stopped.")
+
+    batch_result = _build_result(latest, busy_time)
+    print_batch_summary(batch_result)
+    return batch_result
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _signature(filepath: Path) -> _Signature | None:
+    """Return (mtime_ns, size) for a file, or None if it vanished meanwhile.
+
+    Args:
+        filepath: File to stat.
+
+    Returns:
+        The change signature, or None on OSError.
+    """
+    try:
+        file_stat = filepath.stat()
+    except OSError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _log_rolling_summary(latest: dict[str, FileResult]) -> None:
+    """Log one line with the running status counts over all processed files.
+
+    Args:
+        latest: Latest FileResult per filename.
+    """
+    statuses = [r.status for r in latest.values()]
+    logger.info(
+        "[watch] %d file(s) so far: %d success, %d attention, %d failed",
+        len(statuses),
+        statuses.count("Success"),
+        statuses.count("Attention"),
+        statuses.count("Failed"),
+    )
+
+
+def _build_result(latest: dict[str, FileResult], busy_time: float) -> BatchResult:
+    """Build a BatchResult from the latest result per file.
+
+    Args:
+        latest: Latest FileResult per filename.
+        busy_time: Total seconds spent inside process_file.
+
+    Returns:
+        BatchResult sorted by filename.
+    """
+    results = [latest[name] for name in sorted(latest)]
+    return BatchResult(
+        total_files=len(results),
+        success_count=sum(1 for r in results if r.status == "Success"),
+        attention_count=sum(1 for r in results if r.status == "Attention"),
+        failed_count=sum(1 for r in results if r.status == "Failed"),
+        processing_time=busy_time,
+        file_results=results,
+        log_path=str((_batch._DATA_DIR / "process_log.txt").resolve()),  # noqa: SLF001
+    )
@@ -1,10 +1,15 @@
-"""weight_alloc — FR-021 through FR-026: Weight aggregation, rounding, allocation, and validation."""
+"""weight_alloc — FR-021 through FR-026: Weight aggregation, rounding, allocation, and validation.
+
+Precision search, rounding and proportional shares are computed on integer
+units of 10**-precision kg; Decimals are only built for the returned values.
+"""
 
 import logging
-from decimal import Decimal
+from decimal import Decimal, DivisionByZero, DivisionUndefined
 
 from .errors import ErrorCode, ProcessingError
-from .models import InvoiceItem, PackingItem, PackingTotals
+from .models import InvoiceRecord, PackingRecord, PackingTotals
+from .numeric import EPSILON, SCALE, SHARE_LIMIT, TIE_MARGIN, round_units, units_to_decimal
 from .utils import WEIGHT_PRECISION_MAX, WEIGHT_PRECISION_MIN, round_half_up
 
 logger = logging.getLogger(__name__)
@@ -23,11 +28,11 @@ _ZERO = Decimal("0")
 
 
 def _aggregate_weights(
-    packing_items: list[PackingItem],
+    packing_items: list[PackingRecord],
 ) -> tuple[dict[str, Decimal], dict[str, Decimal]]:
     """Aggregate NW and QTY by part_no from packing items (FR-021).
 
-    Sums PackingItem.nw directly — continuation rows already have nw=0.0
+    Sums PackingRecord.nw directly — continuation rows already have nw=0.0
     from extract_packing.py, so no filtering by is_first_row_of_merge is needed.
 
     Args:
@@ -138,6 +143,11 @@ def _determine_precision(
       If any weight rounds to zero at chosen precision, escalate +1
       up to max 5. If still zero at 5 -> ERR_044.
 
+    Both steps are computed in a single pass over the parts on integer
+    units: the rounded sums at N and N+1, and for each part the lowest
+    precision at which it no longer rounds to zero.  Rounding is monotone
+    in the precision, so the zero check escalates to the largest of those.
+
     Args:
         weight_by_part: Aggregated weights by part_no.
         total_nw: Total NW from packing totals.
@@ -149,68 +159,70 @@ def _determine_precision(
     Raises:
         ProcessingError: ERR_044 if any weight rounds to zero at max precision 5.
     """
-    weights = list(weight_by_part.values())
+    precision_n1 = min(base_precision + 1, WEIGHT_PRECISION_MAX)
+    sum_n = 0
+    sum_n1 = 0
+    nonzero_from = base_precision
+    zero_parts: list[str] = []
+
+    for part_no, weight in weight_by_part.items():
+        value = float(weight)
+        units_n = round_units(value, base_precision)
+        units_n1 = round_units(value, precision_n1)
+        sum_n += units_n
+        sum_n1 += units_n1
+        if units_n:
+            continue
+        units = units_n1
+        current = precision_n1
+        while not units and current < WEIGHT_PRECISION_MAX:
+            current += 1
+            units = round_units(value, current)
+        if units:
+            nonzero_from = max(nonzero_from, current)
+        else:
+            zero_parts.append(part_no)
 
     # Step 1: Sum matching
     precision = base_precision
     logger.info("Trying precision: %d", precision)
+    logger.info("Expecting rounded part sum: %s, Target: %s", Decimal(sum_n).scaleb(-precision), total_nw)
 
-    rounded_at_n = [round_half_up(w, precision) for w in weights]
-    rounded_sum_n = sum(rounded_at_n, _ZERO)
-    logger.info("Expecting rounded part sum: %s, Target: %s", rounded_sum_n, total_nw)
-
-    if rounded_sum_n == total_nw:
+    if total_nw.scaleb(precision) == sum_n:
         logger.info("Perfect match at %d decimals", precision)
     else:
         # Try N+1
-        precision_n1 = min(base_precision + 1, WEIGHT_PRECISION_MAX)
         logger.info("Trying precision: %d", precision_n1)
-
-        rounded_at_n1 = [round_half_up(w, precision_n1) for w in weights]
-        rounded_sum_n1 = sum(rounded_at_n1, _ZERO)
         logger.info(
             "Expecting rounded part sum: %s, Target: %s",
-            rounded_sum_n1,
+            Decimal(sum_n1).scaleb(-precision_n1),
             total_nw,
         )
 
-        if rounded_sum_n1 == total_nw:
+        if total_nw.scaleb(precision_n1) == sum_n1:
             logger.info("Perfect match at %d decimals", precision_n1)
-            precision = precision_n1
-        else:
-            # Use N+1 with remainder correction (FR-024 will handle it)
-            precision = precision_n1
+        # Either a match or N+1 with remainder correction (FR-024 handles it)
+        precision = precision_n1
 
     # Step 2: Zero check (independent — may escalate further)
-    current = precision
-    while current <= WEIGHT_PRECISION_MAX:
-        rounded = [round_half_up(w, current) for w in weights]
-        if all(r != _ZERO for r in rounded):
-            break
-        if current == WEIGHT_PRECISION_MAX:
-            # Collect all offending parts
-            zero_parts = [pn for pn, w in weight_by_part.items() if round_half_up(w, WEIGHT_PRECISION_MAX) == _ZERO]
-            max_prec = WEIGHT_PRECISION_MAX
-            msg = f"Weight rounds to zero at max precision {max_prec} for part_no(s): {', '.join(zero_parts)}"
-            logger.error(
-                "[%s] %s: %s",
-                ErrorCode.ERR_044.value,
-                ErrorCode.ERR_044.name,
-                msg,
-            )
-            raise ProcessingError(
-                code=ErrorCode.ERR_044,
-                message=msg,
-                context={"part_nos": zero_parts, "precision": WEIGHT_PRECISION_MAX},
-            )
-        current += 1
+    if zero_parts:
+        max_prec = WEIGHT_PRECISION_MAX
+        msg = f"Weight rounds to zero at max precision {max_prec} for part_no(s): {', '.join(zero_parts)}"
+        logger.error(
+            "[%s] %s: %s",
+            ErrorCode.ERR_044.value,
+            ErrorCode.ERR_044.name,
+            msg,
+        )
+        raise ProcessingError(
+            code=ErrorCode.ERR_044,
+            message=msg,
+            context={"part_nos": zero_parts, "precision": WEIGHT_PRECISION_MAX},
+        )
 
     # Reason: The zero check may have escalated precision beyond the sum-matching
     # result. We use the escalated value so no parts round to zero.
-    if current > precision:
-        precision = current
-
-    return precision
+    return max(precision, nonzero_from)
 
 
 def _round_with_remainder(
@@ -232,16 +244,21 @@ def _round_with_remainder(
         ProcessingError: ERR_041 if sum still does not equal total_nw after correction.
     """
     rounded: dict[str, Decimal] = {}
+    units_sum = 0
     for part_no, weight in weight_by_part.items():
-        rounded[part_no] = round_half_up(weight, precision)
+        units = round_units(float(weight), precision)
+        units_sum += units
+        rounded[part_no] = units_to_decimal(units, precision)
 
-    # Remainder correction on the last part (dict insertion order)
-    rounded_sum = sum(rounded.values(), _ZERO)
-    remainder = total_nw - rounded_sum
+    if total_nw.scaleb(precision) == units_sum:
+        return rounded
 
-    if remainder != _ZERO:
-        last_key = list(rounded.keys())[-1]
-        rounded[last_key] = rounded[last_key] + remainder
+    # Remainder correction on the last part (dict insertion order).
+    # Reason: Done on the Decimals so the corrected value keeps the exponent
+    # (and thus the written representation) it has always had.
+    remainder = total_nw - sum(rounded.values(), _ZERO)
+    last_key = list(rounded.keys())[-1]
+    rounded[last_key] = rounded[last_key] + remainder
 
     # Defensive guard: verify sum == total_nw
     final_sum = sum(rounded.values(), _ZERO)
@@ -262,11 +279,38 @@ def _round_with_remainder(
     return rounded
 
 
+def _share_units(part_value: float, qty_value: float, total_value: float, decimals: int) -> int | None:
+    """Round an item's proportional share in float arithmetic, if that is conclusive.
+
+    The float product differs from the exact Decimal formula by a few ulps
+    at most, which only matters when the scaled value sits right at a .5
+    tie; those (and negative or out-of-range values) return None for the exact
+    Decimal formula.
+
+    Args:
+        part_value: Rounded part weight as float.
+        qty_value: Item qty as float.
+        total_value: Non-zero total qty of the part's items as float.
+        decimals: Line precision.
+
+    Returns:
+        The rounded share in 10**-decimals units, or None.
+    """
+    scaled = part_value * (qty_value / total_value) * SCALE[decimals] + EPSILON
+    if not 0.0 <= scaled < SHARE_LIMIT:
+        return None
+    whole = int(scaled)
+    fraction = scaled - whole
+    if abs(fraction - 0.5) <= TIE_MARGIN * (scaled + 1.0):
+        return None
+    return whole + 1 if fraction > 0.5 else whole
+
+
 def _allocate_to_invoice_items(
-    invoice_items: list[InvoiceItem],
+    invoice_items: list[InvoiceRecord],
     rounded_weights: dict[str, Decimal],
     packing_precision: int,
-) -> list[InvoiceItem]:
+) -> list[InvoiceRecord]:
     """Proportionally allocate part weights to invoice items (FR-025).
 
     Matches by part_no (exact match after whitespace strip).
@@ -328,23 +372,33 @@ def _allocate_to_invoice_items(
     # Allocate proportionally for each part
     for part_no, part_weight in rounded_weights.items():
         indices = invoice_parts[part_no]
-        total_qty = sum(invoice_items[i].qty for i in indices)
+        last = len(indices) - 1
+        total_qty = sum((invoice_items[i].qty for i in indices), _ZERO)
+        if not total_qty:
+            # Reason: A zero qty total has always surfaced as the Decimal error
+            # of item.qty / total_qty in the proportional formula (0/0 is
+            # undefined, anything else divides by zero); raise it explicitly.
+            first_qty = invoice_items[indices[0]].qty
+            error = DivisionUndefined if not first_qty else DivisionByZero
+            raise error(f"Invoice qty of part_no '{part_no}' sums to zero")
+        part_value = float(part_weight)
+        total_value = float(total_qty)
 
         allocated_sum = _ZERO
         for i, idx in enumerate(indices):
             item = invoice_items[idx]
-            # Reason: Proportional allocation formula uses Decimal division
-            # to avoid float precision loss.
-            raw = part_weight * (item.qty / total_qty)
-            rounded_val = round_half_up(raw, line_precision)
-
-            if i < len(indices) - 1:
-                invoice_items[idx] = item.model_copy(update={"allocated_weight": rounded_val})
+            if i < last:
+                units = _share_units(part_value, float(item.qty), total_value, line_precision)
+                if units is None:
+                    rounded_val = round_half_up(part_weight * (item.qty / total_qty), line_precision)
+                else:
+                    rounded_val = units_to_decimal(units, line_precision)
+                item.allocated_weight = rounded_val
                 allocated_sum += rounded_val
             else:
                 # Last item gets the remainder
                 last_val = part_weight - allocated_sum
-                invoice_items[idx] = item.model_copy(update={"allocated_weight": last_val})
+                item.allocated_weight = last_val
 
     return invoice_items
 
@@ -355,10 +409,10 @@ def _allocate_to_invoice_items(
 
 
 def allocate_weights(
-    invoice_items: list[InvoiceItem],
-    packing_items: list[PackingItem],
+    invoice_items: list[InvoiceRecord],
+    packing_items: list[PackingRecord],
     packing_totals: PackingTotals,
-) -> list[InvoiceItem]:
+) -> list[InvoiceRecord]:
     """Full weight allocation pipeline (FR-021 through FR-026).
 
     Pipeline steps:
@@ -0,0 +1,80 @@
+"""workbook_loader — Sheet-selective .xlsx loading.
+
+``openpyxl.load_workbook`` parses the cell XML of every worksheet, yet the
+pipeline only ever reads the Invoice and Packing sheets.  Supplier files often
+carry many extra sheets (price history, pivots, charts), so this loader drives
+openpyxl's ``ExcelReader`` step by step instead:
+
+1. read ``[Content_Types].xml`` and ``xl/workbook.xml`` (sheet names only),
+2. pick the two sheets with ``sheet_detect.match_sheet_names`` — ERR_012 /
+   ERR_013 are raised here, before any cell XML is touched,
+3. read shared strings and styles, then parse just the matched worksheets.
+
+The returned Workbook contains only the matched sheets, in workbook order, so
+``detect_sheets`` resolves them exactly as it would on the full workbook.
+
+The step-by-step calls follow ``ExcelReader.read()`` of openpyxl 3.1.5 (the
+minimum pinned in pyproject.toml).  The parser's ``defined_names`` attribute
+is not part of openpyxl's typed API, so it is read defensively.
+"""
+
+import logging
+from pathlib import Path
+
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.styles.stylesheet import apply_stylesheet
+from openpyxl.workbook.workbook import Workbook
+
+from .models import AppConfig
+from .sheet_detect import match_sheet_names
+
+logger = logging.getLogger(__name__)
+
+
+def load_xlsx_sheets(filepath: Path, config: AppConfig) -> Workbook:
+    """Open an .xlsx file, parsing only its Invoice and Packing worksheets.
+
+    Cell values are loaded with ``data_only=True`` semantics (cached formula
+    results), matching ``openpyxl.load_workbook(filepath, data_only=True)``.
+
+    Args:
+        filepath: Path to the .xlsx file.
+        config: Application configuration with compiled sheet patterns.
+
+    Returns:
+        openpyxl Workbook holding only the matched sheet(s).
+
+    Raises:
+        ProcessingError: ERR_012 / ERR_013 if a sheet name does not match.
+        PermissionError: If the file is locked (mapped to ERR_010 by the caller).
+        Exception: Any other openpyxl/zipfile error propagates unchanged so
+            that the caller can map it to ERR_011.
+    """
+    reader = ExcelReader(filepath, read_only=False, keep_vba=False, data_only=True, keep_links=False)
+    try:
+        reader.read_manifest()
+        reader.read_workbook()
+        sheet_names = [sheet.name for sheet in reader.parser.sheets]
+        wanted = set(match_sheet_names(sheet_names, config))
+        logger.debug("Loading %d of %d sheet(s) from %s", len(wanted), len(sheet_names), filepath.name)
+
+        # Reason: read_worksheets() walks parser.sheets, so trimming the list
+        # is enough to keep openpyxl from opening the other sheet parts.
+        reader.parser.sheets = [sheet for sheet in reader.parser.sheets if sheet.name in wanted]
+        reader.read_strings()
+        reader.read_properties()
+        apply_stylesheet(reader.archive, reader.wb)
+        reader.read_worksheets()
+        # Reason: Sheet-scoped defined names are keyed by the original sheet
+        # index, which no longer lines up once sheets are skipped; the
+        # pipeline never reads them, so only workbook-level names are kept.
+        # The parser attribute is untyped openpyxl internals: if a release
+        # drops it, the workbook simply keeps no defined names.
+        defined_names = getattr(reader.parser, "defined_names", None)
+        by_sheet = getattr(defined_names, "by_sheet", None)
+        global_names = by_sheet().get("global") if by_sheet is not None else None
+        if global_names is not None:
+            reader.wb.defined_names = global_names
+    finally:
+        reader.archive.close()
+    return reader.wb
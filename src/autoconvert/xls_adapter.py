@@ -1,12 +1,28 @@
-"""xls_adapter — FR-003: Convert .xls files to in-memory openpyxl Workbook via xlrd."""
+"""xls_adapter — FR-003: Read legacy .xls files via xlrd.
+
+Two entry points:
+
+- ``open_xls_workbook`` returns an ``XlsWorkbook`` facade over an xlrd Book
+  opened with ``on_demand=True``.  It exposes the small openpyxl surface the
+  pipeline reads (``sheetnames``, ``wb[name]``, ``cell().value``,
+  ``number_format``, ``max_row``, ``max_column``, ``merged_cells.ranges``,
+  ``iter_rows()``), so only the sheets actually looked up are parsed and no
+  openpyxl cells are created.
+- ``convert_xls_to_xlsx`` rebuilds the whole file as an openpyxl Workbook.
+"""
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, cast
 
 import xlrd
 from openpyxl import Workbook
+from openpyxl.worksheet.cell_range import CellRange
 from xlrd import (
+    XL_CELL_BLANK,
     XL_CELL_BOOLEAN,
     XL_CELL_DATE,
     XL_CELL_EMPTY,
@@ -19,6 +35,198 @@ from xlrd import (
 
 logger = logging.getLogger(__name__)
 
+# Reason: Number formats are not carried over from .xls files (same as
+# convert_xls_to_xlsx), so every cell reports openpyxl's default format.
+_GENERAL = "General"
+
+# Book datemode: 0 = 1900-based, 1 = 1904-based (what xldate_as_datetime accepts).
+_DateMode = Literal[0, 1]
+
+
+class XlsCell:
+    """Read-only cell of an ``XlsWorksheet``, shaped like an openpyxl Cell."""
+
+    __slots__ = ("row", "column", "value")
+
+    number_format = _GENERAL
+
+    def __init__(self, row: int, column: int, value: Any) -> None:
+        """Create a cell.
+
+        Args:
+            row: 1-based row.
+            column: 1-based column.
+            value: Converted cell value (see _convert_value).
+        """
+        self.row = row
+        self.column = column
+        self.value = value
+
+
+class _MergedCells:
+    """Holder for ``XlsWorksheet.merged_cells`` (mirrors openpyxl's MultiCellRange)."""
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, ranges: list[CellRange]) -> None:
+        """Store the merged ranges.
+
+        Args:
+            ranges: Merged ranges in 1-based inclusive coordinates.
+        """
+        self.ranges = ranges
+
+
+class XlsWorksheet:
+    """openpyxl-shaped, read-only view of one xlrd sheet.
+
+    Values are converted on access; merged non-anchor cells read as None,
+    as they do after openpyxl's ``merge_cells``.
+    """
+
+    def __init__(self, sheet: xlrd.sheet.Sheet, datemode: _DateMode) -> None:
+        """Wrap a loaded xlrd sheet.
+
+        Args:
+            sheet: Loaded xlrd Sheet (opened with formatting_info=True).
+            datemode: Book datemode (0 = 1900-based, 1 = 1904-based).
+        """
+        self._sheet = sheet
+        self._datemode: _DateMode = datemode
+        self.title: str = sheet.name
+        ranges: list[CellRange] = []
+        # 1-based coordinates of merged non-anchor cells.
+        self._covered: set[tuple[int, int]] = set()
+        for rlo, rhi, clo, chi in sheet.merged_cells:
+            # xlrd bounds are 0-based with exclusive ends, so (rlo + 1, rhi)
+            # is the 1-based inclusive row span (likewise for columns).
+            ranges.append(CellRange(min_col=clo + 1, min_row=rlo + 1, max_col=chi, max_row=rhi))
+            self._covered.update((row, col) for row in range(rlo + 1, rhi + 1) for col in range(clo + 1, chi + 1))
+            self._covered.discard((rlo + 1, clo + 1))
+        self.merged_cells = _MergedCells(ranges)
+        # Reason: openpyxl counts merge placeholders in max_row/max_column
+        # and never reports less than 1.
+        self.max_row: int = max([1, sheet.nrows] + [cell_range.max_row for cell_range in ranges])
+        self.max_column: int = max([1, sheet.ncols] + [cell_range.max_col for cell_range in ranges])
+
+    def cell(self, row: int, column: int) -> XlsCell:
+        """Return the cell at a 1-based position (empty outside the sheet).
+
+        Args:
+            row: 1-based row.
+            column: 1-based column.
+
+        Returns:
+            The cell.
+        """
+        sheet = self._sheet
+        value = None
+        if row <= sheet.nrows and column <= sheet.ncols and (row, column) not in self._covered:
+            xl_row, xl_col = row - 1, column - 1
+            value = _convert_value(sheet.cell_type(xl_row, xl_col), sheet.cell_value(xl_row, xl_col), self._datemode)
+        return XlsCell(row, column, value)
+
+    def iter_rows(self) -> Iterator[list[XlsCell]]:
+        """Yield each row's non-empty cells.
+
+        Yields:
+            Lists of cells holding a value, one list per sheet row.
+        """
+        sheet = self._sheet
+        covered = self._covered
+        datemode = self._datemode
+        for xl_row in range(sheet.nrows):
+            row = xl_row + 1
+            cells: list[XlsCell] = []
+            for xl_col, (ctype, raw) in enumerate(zip(sheet.row_types(xl_row), sheet.row_values(xl_row))):
+                if ctype in (XL_CELL_EMPTY, XL_CELL_BLANK) or (row, xl_col + 1) in covered:
+                    continue
+                value = _convert_value(ctype, raw, datemode)
+                if value is not None:
+                    cells.append(XlsCell(row, xl_col + 1, value))
+            yield cells
+
+
+class XlsWorkbook:
+    """openpyxl-shaped, read-only view of an xlrd Book opened on demand.
+
+    Sheets are parsed the first time they are looked up with ``wb[name]``;
+    ``close()`` unloads them and releases the file.  Usable as a context
+    manager.
+    """
+
+    def __init__(self, book: xlrd.Book) -> None:
+        """Wrap an xlrd Book.
+
+        Args:
+            book: xlrd Book opened with ``on_demand=True``.
+        """
+        self._book = book
+        self._datemode: _DateMode = _book_datemode(book)
+        self._sheets: dict[str, XlsWorksheet] = {}
+        self.sheetnames: list[str] = book.sheet_names()
+
+    def __getitem__(self, name: str) -> XlsWorksheet:
+        """Load (once) and return the named sheet.
+
+        Args:
+            name: Sheet name as listed in ``sheetnames``.
+
+        Returns:
+            The sheet facade.
+
+        Raises:
+            KeyError: If no sheet has that name.
+        """
+        sheet = self._sheets.get(name)
+        if sheet is None:
+            if name not in self.sheetnames:
+                raise KeyError(f"Worksheet {name} does not exist.")
+            sheet = self._sheets[name] = XlsWorksheet(self._book.sheet_by_name(name), self._datemode)
+        return sheet
+
+    def close(self) -> None:
+        """Unload every parsed sheet and release the underlying file."""
+        for index, name in enumerate(self.sheetnames):
+            if self._book.sheet_loaded(index):
+                self._book.unload_sheet(name)
+        self._sheets.clear()
+        self._book.release_resources()
+
+    def __enter__(self) -> "XlsWorkbook":
+        """Return self."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the workbook."""
+        self.close()
+
+
+def open_xls_workbook(filepath: Path) -> XlsWorkbook:
+    """Open a legacy .xls file without parsing any sheet yet.
+
+    Args:
+        filepath: Path to the .xls file.
+
+    Returns:
+        XlsWorkbook facade; close it (or use it as a context manager) when done.
+
+    Raises:
+        Exception: Any exception raised by xlrd propagates unchanged so that
+            the caller (batch.py) can map it to ERR_011.
+    """
+    # formatting_info=True is required for xlrd 2.x to populate
+    # sheet.merged_cells; on_demand=True defers parsing each sheet until
+    # it is looked up.
+    book: xlrd.Book = open_workbook(str(filepath), formatting_info=True, on_demand=True)
+    logger.debug("Opened %s on demand (%d sheet(s))", filepath.name, book.nsheets)
+    return XlsWorkbook(book)
+
 
 def convert_xls_to_xlsx(filepath: Path) -> Workbook:
     """Convert a legacy .xls file to an in-memory openpyxl Workbook.
@@ -44,7 +252,7 @@ def convert_xls_to_xlsx(filepath: Path) -> Workbook:
     # Open the .xls workbook.  formatting_info=True is required for xlrd 2.x
     # to populate sheet.merged_cells; without it the list is always empty.
     book: xlrd.Book = open_workbook(str(filepath), formatting_info=True)
-    datemode: int = book.datemode
+    datemode = _book_datemode(book)
 
     wb = Workbook()
     # Remove the default empty sheet that openpyxl creates.
@@ -112,7 +320,19 @@ def convert_xls_to_xlsx(filepath: Path) -> Workbook:
 # ---------------------------------------------------------------------------
 
 
-def _convert_cell_value(cell: xlrd.sheet.Cell, datemode: int) -> str | float | bool | datetime | None:
+def _book_datemode(book: xlrd.Book) -> _DateMode:
+    """Return the datemode of an xlrd Book, typed as the 0/1 it always is.
+
+    Args:
+        book: The open xlrd Book.
+
+    Returns:
+        0 (1900-based) or 1 (1904-based).
+    """
+    return cast(_DateMode, book.datemode)
+
+
+def _convert_cell_value(cell: xlrd.sheet.Cell, datemode: _DateMode) -> str | float | bool | datetime | None:
     """Map an xlrd Cell to the Python value that openpyxl should store.
 
     Args:
@@ -128,24 +348,36 @@ def _convert_cell_value(cell: xlrd.sheet.Cell, datemode: int) -> str | float | b
         - XL_CELL_ERROR  -> None   (treat as empty, mirrors data_only=True)
         - XL_CELL_EMPTY  -> None
     """
-    ctype = cell.ctype
+    return _convert_value(cell.ctype, cell.value, datemode)
+
 
+def _convert_value(ctype: int, value: Any, datemode: _DateMode) -> str | float | bool | datetime | None:
+    """Convert a raw xlrd (cell type, value) pair; see _convert_cell_value.
+
+    Args:
+        ctype: xlrd cell type constant.
+        value: Raw xlrd cell value.
+        datemode: The datemode of the xlrd Book.
+
+    Returns:
+        The converted Python value.
+    """
     if ctype == XL_CELL_EMPTY:
         return None
     if ctype == XL_CELL_TEXT:
-        return str(cell.value)
+        return str(value)
     if ctype == XL_CELL_NUMBER:
         # xlrd always returns numbers as float; downstream modules handle
         # float-to-Decimal conversion (safe_decimal in utils.py).
-        return float(cell.value)
+        return float(value)
     if ctype == XL_CELL_DATE:
         # Reason: datemode is workbook-level (0 for 1900, 1 for 1904) and
         # must come from the Book object, not hardcoded, to correctly parse
         # dates from both Excel date systems.
-        return xldate_as_datetime(cell.value, datemode)
+        return xldate_as_datetime(value, datemode)
     if ctype == XL_CELL_BOOLEAN:
         # xlrd returns 0 or 1 for booleans; convert to Python bool.
-        return bool(cell.value)
+        return bool(value)
     if ctype == XL_CELL_ERROR:
         # Error cells (e.g. #DIV/0!, #VALUE!) are stored as None to mirror
         # openpyxl data_only=True semantics for formula-error cells.
@@ -0,0 +1,396 @@
+"""xlsx_reader — Fast .xlsx reader that builds SheetSnapshots from the sheet XML.
+
+openpyxl materializes a full object model (``Cell`` objects with style arrays,
+``MergedCell`` placeholders, row/column dimensions) that the pipeline copies
+into a ``SheetSnapshot`` and then discards.  This reader skips that model: it
+opens the zip, matches sheet names from ``xl/workbook.xml`` (ERR_012/ERR_013
+are raised before any cell XML is read), loads the shared string table and
+the ``cellXfs`` -> number format table, and hands each of the two matched
+worksheets to a ``LazySheetSnapshot``.
+
+Rows are parsed on demand: the snapshot pulls ``<row>`` elements from an
+incremental pull parser (lxml when installed, ElementTree otherwise) fed in
+small slices of the sheet XML, so rows below the point where extraction
+stops (total row plus the packets lookahead) are never parsed.  The part is
+still decompressed in full up front, because ``<mergeCells>`` follows
+``<sheetData>`` in the file and merges must be known before any row is read.
+
+Values follow openpyxl's ``data_only=True`` reading rules: cached formula
+results, int/float casting of numbers, date and time serials converted for
+date-formatted cells, shared/inline rich text flattened to plain text, and
+the number format string that ``cell.number_format`` would report.  Selected
+with ``--reader fast``; openpyxl remains the default.
+"""
+
+import logging
+import posixpath
+import re
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, cast
+from xml.etree import ElementTree
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_MAX_SIZE, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+from .models import AppConfig
+from .sheet_detect import match_sheet_names
+from .sheet_snapshot import CellTuple, LazySheetSnapshot, MergeBounds, SheetSnapshot
+
+try:
+    from lxml.etree import XMLPullParser, iterparse  # type: ignore[import-not-found]
+except ImportError:
+    from xml.etree.ElementTree import XMLPullParser, iterparse
+
+logger = logging.getLogger(__name__)
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_ROW_TAG = f"{_MAIN_NS}row"
+_CELL_TAG = f"{_MAIN_NS}c"
+_VALUE_TAG = f"{_MAIN_NS}v"
+_INLINE_TAG = f"{_MAIN_NS}is"
+_TEXT_TAG = f"{_MAIN_NS}t"
+_RUN_TAG = f"{_MAIN_NS}r"
+_SI_TAG = f"{_MAIN_NS}si"
+
+_OFFICE_DOCUMENT_REL = "/officeDocument"
+_SHARED_STRINGS_REL = "/sharedStrings"
+_STYLES_REL = "/styles"
+_WORKSHEET_REL = "/worksheet"
+
+_GENERAL = "General"
+_CELL_REF_RE = re.compile(r"([A-Za-z]+)(\d+)")
+_SHEET_DATA_OPEN_RE = re.compile(rb"<(?:\w+:)?sheetData\b[^>]*?(/?)>")
+_SHEET_DATA_CLOSE_RE = re.compile(rb"</(?:\w+:)?sheetData\s*>")
+_MERGE_REF_RE = re.compile(rb"""<(?:\w+:)?mergeCell\b[^>]*?\bref\s*=\s*["']([^"']+)["']""")
+
+# Reason: Bytes of sheet XML handed to the pull parser per step; small
+# enough that little is parsed past the last row a caller asks for.
+_FEED_CHUNK = 16 * 1024
+
+
+def read_xlsx_sheets(filepath: Path, config: AppConfig) -> tuple[SheetSnapshot, SheetSnapshot]:
+    """Read the Invoice and Packing sheets of an .xlsx file as snapshots.
+
+    Args:
+        filepath: Path to the .xlsx file.
+        config: Application configuration with compiled sheet patterns.
+
+    Returns:
+        (invoice snapshot, packing snapshot).  When one sheet matches both
+        patterns the packing snapshot shares the invoice grids without merges,
+        like ``process_file`` does for openpyxl-loaded workbooks.
+
+    Raises:
+        ProcessingError: ERR_012 / ERR_013 if a sheet name does not match.
+        PermissionError: If the file is locked (mapped to ERR_010 by the caller).
+        Exception: Any zip/XML error propagates unchanged so that the caller
+            can map it to ERR_011.
+    """
+    with zipfile.ZipFile(filepath) as archive:
+        book = _WorkbookIndex(archive)
+        inv_name, pack_name = match_sheet_names(book.sheet_names, config)
+
+        reader = _SheetReader(archive, book)
+        inv_snap = reader.read(inv_name)
+        if pack_name == inv_name:
+            pack_snap = inv_snap.without_merges()
+        else:
+            pack_snap = reader.read(pack_name)
+    return inv_snap, pack_snap
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+class _WorkbookIndex:
+    """Sheet names, sheet parts and auxiliary part paths from workbook.xml."""
+
+    def __init__(self, archive: zipfile.ZipFile) -> None:
+        """Parse the package and workbook relationships plus workbook.xml.
+
+        Args:
+            archive: Open xlsx archive.
+        """
+        names = set(archive.namelist())
+        workbook_part = "xl/workbook.xml"
+        for rel_type, target in _read_rels(archive, "_rels/.rels", "", names).values():
+            if rel_type.endswith(_OFFICE_DOCUMENT_REL):
+                workbook_part = target
+                break
+
+        base = posixpath.dirname(workbook_part)
+        rels_part = posixpath.join(base, "_rels", posixpath.basename(workbook_part) + ".rels")
+        rels = _read_rels(archive, rels_part, base, names)
+
+        root = ElementTree.fromstring(archive.read(workbook_part))
+        pr = root.find(f"{_MAIN_NS}workbookPr")
+        date1904 = pr is not None and pr.get("date1904", "").lower() in ("1", "true")
+        self.epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        self.sheet_names: list[str] = []
+        self.sheet_parts: dict[str, str | None] = {}
+        for sheet in root.iter(f"{_MAIN_NS}sheet"):
+            name = sheet.get("name", "")
+            rel = rels.get(sheet.get(f"{_DOC_REL_NS}id", ""))
+            self.sheet_names.append(name)
+            self.sheet_parts[name] = rel[1] if rel is not None and rel[0].endswith(_WORKSHEET_REL) else None
+
+        self.shared_strings_part: str | None = None
+        self.styles_part: str | None = None
+        for rel_type, target in rels.values():
+            if rel_type.endswith(_SHARED_STRINGS_REL) and target in names:
+                self.shared_strings_part = target
+            elif rel_type.endswith(_STYLES_REL) and target in names:
+                self.styles_part = target
+
+
+class _SheetReader:
+    """Streams worksheets of one archive into SheetSnapshots.
+
+    The shared string and style tables are loaded on the first ``read()``
+    and reused for the second sheet.
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, book: _WorkbookIndex) -> None:
+        """Bind the reader to an open archive.
+
+        Args:
+            archive: Open xlsx archive.
+            book: Index of the archive's workbook part.
+        """
+        self._archive = archive
+        self._book = book
+        self._strings: list[str] | None = None
+        self._style_formats: list[str] = []
+        self._date_styles: frozenset[int] = frozenset()
+        self._timedelta_styles: frozenset[int] = frozenset()
+
+    def read(self, sheet_name: str) -> LazySheetSnapshot:
+        """Prepare one worksheet for on-demand row parsing.
+
+        Args:
+            sheet_name: Sheet title as listed in workbook.xml.
+
+        Returns:
+            LazySheetSnapshot of the sheet; its merged ranges are already
+            known, its rows are parsed as they are read.
+
+        Raises:
+            ValueError: If the sheet is not a worksheet (e.g. a chartsheet)
+                or its part is missing or has no sheetData.
+        """
+        part = self._book.sheet_parts.get(sheet_name)
+        if part is None or part not in self._archive.namelist():
+            raise ValueError(f"sheet {sheet_name!r} has no worksheet part")
+        if self._strings is None:
+            self._load_tables()
+
+        data = self._archive.read(part)
+        opening = _SHEET_DATA_OPEN_RE.search(data)
+        if opening is None:
+            raise ValueError(f"sheet {sheet_name!r} has no sheetData")
+        if opening.group(1):
+            body_end = tail_start = opening.end()
+        else:
+            closing = _SHEET_DATA_CLOSE_RE.search(data, opening.end())
+            if closing is None:
+                raise ValueError(f"sheet {sheet_name!r} has an unterminated sheetData")
+            body_end, tail_start = closing.start(), closing.end()
+
+        merged: list[MergeBounds] = []
+        for ref in _MERGE_REF_RE.findall(data, tail_start):
+            min_col, min_row, max_col, max_row = range_boundaries(ref.decode("ascii"))
+            merged.append((min_row, min_col, max_row, max_col))  # type: ignore[arg-type]
+
+        rows = self._iter_rows(data, opening.end(), body_end) if not opening.group(1) else iter(())
+        return LazySheetSnapshot(sheet_name, rows, merged)
+
+    def _load_tables(self) -> None:
+        """Load the shared string table and the per-style number formats."""
+        strings: list[str] = []
+        part = self._book.shared_strings_part
+        if part is not None:
+            with self._archive.open(part) as src:
+                for _, elem in iterparse(src):
+                    if elem.tag == _SI_TAG:
+                        # Reason: openpyxl strips this escape from shared strings only.
+                        strings.append(_text_content(elem).replace("x005F_", ""))
+                        elem.clear()
+        self._strings = strings
+
+        if self._book.styles_part is None:
+            return
+        root = ElementTree.fromstring(self._archive.read(self._book.styles_part))
+        custom: dict[int, str] = {}
+        num_fmts = root.find(f"{_MAIN_NS}numFmts")
+        if num_fmts is not None:
+            for fmt in num_fmts.iter(f"{_MAIN_NS}numFmt"):
+                custom[int(fmt.get("numFmtId", "0"))] = fmt.get("formatCode", "")
+        cell_xfs = root.find(f"{_MAIN_NS}cellXfs")
+        style_formats: list[str] = []
+        date_styles: set[int] = set()
+        timedelta_styles: set[int] = set()
+        for idx, xf in enumerate(cell_xfs.iter(f"{_MAIN_NS}xf") if cell_xfs is not None else ()):
+            fmt_id = int(xf.get("numFmtId", "0"))
+            if fmt_id in custom:
+                code: str | None = custom[fmt_id]
+            else:
+                code = BUILTIN_FORMATS.get(fmt_id) if fmt_id < BUILTIN_FORMATS_MAX_SIZE else None
+            # Reason: Same classification openpyxl's stylesheet applies, so
+            # date serials convert for exactly the same cells.
+            if code is not None and is_date_format(code):
+                date_styles.add(idx)
+            if code is not None and is_timedelta_format(code):
+                timedelta_styles.add(idx)
+            style_formats.append(code or _GENERAL)
+        self._style_formats = style_formats
+        self._date_styles = frozenset(date_styles)
+        self._timedelta_styles = frozenset(timedelta_styles)
+
+    def _iter_rows(self, data: bytes, body_start: int, body_end: int) -> Iterator[tuple[int, list[CellTuple]]]:
+        """Parse ``<row>`` elements of sheetData lazily, one feed slice at a time.
+
+        Args:
+            data: Worksheet part bytes.
+            body_start: Offset just past the ``<sheetData>`` open tag.
+            body_end: Offset of the ``</sheetData>`` close tag.
+
+        Yields:
+            (row, [(row, col, value, number_format), ...]) per ``<row>``,
+            including empty styled cells.
+        """
+        strings = self._strings or []
+        style_formats = self._style_formats
+        date_styles = self._date_styles
+        timedelta_styles = self._timedelta_styles
+        epoch = self._book.epoch
+        col_cache: dict[str, int] = {}
+        row_idx = 0
+
+        parser = XMLPullParser(events=("end",))
+        # Reason: The text up to <sheetData> carries the root element and its
+        # namespace declarations; rows are appended to it slice by slice and
+        # the document is never closed.
+        parser.feed(data[:body_start])
+        pos = body_start
+        while pos < body_end:
+            parser.feed(data[pos : min(pos + _FEED_CHUNK, body_end)])
+            pos += _FEED_CHUNK
+            # Reason: Only "end" events are requested, and those always carry
+            # an element (lxml's has the ElementTree API); the stubs type
+            # read_events() for every event kind.
+            events = cast(Iterator[tuple[str, ElementTree.Element]], parser.read_events())
+            for _, elem in events:
+                if elem.tag != _ROW_TAG:
+                    continue
+
+                r = elem.get("r")
+                row_idx = int(float(r)) if r else row_idx + 1
+                col_idx = 0
+                cells: list[CellTuple] = []
+                for cell in elem:
+                    if cell.tag != _CELL_TAG:
+                        continue
+                    cell_row = row_idx
+                    ref = cell.get("r")
+                    if ref:
+                        m = _CELL_REF_RE.fullmatch(ref)
+                        if m is None:
+                            raise ValueError(f"invalid cell reference {ref!r}")
+                        letters = m.group(1)
+                        col_idx = col_cache.get(letters) or col_cache.setdefault(
+                            letters, column_index_from_string(letters.upper())
+                        )
+                        cell_row = int(m.group(2))
+                    else:
+                        col_idx += 1
+
+                    style = cell.get("s")
+                    style_id = int(style) if style else 0
+                    number_format = style_formats[style_id] if style_id < len(style_formats) else _GENERAL
+
+                    data_type = cell.get("t", "n")
+                    value: Any = None
+                    if data_type == "inlineStr":
+                        inline = cell.find(_INLINE_TAG)
+                        if inline is not None:
+                            value = _text_content(inline)
+                    else:
+                        raw = cell.findtext(_VALUE_TAG) or None
+                        if raw is not None:
+                            if data_type == "n":
+                                value = float(raw) if ("." in raw or "E" in raw or "e" in raw) else int(raw)
+                                if style_id in date_styles:
+                                    try:
+                                        value = from_excel(value, epoch, timedelta=style_id in timedelta_styles)
+                                    except (OverflowError, ValueError):
+                                        value = "#VALUE!"
+                            elif data_type == "s":
+                                value = strings[int(raw)]
+                            elif data_type == "b":
+                                value = bool(int(raw))
+                            elif data_type == "d":
+                                value = from_ISO8601(raw)
+                            else:
+                                # "str" (formula string result) and "e" (error) keep the text.
+                                value = raw
+                    cells.append((cell_row, col_idx, value, number_format))
+                elem.clear()
+                yield row_idx, cells
+
+
+def _read_rels(archive: zipfile.ZipFile, rels_part: str, base: str, names: set[str]) -> dict[str, tuple[str, str]]:
+    """Read a relationships part into {Id: (Type, archive path)}.
+
+    Args:
+        archive: Open xlsx archive.
+        rels_part: Archive name of the .rels part.
+        base: Directory the relative targets are resolved against.
+        names: Archive member names.
+
+    Returns:
+        Relationship map; empty when the part does not exist.
+    """
+    if rels_part not in names:
+        return {}
+    root = ElementTree.fromstring(archive.read(rels_part))
+    rels: dict[str, tuple[str, str]] = {}
+    for rel in root.iter(f"{_PKG_REL_NS}Relationship"):
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.normpath(posixpath.join(base, target))
+        rels[rel.get("Id", "")] = (rel.get("Type", ""), path)
+    return rels
+
+
+def _text_content(elem: Any) -> str:
+    """Return the plain text of an ``<si>`` / ``<is>`` element.
+
+    Matches openpyxl's ``Text.content``: the direct ``<t>`` plus the ``<t>``
+    of each rich-text run; phonetic runs (``<rPh>``) are ignored.
+
+    Args:
+        elem: String item element.
+
+    Returns:
+        Concatenated text ("" if the element holds none).
+    """
+    parts: list[str] = []
+    for child in elem:
+        if child.tag == _TEXT_TAG:
+            parts.append(child.text or "")
+        elif child.tag == _RUN_TAG:
+            text = child.find(_TEXT_TAG)
+            if text is not None:
+                parts.append(text.text or "")
+    return "".join(parts)
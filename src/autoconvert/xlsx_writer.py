@@ -0,0 +1,319 @@
+"""xlsx_writer — Streaming writer that fills one sheet of an xlsx template.
+
+``SheetTemplate`` splits a template workbook once: every zip part except the
+target worksheet is kept as raw bytes, and the worksheet XML is cut into the
+text before ``<sheetData>``, the template's own rows, and the text after
+``</sheetData>``.  ``write()`` then produces an output file by copying the
+untouched parts byte-for-byte and streaming a new ``sheetData`` in which
+written cells keep the template cell's style id.
+
+Cells are serialized the way openpyxl's worksheet writer does (inline
+strings, ``%.16g`` numbers, ``t="n"`` for empty styled cells), so reading the
+output back through openpyxl yields the same values as populating and saving
+the template with openpyxl.  Anything the splitter does not understand raises
+``UnsupportedTemplateError`` and callers fall back to openpyxl.
+"""
+
+import logging
+import re
+import zipfile
+from collections.abc import Mapping
+from decimal import Decimal
+from pathlib import Path, PurePosixPath
+from typing import Any
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.compat import safe_string
+from openpyxl.utils.cell import get_column_interval
+from openpyxl.utils.exceptions import IllegalCharacterError
+
+logger = logging.getLogger(__name__)
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_SHEET_DATA_RE = re.compile(rb"<sheetData\s*/>|<sheetData\s*>(.*?)</sheetData>", re.DOTALL)
+_ROW_RE = re.compile(rb"<row\b([^>]*?)(?:/>|>(.*?)</row>)", re.DOTALL)
+_CELL_RE = re.compile(rb"<c\b([^>]*?)(?:/>|>.*?</c>)", re.DOTALL)
+_DIMENSION_RE = re.compile(rb"<dimension\b[^>]*/>")
+_ROW_ATTR_RE = re.compile(rb'\br="(\d+)"')
+_SPANS_ATTR_RE = re.compile(rb'\s+spans="[^"]*"')
+_CELL_REF_RE = re.compile(rb'\br="([A-Z]+)(\d+)"')
+_STYLE_ATTR_RE = re.compile(rb'\bs="(\d+)"')
+
+# Reason: Column letters for 1..16384, computed once instead of per cell.
+_COLUMN_LETTERS: tuple[str, ...] = ("",) + tuple(get_column_interval(1, 16384))
+_COLUMN_INDEX: dict[bytes, int] = {letter.encode("ascii"): idx for idx, letter in enumerate(_COLUMN_LETTERS) if idx}
+
+_NUMERIC_TYPES = (int, float, Decimal)
+
+
+class UnsupportedTemplateError(ValueError):
+    """Raised when a template cannot be split for streaming output."""
+
+
+class _TemplateRow:
+    """One ``<row>`` of the template sheet: its open-tag attributes and raw cells."""
+
+    __slots__ = ("attrs", "raw", "cells", "styles")
+
+    def __init__(self, attrs: bytes, raw: bytes, cells: dict[int, bytes], styles: dict[int, int]) -> None:
+        self.attrs = attrs
+        self.raw = raw
+        self.cells = cells
+        self.styles = styles
+
+
+class SheetTemplate:
+    """A template workbook pre-split for streaming one sheet's rows.
+
+    Args:
+        parts: (ZipInfo, bytes) for every zip member, in archive order.
+            The ZipInfo objects are only read, never passed to ZipFile, so
+            concurrent write() calls do not share mutable state.
+        sheet_part: Archive name of the worksheet being filled.
+        head: Worksheet XML before ``<sheetData>``.
+        rows: Template rows by 1-based row number.
+        tail: Worksheet XML after ``</sheetData>``.
+    """
+
+    def __init__(
+        self,
+        parts: list[tuple[zipfile.ZipInfo, bytes]],
+        sheet_part: str,
+        head: bytes,
+        rows: dict[int, _TemplateRow],
+        tail: bytes,
+    ) -> None:
+        self._parts = parts
+        self._sheet_part = sheet_part
+        self._head = head
+        self._rows = rows
+        self._tail = tail
+
+    @classmethod
+    def load(cls, template_path: Path, sheet_name: str) -> "SheetTemplate":
+        """Read and split a template workbook.
+
+        Args:
+            template_path: Path to the .xlsx template.
+            sheet_name: Title of the sheet that will be filled.
+
+        Returns:
+            SheetTemplate ready for write().
+
+        Raises:
+            OSError / zipfile.BadZipFile: If the file cannot be read.
+            UnsupportedTemplateError: If the sheet cannot be located or its
+                XML is not in the layout the streaming writer handles.
+        """
+        with zipfile.ZipFile(template_path) as archive:
+            parts = [(info, archive.read(info)) for info in archive.infolist()]
+        contents = {info.filename: data for info, data in parts}
+        sheet_part = _find_sheet_part(contents, sheet_name)
+        head, rows, tail = _split_sheet(contents[sheet_part])
+        return cls(parts, sheet_part, head, rows, tail)
+
+    def write(self, output_path: Path, sheet_xml: bytes) -> None:
+        """Write an output workbook whose sheet part is ``sheet_xml``.
+
+        Args:
+            output_path: Destination .xlsx path.
+            sheet_xml: Worksheet XML from render_sheet().
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for info, data in self._parts:
+                if info.filename == self._sheet_part:
+                    data = sheet_xml
+                member = zipfile.ZipInfo(info.filename, info.date_time)
+                member.compress_type = info.compress_type
+                member.external_attr = info.external_attr
+                archive.writestr(member, data)
+
+    def render_sheet(self, cells: Mapping[int, Mapping[int, Any]]) -> bytes:
+        """Return the worksheet XML with ``cells`` merged into the template rows.
+
+        Args:
+            cells: {row: {column: value}} with 1-based indices.  Values are
+                str, int, float, Decimal, or None.
+
+        Returns:
+            The complete worksheet part as UTF-8 bytes.
+
+        Raises:
+            IllegalCharacterError: If a string contains characters openpyxl
+                would also reject.
+        """
+        out: list[bytes] = []
+        bounds = [0, 0, 0, 0]  # min_row, max_row, min_col, max_col
+        for row_idx in sorted(self._rows.keys() | cells.keys()):
+            template_row = self._rows.get(row_idx)
+            written = cells.get(row_idx)
+            if not written:
+                assert template_row is not None
+                out.append(template_row.raw)
+                _extend_bounds(bounds, row_idx, template_row.cells.keys())
+                continue
+
+            styles = template_row.styles if template_row is not None else {}
+            row_cells = dict(template_row.cells) if template_row is not None else {}
+            for col_idx, value in written.items():
+                row_cells[col_idx] = _cell_xml(row_idx, col_idx, value, styles.get(col_idx, 0))
+            attrs = _row_attrs(template_row.attrs) if template_row is not None else b""
+            out.append(b'<row r="%d"%s>' % (row_idx, attrs))
+            out.extend(row_cells[col_idx] for col_idx in sorted(row_cells))
+            out.append(b"</row>")
+            _extend_bounds(bounds, row_idx, row_cells.keys())
+
+        head = self._head
+        if bounds[1]:
+            ref = f"{_COLUMN_LETTERS[bounds[2]]}{bounds[0]}:{_COLUMN_LETTERS[bounds[3]]}{bounds[1]}"
+            head = _DIMENSION_RE.sub(b'<dimension ref="%s"/>' % ref.encode("ascii"), head, count=1)
+        return b"".join((head, b"<sheetData>", *out, b"</sheetData>", self._tail))
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+
+def _find_sheet_part(contents: dict[str, bytes], sheet_name: str) -> str:
+    """Resolve the archive name of a worksheet from workbook.xml and its rels.
+
+    Args:
+        contents: Archive name -> bytes.
+        sheet_name: Sheet title.
+
+    Returns:
+        Archive name such as ``xl/worksheets/sheet1.xml``.
+
+    Raises:
+        UnsupportedTemplateError: If the sheet or its part cannot be found.
+    """
+    try:
+        workbook = ElementTree.fromstring(contents["xl/workbook.xml"])
+        rels = ElementTree.fromstring(contents["xl/_rels/workbook.xml.rels"])
+    except (KeyError, ElementTree.ParseError) as exc:
+        raise UnsupportedTemplateError(f"workbook part not readable: {exc}") from exc
+
+    rel_id = None
+    for sheet in workbook.iter(f"{{{_MAIN_NS}}}sheet"):
+        if sheet.get("name") == sheet_name:
+            rel_id = sheet.get(f"{{{_REL_NS}}}id")
+            break
+    if rel_id is None:
+        raise UnsupportedTemplateError(f"sheet {sheet_name!r} not found in workbook.xml")
+
+    for rel in rels.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                part = target.lstrip("/")
+            else:
+                part = str(PurePosixPath("xl") / target)
+            if part not in contents:
+                raise UnsupportedTemplateError(f"worksheet part {part!r} missing")
+            return part
+    raise UnsupportedTemplateError(f"relationship {rel_id!r} not found")
+
+
+def _split_sheet(sheet_xml: bytes) -> tuple[bytes, dict[int, _TemplateRow], bytes]:
+    """Cut worksheet XML around sheetData and index the template rows.
+
+    Args:
+        sheet_xml: Worksheet part bytes.
+
+    Returns:
+        (head, rows by number, tail).
+
+    Raises:
+        UnsupportedTemplateError: If sheetData, a row number, or a cell
+            reference is missing or cannot be parsed.
+    """
+    match = _SHEET_DATA_RE.search(sheet_xml)
+    if match is None:
+        raise UnsupportedTemplateError("worksheet has no unprefixed <sheetData>")
+    body = match.group(1) or b""
+
+    rows: dict[int, _TemplateRow] = {}
+    for row_match in _ROW_RE.finditer(body):
+        attrs = row_match.group(1)
+        number = _ROW_ATTR_RE.search(attrs)
+        if number is None:
+            raise UnsupportedTemplateError("template row without r attribute")
+        cells: dict[int, bytes] = {}
+        styles: dict[int, int] = {}
+        for cell_match in _CELL_RE.finditer(row_match.group(2) or b""):
+            ref = _CELL_REF_RE.search(cell_match.group(1))
+            if ref is None or ref.group(1) not in _COLUMN_INDEX:
+                raise UnsupportedTemplateError("template cell without a usable r attribute")
+            col_idx = _COLUMN_INDEX[ref.group(1)]
+            cells[col_idx] = cell_match.group(0)
+            style = _STYLE_ATTR_RE.search(cell_match.group(1))
+            styles[col_idx] = int(style.group(1)) if style is not None else 0
+        rows[int(number.group(1))] = _TemplateRow(attrs, row_match.group(0), cells, styles)
+
+    return sheet_xml[: match.start()], rows, sheet_xml[match.end() :]
+
+
+def _row_attrs(attrs: bytes) -> bytes:
+    """Return a template row's attributes without r="N" and spans (leading space included)."""
+    words = _SPANS_ATTR_RE.sub(b"", _ROW_ATTR_RE.sub(b"", attrs, count=1)).split()
+    return b" " + b" ".join(words) if words else b""
+
+
+def _cell_xml(row: int, col: int, value: Any, style: int) -> bytes:
+    """Serialize one written cell like openpyxl's worksheet writer.
+
+    Args:
+        row: 1-based row.
+        col: 1-based column.
+        value: str, int, float, Decimal, or None.
+        style: Template style id (0 omits the attribute).
+
+    Returns:
+        The ``<c>`` element as UTF-8 bytes.
+
+    Raises:
+        IllegalCharacterError: For strings with XML-illegal control characters.
+    """
+    ref = f"{_COLUMN_LETTERS[col]}{row}"
+    style_attr = f' s="{style}"' if style else ""
+    if isinstance(value, str):
+        if ILLEGAL_CHARACTERS_RE.search(value):
+            raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+        if value == "":
+            return f'<c r="{ref}"{style_attr} t="inlineStr"/>'.encode()
+        space = ' xml:space="preserve"' if value.strip() and value != value.strip() else ""
+        return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>'.encode()
+    if value is None:
+        return f'<c r="{ref}"{style_attr} t="n"/>'.encode()
+    if isinstance(value, _NUMERIC_TYPES) and not isinstance(value, bool):
+        return f'<c r="{ref}"{style_attr} t="n"><v>{safe_string(value)}</v></c>'.encode()
+    raise TypeError(f"Unsupported cell value type for streaming output: {type(value).__name__}")
+
+
+def _extend_bounds(bounds: list[int], row: int, cols: Any) -> None:
+    """Grow [min_row, max_row, min_col, max_col] by one row's columns.
+
+    Args:
+        bounds: Mutable bounds; all zeros means empty.
+        row: 1-based row number.
+        cols: Column indices present in the row.
+    """
+    if not cols:
+        return
+    lo, hi = min(cols), max(cols)
+    if not bounds[1]:
+        bounds[:] = [row, row, lo, hi]
+        return
+    bounds[0] = min(bounds[0], row)
+    bounds[1] = max(bounds[1], row)
+    bounds[2] = min(bounds[2], lo)
+    bounds[3] = max(bounds[3], hi)
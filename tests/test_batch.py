@@ -1,16 +1,23 @@
 """Tests for batch.py -- run_batch() and process_file() orchestration."""
 
+import logging
+import queue
 import re
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import openpyxl
+import pytest
 
+from autoconvert import batch as batch_module
+from autoconvert import output as output_module
 from autoconvert.batch import process_file, run_batch
-from autoconvert.errors import ErrorCode, WarningCode
+from autoconvert.errors import ErrorCode, ProcessingError, WarningCode
 from autoconvert.models import (
     AppConfig,
     FieldPattern,
+    InvoiceItem,
+    PackingItem,
 )
 
 # ---------------------------------------------------------------------------
@@ -297,6 +304,269 @@ class TestRunBatch:
         # File will either succeed or fail depending on pipeline
         assert result.success_count + result.attention_count + result.failed_count == 1
 
+    def test_run_batch_workers_matches_serial_order(self, tmp_path: Path) -> None:
+        """workers=2 yields the same sorted file_results, statuses and counts as serial."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+
+        # Two valid files and one corrupted file, written out of sorted order.
+        _make_valid_workbook().save(data_dir / "c_file.xlsx")
+        (data_dir / "b_broken.xlsx").write_bytes(b"not a zip")
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+
+        config = _make_app_config(tmp_path)
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+        ):
+            serial = run_batch(config)
+            parallel = run_batch(config, workers=2)
+
+        names = [r.filename for r in parallel.file_results]
+        assert names == ["a_file.xlsx", "b_broken.xlsx", "c_file.xlsx"]
+        assert names == [r.filename for r in serial.file_results]
+        assert [r.status for r in parallel.file_results] == [r.status for r in serial.file_results]
+        assert parallel.failed_count == serial.failed_count == 1
+        assert parallel.file_results[1].errors[0].code == ErrorCode.ERR_011
+        assert (finished_dir / "a_file_template.xlsx").exists()
+
+    def test_init_worker_uses_parent_log_level(self, tmp_path: Path) -> None:
+        """Worker records below the parent's level never reach the log queue."""
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        root_logger = logging.getLogger()
+        saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+
+        try:
+            with (
+                patch.object(batch_module, "_worker_config"),
+                patch.object(batch_module, "_worker_output_dir"),
+                patch.object(batch_module, "_worker_layout_cache"),
+            ):
+                batch_module._init_worker(_make_app_config(tmp_path), tmp_path, log_queue, logging.INFO)
+                batch_module.logger.debug("dropped in the worker")
+                batch_module.logger.info("forwarded to the parent")
+        finally:
+            root_logger.handlers[:] = saved_handlers
+            root_logger.setLevel(saved_level)
+
+        assert [log_queue.get_nowait().getMessage()] == ["forwarded to the parent"]
+        assert log_queue.empty()
+
+    def test_run_batch_incremental_skips_unchanged_and_prunes(self, tmp_path: Path) -> None:
+        """Incremental mode reprocesses only new/changed/failed files and prunes removed ones."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        _make_valid_workbook().save(data_dir / "b_file.xlsx")
+        (data_dir / "c_broken.xlsx").write_bytes(b"not a zip")
+        config = _make_app_config(tmp_path)
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+        ):
+            first = run_batch(config, incremental=True)
+            # Reason: The fixture has no packets count, so valid files are Attention (ATT_002).
+            assert [r.status for r in first.file_results] == ["Attention", "Attention", "Failed"]
+
+            # Change b, delete a: only b and the failed c are reprocessed.
+            wb = _make_valid_workbook()
+            wb["Invoice"].cell(row=2, column=1, value="changed header text")
+            wb.save(data_dir / "b_file.xlsx")
+            (data_dir / "a_file.xlsx").unlink()
+
+            with patch("autoconvert.batch.process_file", wraps=process_file) as spy:
+                second = run_batch(config, incremental=True)
+            processed = sorted(call.args[0].name for call in spy.call_args_list)
+
+        assert processed == ["b_file.xlsx", "c_broken.xlsx"]
+        assert [r.filename for r in second.file_results] == ["b_file.xlsx", "c_broken.xlsx"]
+        assert not (finished_dir / "a_file_template.xlsx").exists()
+        assert (finished_dir / "b_file_template.xlsx").exists()
+        assert second.failed_count == 1
+
+    def test_run_batch_incremental_unchanged_file_not_reprocessed(self, tmp_path: Path) -> None:
+        """An unchanged file keeps its output, status and warnings without process_file running."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        config = _make_app_config(tmp_path)
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+        ):
+            run_batch(config, incremental=True)
+            with patch("autoconvert.batch.process_file") as mock_process:
+                second = run_batch(config, incremental=True)
+
+        mock_process.assert_not_called()
+        assert second.attention_count == 1
+        assert [w.code for w in second.file_results[0].warnings] == [WarningCode.ATT_002]
+        assert (finished_dir / "a_file_template.xlsx").exists()
+
+    def test_run_batch_layout_cache_hits_on_second_run(self, tmp_path: Path) -> None:
+        """A second run reuses the recorded layouts and produces identical results."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        _make_valid_workbook().save(data_dir / "b_file.xlsx")
+        (data_dir / "c_broken.xlsx").write_bytes(b"not a zip")
+        config = _make_app_config(tmp_path)
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+        ):
+            plain = run_batch(config)
+            first = run_batch(config, layout_cache=True)
+            with patch("autoconvert.batch.detect_header_row") as mock_detect:
+                second = run_batch(config, layout_cache=True)
+
+        mock_detect.assert_not_called()
+        assert (data_dir / "layout_cache.json").exists()
+        assert (plain.layout_cache_lookups, first.layout_cache_lookups, first.layout_cache_hits) == (0, 2, 0)
+        assert (second.layout_cache_lookups, second.layout_cache_hits) == (2, 2)
+        for expected, actual in zip(plain.file_results, second.file_results):
+            assert actual.status == expected.status
+            assert actual.invoice_items == expected.invoice_items
+            assert actual.packing_items == expected.packing_items
+            assert actual.packing_totals == expected.packing_totals
+
+    def test_run_batch_fast_reader_matches_openpyxl_reader(self, tmp_path: Path) -> None:
+        """The fast .xlsx reader produces the same results and error codes as openpyxl."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        (data_dir / "c_broken.xlsx").write_bytes(b"not a zip")
+        config = _make_app_config(tmp_path)
+        fast_config = config.model_copy(update={"reader": "fast"})
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+        ):
+            reference = run_batch(config)
+            fast = run_batch(fast_config)
+
+        assert fast.file_results[0].status != "Failed"
+        assert fast.file_results[1].errors[0].code == ErrorCode.ERR_011
+        for expected, actual in zip(reference.file_results, fast.file_results):
+            assert actual.status == expected.status
+            assert [e.code for e in actual.errors] == [e.code for e in expected.errors]
+            assert actual.invoice_items == expected.invoice_items
+            assert actual.packing_items == expected.packing_items
+            assert actual.packing_totals == expected.packing_totals
+
+    def test_run_batch_sheet_cache_serves_unchanged_files(self, tmp_path: Path) -> None:
+        """A second run reads unchanged files from the sheet cache with identical results."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        (data_dir / "c_broken.xlsx").write_bytes(b"not a zip")
+        config = _make_app_config(tmp_path).model_copy(update={"sheet_cache_dir": tmp_path / "sheet_cache"})
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+        ):
+            first = run_batch(config)
+            parse_calls: list[str] = []
+            real_parse = batch_module._parse_sheets
+            with patch(
+                "autoconvert.batch._parse_sheets",
+                side_effect=lambda path, cfg: parse_calls.append(path.name) or real_parse(path, cfg),
+            ):
+                second = run_batch(config)
+
+        # Reason: Only successfully read files are cached; the broken one is re-read.
+        assert parse_calls == ["c_broken.xlsx"]
+        assert len(list((tmp_path / "sheet_cache").iterdir())) == 1
+        for expected, actual in zip(first.file_results, second.file_results):
+            assert actual.status == expected.status
+            assert [e.code for e in actual.errors] == [e.code for e in expected.errors]
+            assert actual.invoice_items == expected.invoice_items
+            assert actual.packing_items == expected.packing_items
+            assert actual.packing_totals == expected.packing_totals
+
+    def test_run_batch_background_write_failure_marks_file_failed(self, tmp_path: Path) -> None:
+        """An ERR_052 from the background writer lands in the right FileResult."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        _make_valid_workbook().save(data_dir / "b_file.xlsx")
+        config = _make_app_config(tmp_path)
+
+        real_write = output_module.write_template
+
+        def flaky_write(items, totals, cfg, output_path):  # type: ignore[no-untyped-def]
+            if output_path.name.startswith("a_file"):
+                raise ProcessingError(code=ErrorCode.ERR_052, message="disk full", context={})
+            real_write(items, totals, cfg, output_path)
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+            patch.object(output_module, "write_template", flaky_write),
+        ):
+            result = run_batch(config)
+
+        a_result, b_result = result.file_results
+        assert a_result.status == "Failed"
+        assert [e.code for e in a_result.errors] == [ErrorCode.ERR_052]
+        assert b_result.status == "Attention"
+        assert result.failed_count == 1
+        assert (finished_dir / "b_file_template.xlsx").exists()
+
+    def test_run_batch_background_write_logs_one_final_status(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A queued file's status is logged once, after its write, next to any write error."""
+        data_dir = tmp_path / "data"
+        finished_dir = tmp_path / "data" / "finished"
+        data_dir.mkdir(parents=True)
+        finished_dir.mkdir(parents=True)
+        _make_valid_workbook().save(data_dir / "a_file.xlsx")
+        _make_valid_workbook().save(data_dir / "b_file.xlsx")
+        config = _make_app_config(tmp_path)
+
+        real_write = output_module.write_template
+
+        def flaky_write(items, totals, cfg, output_path):  # type: ignore[no-untyped-def]
+            if output_path.name.startswith("a_file"):
+                raise ProcessingError(code=ErrorCode.ERR_052, message="disk full", context={})
+            real_write(items, totals, cfg, output_path)
+
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", finished_dir),
+            patch.object(output_module, "write_template", flaky_write),
+            caplog.at_level(logging.INFO, logger="autoconvert.batch"),
+        ):
+            run_batch(config)
+
+        messages = [record.getMessage() for record in caplog.records if record.name == "autoconvert.batch"]
+        statuses = [msg for msg in messages if msg.startswith(("SUCCESS", "ATTENTION", "FAILED"))]
+        assert statuses == ["FAILED (a_file.xlsx)", "ATTENTION (b_file.xlsx)"]
+        error_idx = messages.index("[ERR_052] ERR_052: disk full (a_file.xlsx)")
+        assert messages[error_idx + 1] == "FAILED (a_file.xlsx)"
+
 
 # ---------------------------------------------------------------------------
 # process_file() tests
@@ -325,6 +595,9 @@ class TestProcessFile:
         # All invoice items must have allocated_weight populated
         for item in result.invoice_items:
             assert item.allocated_weight is not None
+        # The pipeline's internal records are converted at the FileResult boundary
+        assert all(isinstance(item, InvoiceItem) for item in result.invoice_items)
+        assert all(isinstance(item, PackingItem) for item in result.packing_items)
 
     def test_process_file_short_circuit_on_err012(self, tmp_path: Path) -> None:
         """File where detect_sheets raises ERR_012; status='Failed'; downstream NOT called."""
@@ -554,25 +827,28 @@ class TestProcessFile:
             pass
 
     def test_process_file_xls_file_processed(self, tmp_path: Path) -> None:
-        """Input is .xls file; convert_xls_to_xlsx called; processing proceeds."""
+        """Input is .xls file; open_xls_workbook called; processing proceeds."""
         config = _make_app_config(tmp_path)
 
         filepath = tmp_path / "test.xls"
         filepath.write_bytes(b"\x00" * 10)  # Dummy file
 
-        # Mock the xls adapter to return a valid workbook
+        # Mock the xls adapter to return a valid workbook (used as a context manager)
         mock_wb = _make_valid_workbook()
+        mock_cm = MagicMock()
+        mock_cm.__enter__.return_value = mock_wb
         finished_dir = tmp_path / "finished"
         finished_dir.mkdir()
 
         with (
-            patch("autoconvert.batch.convert_xls_to_xlsx", return_value=mock_wb) as mock_convert,
+            patch("autoconvert.batch.open_xls_workbook", return_value=mock_cm) as mock_convert,
             patch("autoconvert.batch._FINISHED_DIR", finished_dir),
         ):
             result = process_file(filepath, config)
 
-        # Verify convert_xls_to_xlsx was called
+        # Verify open_xls_workbook was called and the workbook closed
         mock_convert.assert_called_once_with(filepath)
+        mock_cm.__exit__.assert_called_once()
         assert result.filename == "test.xls"
         # The result should be processed (not ERR_010/ERR_011)
         err_codes = [e.code for e in result.errors]
@@ -9,7 +9,9 @@ from openpyxl import Workbook
 from autoconvert.column_map import (
     detect_header_row,
     extract_inv_no_from_header,
+    locate_inv_no_in_header,
     map_columns,
+    read_inv_no_at,
 )
 from autoconvert.errors import ErrorCode, ProcessingError
 from autoconvert.models import AppConfig, FieldPattern
@@ -523,6 +525,17 @@ class TestExtractInvNoFromHeader:
 
         assert result == "INV-2025-009"
 
+    def test_locate_inv_no_reports_label_cell_and_rereads_it(self) -> None:
+        """locate_inv_no_in_header returns the label cell; read_inv_no_at repeats the lookup there."""
+        config = _make_config()
+        ws = _make_sheet({3: [None, "Invoice No.", None, "INV-001"]}).active
+
+        found = locate_inv_no_in_header(ws, config)
+
+        assert found == ("INV-001", 3, 2)
+        assert read_inv_no_at(ws, 3, 2, config) == "INV-001"
+        assert read_inv_no_at(ws, 3, 1, config) is None
+
     def test_extract_inv_no_not_found_returns_none(self) -> None:
         """No inv_no pattern matches rows 1-15; returns None (no exception)."""
         config = _make_config()
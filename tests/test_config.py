@@ -7,6 +7,7 @@ import pytest
 import yaml
 from openpyxl import Workbook
 
+from autoconvert import config as config_module
 from autoconvert.config import load_config
 from autoconvert.errors import ConfigError, ErrorCode
 
@@ -641,6 +642,67 @@ class TestLoadConfigErr005:
         assert "30" in exc_info.value.message
 
 
+# ---------------------------------------------------------------------------
+# Configuration Snapshot
+# ---------------------------------------------------------------------------
+
+
+class TestLoadConfigSnapshot:
+    """Tests for the validated-config snapshot written next to config_dir."""
+
+    def test_snapshot_reused_while_sources_unchanged(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a second load is served from the snapshot and equals the full load."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        _create_all_config_files(config_dir)
+        full = load_config(config_dir)
+        assert (tmp_path / "config.snapshot").exists()
+
+        def _no_full_load(_: Path) -> None:
+            raise AssertionError("sources were re-read")
+
+        monkeypatch.setattr(config_module, "_load_config_from_sources", _no_full_load)
+        cached = load_config(config_dir)
+
+        assert cached.model_dump(exclude={"invoice_header_matcher", "packing_header_matcher"}) == full.model_dump(
+            exclude={"invoice_header_matcher", "packing_header_matcher"}
+        )
+        assert cached.invoice_header_matcher is not None and full.invoice_header_matcher is not None
+        assert cached.invoice_header_matcher.match("part no") == full.invoice_header_matcher.match("part no")
+
+    def test_changed_source_invalidates_snapshot(self, tmp_path: Path) -> None:
+        """Test an edited source file is re-validated instead of served from the snapshot."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        _create_all_config_files(config_dir)
+        load_config(config_dir)
+
+        yaml_path = config_dir / "field_patterns.yaml"
+        data = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+        data["invoice_sheet"]["patterns"] = ["^inv"]
+        yaml_path.write_text(yaml.dump(data, allow_unicode=True), encoding="utf-8")
+        assert [p.pattern for p in load_config(config_dir).invoice_sheet_patterns] == ["^inv"]
+
+        data["invoice_sheet"]["patterns"] = ["[invalid"]
+        yaml_path.write_text(yaml.dump(data, allow_unicode=True), encoding="utf-8")
+        with pytest.raises(ConfigError) as exc_info:
+            load_config(config_dir)
+        assert exc_info.value.code == ErrorCode.ERR_002
+
+    def test_damaged_snapshot_falls_back_to_sources(self, tmp_path: Path) -> None:
+        """Test an unreadable snapshot is ignored and rewritten."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        _create_all_config_files(config_dir)
+        snapshot = tmp_path / "config.snapshot"
+        snapshot.write_bytes(b"ACCF\x01 truncated")
+
+        result = load_config(config_dir)
+
+        assert "part_no" in result.invoice_columns
+        assert snapshot.read_bytes() != b"ACCF\x01 truncated"
+
+
 # ---------------------------------------------------------------------------
 # Integration Test — Real Config Files
 # ---------------------------------------------------------------------------
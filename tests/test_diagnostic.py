@@ -91,6 +91,76 @@ class TestParseArgs:
         namespace = parse_args()
         assert namespace.diagnostic == "file.xlsx"
 
+    def test_parse_args_workers_default_and_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --workers defaults to 1 and accepts a positive integer."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert"])
+        assert parse_args().workers == 1
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--workers", "4"])
+        assert parse_args().workers == 4
+
+    def test_parse_args_incremental_flag(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --incremental is off by default and enabled by the flag."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert"])
+        assert parse_args().incremental is False
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--incremental"])
+        assert parse_args().incremental is True
+
+    def test_parse_args_layout_cache_flag(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --layout-cache is off by default and enabled by the flag."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert"])
+        assert parse_args().layout_cache is False
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--layout-cache"])
+        assert parse_args().layout_cache is True
+
+    def test_parse_args_reader_choice(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --reader defaults to openpyxl and accepts fast."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert"])
+        assert parse_args().reader == "openpyxl"
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--reader", "fast"])
+        assert parse_args().reader == "fast"
+
+    def test_parse_args_sheet_cache_flags(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --sheet-cache is off by default and --sheet-cache-size parses MiB."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert"])
+        namespace = parse_args()
+        assert namespace.sheet_cache is False
+        assert namespace.sheet_cache_size == 256
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--sheet-cache", "--sheet-cache-size", "64"])
+        namespace = parse_args()
+        assert namespace.sheet_cache is True
+        assert namespace.sheet_cache_size == 64
+
+    def test_parse_args_watch_and_poll_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --watch is off by default and --poll-interval parses seconds."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert"])
+        namespace = parse_args()
+        assert namespace.watch is False
+        assert namespace.poll_interval == 2.0
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--watch", "--poll-interval", "0.5"])
+        namespace = parse_args()
+        assert namespace.watch is True
+        assert namespace.poll_interval == 0.5
+
+    def test_parse_args_poll_interval_rejects_zero(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --poll-interval 0 is a usage error (argparse exits with code 2)."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--watch", "--poll-interval", "0"])
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args()
+        assert exc_info.value.code == 2
+
+    def test_parse_args_workers_rejects_zero(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --workers 0 is a usage error (argparse exits with code 2)."""
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--workers", "0"])
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args()
+        assert exc_info.value.code == 2
+
 
 # ---------------------------------------------------------------------------
 # main() exit code tests
@@ -119,7 +189,7 @@ class TestMainExitCodes:
 
         # Patch run_batch to return a success BatchResult
         batch_result = _make_batch_result(failed_count=0)
-        monkeypatch.setattr(_batch_module, "run_batch", lambda config: batch_result)
+        monkeypatch.setattr(_batch_module, "run_batch", lambda config, **_: batch_result)
 
         # Patch print_batch_summary to avoid output side effects
         monkeypatch.setattr("autoconvert.cli.print_batch_summary", lambda _: None)
@@ -144,7 +214,7 @@ class TestMainExitCodes:
         monkeypatch.setattr("autoconvert.cli.setup_logging", lambda _: None)
 
         batch_result = _make_batch_result(failed_count=1)
-        monkeypatch.setattr(_batch_module, "run_batch", lambda config: batch_result)
+        monkeypatch.setattr(_batch_module, "run_batch", lambda config, **_: batch_result)
 
         monkeypatch.setattr("autoconvert.cli.print_batch_summary", lambda _: None)
 
@@ -197,6 +267,27 @@ class TestMainExitCodes:
 
         assert exc_info.value.code == 0
 
+    def test_main_diagnostic_uses_sheet_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test --sheet-cache points the config at data/sheet_cache/ in diagnostic mode."""
+        monkeypatch.setattr(
+            sys, "argv", ["autoconvert", "--diagnostic", "invoice.xlsx", "--sheet-cache", "--sheet-cache-size", "8"]
+        )
+
+        mock_config = MagicMock()
+        monkeypatch.setattr("autoconvert.cli.load_config", lambda _: mock_config)
+        monkeypatch.setattr("autoconvert.cli.setup_diagnostic_logging", lambda _: None)
+        seen: list[object] = []
+        success_result = _make_file_result("Success")
+        monkeypatch.setattr(_batch_module, "process_file", lambda path, config: seen.append(config) or success_result)
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert seen == [mock_config]
+        assert mock_config.sheet_cache_dir.name == "sheet_cache"
+        assert mock_config.sheet_cache_dir.parent.name == "data"
+        assert mock_config.sheet_cache_max_bytes == 8 * 1024 * 1024
+
     def test_main_diagnostic_exit_code_1_on_failed(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -218,3 +309,34 @@ class TestMainExitCodes:
             main()
 
         assert exc_info.value.code == 1
+
+    def test_main_watch_exit_code_1_on_any_failed(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test main runs watch_directory in --watch mode and exits 1 if any file failed.
+
+        Monkeypatches: sys.argv (--watch mode), load_config, setup_logging,
+        and watch_directory.
+        """
+        from autoconvert import watch as _watch_module
+
+        monkeypatch.setattr(sys, "argv", ["autoconvert", "--watch", "--poll-interval", "0.5"])
+
+        mock_config = MagicMock()
+        monkeypatch.setattr("autoconvert.cli.load_config", lambda _: mock_config)
+        monkeypatch.setattr("autoconvert.cli.setup_logging", lambda _: None)
+
+        calls: list[float] = []
+        batch_result = _make_batch_result(failed_count=1)
+
+        def fake_watch(config: object, poll_interval: float) -> BatchResult:
+            calls.append(poll_interval)
+            return batch_result
+
+        monkeypatch.setattr(_watch_module, "watch_directory", fake_watch)
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        assert calls == [0.5]
@@ -1,5 +1,7 @@
 """Tests for errors module — ErrorCode, WarningCode, ProcessingError, ConfigError."""
 
+import pickle
+
 from autoconvert.errors import ConfigError, ErrorCode, ProcessingError, WarningCode
 
 
@@ -87,6 +89,17 @@ class TestProcessingError:
         # The Exception's string representation should be the message
         assert str(error) == message
 
+    def test_processing_error_pickle_round_trip(self) -> None:
+        """Test ProcessingError survives pickling (worker pool transport)."""
+        error = ProcessingError(code=WarningCode.ATT_003, message="warn", context={"row": 9})
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert restored.code == WarningCode.ATT_003
+        assert restored.message == "warn"
+        assert restored.context == {"row": 9}
+        assert str(restored) == "warn"
+
 
 class TestConfigError:
     """Test ConfigError exception class."""
@@ -123,6 +136,16 @@ class TestConfigError:
         # The Exception's string representation should be the message
         assert str(error) == message
 
+    def test_config_error_pickle_round_trip(self) -> None:
+        """Test ConfigError survives pickling."""
+        error = ConfigError(code=ErrorCode.ERR_002, message="bad regex", path="/config/x.yaml")
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert restored.code == ErrorCode.ERR_002
+        assert restored.message == "bad regex"
+        assert restored.path == "/config/x.yaml"
+
 
 class TestErrorCodeCatalog:
     """Test ErrorCode catalog completeness per PRD Section 7."""
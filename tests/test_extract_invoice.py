@@ -166,6 +166,7 @@ def test_extract_invoice_items_happy_path_13_fields():
     assert item.inv_no == "INV-2025-001"
     assert item.serial == "SN-001"
     assert item.allocated_weight is None
+    assert item.row == 2
 
 
 def test_extract_invoice_items_coo_cod_fallback():
@@ -535,3 +536,51 @@ def test_extract_invoice_items_inv_no_param_used_when_no_column():
     assert len(items) == 2
     assert items[0].inv_no == "INV-2025-001"
     assert items[1].inv_no == "INV-2025-001"
+
+
+def test_extract_invoice_items_stops_at_data_extent_with_styled_empty_rows():
+    """Test that styled-but-empty rows down to row 1,048,576 are not walked:
+    max_row is inflated by formatting, but extraction only visits rows up to
+    the last row holding data.
+    """
+    wb = _build_invoice_sheet(
+        header_row=1,
+        data_rows=[
+            ["P1", "PO1", 10, 1.00000, 10.00, "USD", "TW", "B1", "BT1", "M1", "CN", "INV1", "S1"],
+            ["P2", "PO2", 20, 2.00000, 40.00, "USD", "TW", "B2", "BT2", "M2", "CN", "INV1", "S2"],
+        ],
+    )
+    ws = wb.active
+    for col_idx in range(1, 14):
+        ws.cell(row=1_048_576, column=col_idx).number_format = "0.00"
+    assert ws.max_row == 1_048_576
+    mt = MergeTracker(ws)
+    visited_rows: list[int] = []
+    original_get_string_value = mt.get_string_value
+
+    def spy(row: int, col: int, header_row: int) -> object:
+        visited_rows.append(row)
+        return original_get_string_value(row, col, header_row)
+
+    mt.get_string_value = spy  # type: ignore[method-assign]
+
+    items = extract_invoice_items(ws, _make_column_map(), mt, inv_no=None)
+
+    assert [item.part_no for item in items] == ["P1", "P2"]
+    assert max(visited_rows) == 3
+
+
+def test_extract_invoice_items_repeated_strings_share_one_object():
+    """Test that repeated string values of a file are interned: every row
+    holds the same str object for the same currency, country, brand and PO.
+    """
+    row = [" P1 ", " PO1 ", 10, 1.00000, 10.00, " USD ", " TW ", " B1 ", " BT1 ", " M1 ", " CN ", "INV1", "S1"]
+    wb = _build_invoice_sheet(header_row=1, data_rows=[list(row) for _ in range(3)])
+    ws = wb.active
+
+    items = extract_invoice_items(ws, _make_column_map(), MergeTracker(ws), inv_no=None)
+
+    assert len(items) == 3
+    for field in ("part_no", "po_no", "currency", "coo", "cod", "brand", "brand_type", "model_no"):
+        first = getattr(items[0], field)
+        assert all(getattr(item, field) is first for item in items[1:]), field
@@ -0,0 +1,112 @@
+"""Tests for header_match — HeaderMatcher equivalence with per-pattern re.search."""
+
+import pickle
+import re
+
+from autoconvert.header_match import HeaderMatcher
+from autoconvert.models import FieldPattern
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _columns() -> dict[str, FieldPattern]:
+    """Return a small invoice-like column config with overlapping patterns.
+
+    Returns:
+        Mapping of field name to FieldPattern.
+    """
+    return {
+        "part_no": FieldPattern(patterns=[r"^part\s*no", r"料号"], type="string", required=True),
+        "qty": FieldPattern(patterns=[r"^qty", r"quantity"], type="numeric", required=True),
+        "brand": FieldPattern(patterns=[r"brand"], type="string", required=True),
+        "brand_type": FieldPattern(patterns=[r"brand\s*type"], type="string", required=True),
+        "amount": FieldPattern(patterns=[r"amount$", r"^total\s*value"], type="numeric", required=True),
+        "unused": FieldPattern(patterns=[], type="string", required=False),
+    }
+
+
+def _reference(columns: dict[str, FieldPattern], text: str) -> tuple[str, ...]:
+    """Match text the way column_map did before HeaderMatcher (re.search per pattern).
+
+    Args:
+        columns: Column config.
+        text: Normalized header text.
+
+    Returns:
+        Matching field names in config order.
+    """
+    return tuple(
+        name for name, fp in columns.items() if any(re.compile(p, re.IGNORECASE).search(text) for p in fp.patterns)
+    )
+
+
+_HEADERS = [
+    "Part No",
+    "PART NO.",
+    "料号",
+    "Qty",
+    "Total Quantity",
+    "Brand",
+    "Brand Type",
+    "BRANDTYPE",
+    "Amount",
+    "Total Value",
+    "Unit Amount (USD)",
+    "Description",
+    "",
+]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_match_equals_per_pattern_search():
+    """The combined regex reports exactly the fields re.search would, in config order."""
+    columns = _columns()
+    matcher = HeaderMatcher(columns)
+
+    for text in _HEADERS:
+        assert matcher.match(text) == _reference(columns, text), text
+    assert matcher.match("Brand Type") == ("brand", "brand_type")
+
+
+def test_match_memoizes_by_text():
+    """Repeated header text returns the cached result object."""
+    matcher = HeaderMatcher(_columns())
+
+    first = matcher.match("Part No")
+
+    assert matcher.match("Part No") is first
+
+
+def test_uncombinable_patterns_fall_back_to_per_field():
+    """Backreferences or inline global flags still match like re.search."""
+    columns = {
+        "dup": FieldPattern(patterns=[r"(\w)\1"], type="string", required=True),
+        "flag": FieldPattern(patterns=[r"(?i)^desc"], type="string", required=True),
+    }
+    matcher = HeaderMatcher(columns)
+
+    for text in ("aa", "ab", "Description", "xdesc"):
+        assert matcher.match(text) == _reference(columns, text), text
+
+
+def test_matching_pattern_reports_first_hit():
+    """matching_pattern returns the first configured pattern that matches."""
+    matcher = HeaderMatcher(_columns())
+
+    assert matcher.matching_pattern("qty", "Total Quantity") == "quantity"
+    assert matcher.matching_pattern("qty", "Brand") is None
+
+
+def test_matcher_survives_pickling():
+    """Matchers ride along with AppConfig into worker processes."""
+    columns = _columns()
+    matcher = pickle.loads(pickle.dumps(HeaderMatcher(columns)))
+
+    for text in _HEADERS:
+        assert matcher.match(text) == _reference(columns, text), text
@@ -0,0 +1,83 @@
+"""Import-time budget of the autoconvert CLI, measured with ``python -X importtime``.
+
+Each test imports in a fresh interpreter and parses the ``-X importtime``
+report, so the checks see exactly which modules a start-up path loads.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Cumulative import time allowed for ``autoconvert.cli`` (microseconds).
+# Reason: Loading the pipeline eagerly (openpyxl, pydantic) took ~400 ms;
+# the light start-up path stays well under this even on slow machines.
+_CLI_IMPORT_BUDGET_US = 200_000
+
+_HEAVY_MODULES = ("openpyxl", "xlrd", "yaml", "pydantic")
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Run ``code`` under ``-X importtime`` and return cumulative times per module.
+
+    Args:
+        code: Python source passed to ``python -c``.
+
+    Returns:
+        Mapping of imported module name to cumulative import time in microseconds.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_SRC_DIR), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_pipeline_and_heavy_dependencies():
+    """Importing the CLI loads neither the pipeline nor openpyxl/xlrd/YAML/pydantic."""
+    times = _import_times("import autoconvert.cli")
+
+    assert "autoconvert.cli" in times
+    loaded = [name for name in times if name.split(".")[0] in _HEAVY_MODULES or name == "autoconvert.batch"]
+    assert loaded == []
+    assert times["autoconvert.cli"] < _CLI_IMPORT_BUDGET_US, f"autoconvert.cli took {times['autoconvert.cli']} us"
+
+
+def test_help_exits_without_heavy_dependencies():
+    """``--help`` returns before any configuration or pipeline import."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['autoconvert', '--help']\n"
+        "from autoconvert.cli import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit as exc:\n"
+        "    assert exc.code == 0\n"
+    )
+    times = _import_times(code)
+
+    assert [name for name in times if name.split(".")[0] in _HEAVY_MODULES] == []
+
+
+def test_batch_import_defers_xlrd_and_yaml():
+    """The batch pipeline loads xlrd only for .xls input and never needs PyYAML."""
+    times = _import_times("import autoconvert.batch")
+
+    assert "autoconvert.batch" in times
+    assert [name for name in times if name.split(".")[0] in ("xlrd", "yaml")] == []
+    assert "autoconvert.xls_adapter" not in times
@@ -0,0 +1,116 @@
+"""Tests for layout_cache — fingerprinting, verification, persistence."""
+
+import json
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from autoconvert.layout_cache import LayoutCache, build_layout
+from autoconvert.models import ColumnMapping
+from autoconvert.sheet_snapshot import SheetSnapshot
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_sheets(pack_header: str = "N.W.") -> tuple[SheetSnapshot, SheetSnapshot]:
+    """Create invoice/packing snapshots with headers at row 8.
+
+    Args:
+        pack_header: Text of the packing sheet's third header cell.
+
+    Returns:
+        (invoice snapshot, packing snapshot).
+    """
+    wb = Workbook()
+    inv_ws = wb.active
+    inv_ws.title = "Invoice"
+    for col, text in enumerate(("Part No", "Qty", "Amount"), start=1):
+        inv_ws.cell(row=8, column=col, value=text)
+    inv_ws.cell(row=9, column=1, value="P1")
+    pack_ws = wb.create_sheet("Packing")
+    for col, text in enumerate(("Part No", "Qty", pack_header), start=1):
+        pack_ws.cell(row=8, column=col, value=text)
+    pack_ws.cell(row=9, column=1, value="P1")
+    return SheetSnapshot.from_worksheet(inv_ws), SheetSnapshot.from_worksheet(pack_ws)
+
+
+def _mappings() -> tuple[ColumnMapping, ColumnMapping]:
+    """Return header mappings matching _make_sheets().
+
+    Returns:
+        (invoice mapping, packing mapping).
+    """
+    inv = ColumnMapping(
+        sheet_type="invoice", field_map={"part_no": 1, "qty": 2, "amount": 3}, header_row=8, effective_header_row=8
+    )
+    pack = ColumnMapping(
+        sheet_type="packing", field_map={"part_no": 1, "qty": 2, "nw": 3}, header_row=8, effective_header_row=8
+    )
+    return inv, pack
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_lookup_hits_when_header_rows_match(tmp_path: Path):
+    """A recorded layout is returned for sheets with the same header text."""
+    inv_snap, pack_snap = _make_sheets()
+    layout = build_layout(inv_snap, pack_snap, *_mappings(), inv_no_cell=(2, 1))
+    cache = LayoutCache(tmp_path / "layout_cache.json", "cfg")
+    cache.record(layout)
+
+    other_inv, other_pack = _make_sheets()
+
+    assert cache.lookup(other_inv, other_pack) == layout
+
+
+def test_lookup_misses_when_header_text_changes(tmp_path: Path):
+    """Changed header text fails verification, so the cache reports a miss."""
+    inv_snap, pack_snap = _make_sheets()
+    cache = LayoutCache(tmp_path / "layout_cache.json", "cfg")
+    cache.record(build_layout(inv_snap, pack_snap, *_mappings(), inv_no_cell=None))
+
+    changed_inv, changed_pack = _make_sheets(pack_header="Net Weight")
+
+    assert cache.lookup(changed_inv, changed_pack) is None
+
+
+def test_save_and_reload_round_trip(tmp_path: Path):
+    """Saved layouts reload under the same config digest and are dropped under another."""
+    path = tmp_path / "layout_cache.json"
+    inv_snap, pack_snap = _make_sheets()
+    layout = build_layout(inv_snap, pack_snap, *_mappings(), inv_no_cell=(2, 1))
+    cache = LayoutCache(path, "cfg")
+    cache.record(layout)
+    cache.save()
+
+    assert LayoutCache(path, "cfg").lookup(inv_snap, pack_snap) == layout
+    assert len(LayoutCache(path, "other-cfg")) == 0
+
+
+def test_unreadable_cache_starts_empty(tmp_path: Path):
+    """A damaged cache file is ignored instead of aborting the batch."""
+    path = tmp_path / "layout_cache.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert len(LayoutCache(path, "cfg")) == 0
+
+    path.write_text(json.dumps({"version": 1, "config_digest": "cfg", "layouts": [{"bad": 1}]}), encoding="utf-8")
+
+    assert len(LayoutCache(path, "cfg")) == 0
+
+
+def test_record_replaces_same_fingerprint(tmp_path: Path):
+    """Recording a known layout again keeps a single entry."""
+    inv_snap, pack_snap = _make_sheets()
+    layout = build_layout(inv_snap, pack_snap, *_mappings(), inv_no_cell=None)
+    cache = LayoutCache(tmp_path / "layout_cache.json", "cfg")
+
+    cache.record(layout)
+    cache.record(layout)
+
+    assert len(cache) == 1
@@ -0,0 +1,98 @@
+"""Tests for manifest.py — incremental batch manifest and digests."""
+
+import re
+from pathlib import Path
+
+from autoconvert.errors import ProcessingError, WarningCode
+from autoconvert.manifest import Manifest, config_digest, file_digest
+from autoconvert.models import AppConfig, FileResult
+
+
+def _config(tmp_path: Path, currency_lookup: dict[str, str] | None = None) -> AppConfig:
+    """Build a minimal AppConfig whose template is a small dummy file."""
+    template = tmp_path / "output_template.xlsx"
+    if not template.exists():
+        template.write_bytes(b"template-bytes")
+    return AppConfig(
+        invoice_sheet_patterns=[re.compile("invoice", re.IGNORECASE)],
+        packing_sheet_patterns=[re.compile("packing", re.IGNORECASE)],
+        invoice_columns={},
+        packing_columns={},
+        inv_no_patterns=[],
+        inv_no_label_patterns=[],
+        inv_no_exclude_patterns=[],
+        currency_lookup=currency_lookup or {"USD": "502"},
+        country_lookup={"CHINA": "142"},
+        template_path=template,
+    )
+
+
+def _result(status: str, warnings: list | None = None) -> FileResult:
+    """Build a FileResult with the given status."""
+    return FileResult(
+        filename="a.xlsx",
+        status=status,
+        errors=[],
+        warnings=warnings or [],
+        invoice_items=[],
+        packing_items=[],
+    )
+
+
+def test_file_digest_changes_with_content(tmp_path: Path) -> None:
+    """Different bytes give different digests; same bytes give the same digest."""
+    path = tmp_path / "a.xlsx"
+    path.write_bytes(b"one")
+    first = file_digest(path)
+    assert file_digest(path) == first
+    path.write_bytes(b"two")
+    assert file_digest(path) != first
+
+
+def test_config_digest_tracks_lookup_and_template(tmp_path: Path) -> None:
+    """config_digest changes when a lookup table or the template bytes change."""
+    base = config_digest(_config(tmp_path))
+    assert config_digest(_config(tmp_path)) == base
+    assert config_digest(_config(tmp_path, {"USD": "999"})) != base
+
+    (tmp_path / "output_template.xlsx").write_bytes(b"edited-template")
+    assert config_digest(_config(tmp_path)) != base
+
+
+def test_manifest_round_trip_and_needs_processing(tmp_path: Path) -> None:
+    """A recorded Attention entry survives save/load and is skipped while unchanged."""
+    finished = tmp_path / "finished"
+    finished.mkdir()
+    (finished / "a_template.xlsx").write_bytes(b"out")
+    warning = ProcessingError(code=WarningCode.ATT_003, message="bad currency", context={})
+    manifest = Manifest(tmp_path / "manifest.json", finished)
+    manifest.record("a.xlsx", "h1", "c1", _result("Attention", [warning]), "a_template.xlsx")
+    manifest.save()
+
+    reloaded = Manifest(tmp_path / "manifest.json", finished)
+    assert not reloaded.needs_processing("a.xlsx", "h1", "c1")
+    assert reloaded.needs_processing("a.xlsx", "h2", "c1")
+    assert reloaded.needs_processing("a.xlsx", "h1", "c2")
+    cached = reloaded.cached_result("a.xlsx")
+    assert cached.status == "Attention"
+    assert [(w.code, w.message) for w in cached.warnings] == [(WarningCode.ATT_003, "bad currency")]
+
+    # Output removed by hand -> must be regenerated.
+    (finished / "a_template.xlsx").unlink()
+    assert reloaded.needs_processing("a.xlsx", "h1", "c1")
+
+
+def test_manifest_failed_entry_always_reprocessed(tmp_path: Path) -> None:
+    """A Failed entry has no output and is always reprocessed."""
+    manifest = Manifest(tmp_path / "manifest.json", tmp_path)
+    manifest.record("a.xlsx", "h1", "c1", _result("Failed"), "a_template.xlsx")
+    assert manifest.needs_processing("a.xlsx", "h1", "c1")
+
+
+def test_manifest_corrupted_file_ignored(tmp_path: Path) -> None:
+    """An unreadable manifest loads as empty instead of raising."""
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json", encoding="utf-8")
+    manifest = Manifest(path, tmp_path)
+    assert manifest.needs_processing("a.xlsx", "h1", "c1")
+    assert manifest.prune(set()) == []
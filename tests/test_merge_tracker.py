@@ -288,3 +288,132 @@ def test_get_weight_value_header_area_merge_returns_zero():
     assert tracker.get_weight_value(4, 1, header_row=5) == Decimal("0.0")
     # Even the anchor row of a header-area merge returns zero
     assert tracker.get_weight_value(3, 1, header_row=5) == Decimal("0.0")
+
+
+# ---------------------------------------------------------------------------
+# Index-backed lookups
+# ---------------------------------------------------------------------------
+
+
+def _linear_find(ranges: list[MergeRange], row: int, col: int) -> MergeRange | None:
+    """Reference first-match scan over captured ranges."""
+    for mr in ranges:
+        if mr.min_row <= row <= mr.max_row and mr.min_col <= col <= mr.max_col:
+            return mr
+    return None
+
+
+def test_indexed_lookups_match_linear_scan():
+    """Test index-backed queries agree with a linear scan on many merges.
+
+    Covers vertical NW-style merges, horizontal merges and a header banner
+    wider than the per-column index limit.
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=1, column=1, value="Banner")
+    ws.merge_cells("A1:BZ1")
+    for start in range(3, 300, 3):
+        ws.cell(row=start, column=3, value=float(start))
+        ws.merge_cells(start_row=start, start_column=3, end_row=start + 1, end_column=3)
+        ws.cell(row=start, column=5, value=f"B{start}")
+        ws.merge_cells(start_row=start, start_column=5, end_row=start, end_column=6)
+
+    tracker = MergeTracker(ws)
+
+    for row in range(1, 305):
+        for col in (1, 2, 3, 4, 5, 6, 7, 78):
+            expected = _linear_find(tracker._ranges, row, col)
+            assert tracker.get_merge_range(row, col) is expected
+            assert tracker.is_merge_anchor(row, col) is (
+                expected is not None and (expected.min_row, expected.min_col) == (row, col)
+            )
+
+
+def test_indexed_lookup_falls_back_for_overlapping_ranges():
+    """Test overlapping ranges keep first-match semantics (linear fallback)."""
+    tracker = MergeTracker(Workbook().active)
+    tracker._ranges = [
+        MergeRange(min_row=5, max_row=9, min_col=1, max_col=1, value="first"),
+        MergeRange(min_row=7, max_row=12, min_col=1, max_col=2, value="second"),
+    ]
+    tracker._build_index()
+
+    assert tracker.get_anchor_value(8, 1) == "first"
+    assert tracker.get_anchor_value(8, 2) == "second"
+    assert tracker.get_anchor_value(11, 1) == "second"
+
+
+def test_ranges_in_column_returns_capture_order():
+    """Test ranges_in_column returns only ranges covering the column, in capture order."""
+    wb = Workbook()
+    ws = wb.active
+    ws.merge_cells("C10:C12")
+    ws.merge_cells("B2:D2")
+    ws.merge_cells("A5:A6")
+
+    tracker = MergeTracker(ws)
+
+    expected = [mr for mr in tracker._ranges if mr.min_col <= 3 <= mr.max_col]
+    assert tracker.ranges_in_column(3) == expected
+    assert len(expected) == 2
+    assert tracker.ranges_in_column(9) == []
+
+
+def test_get_string_values_collapses_merged_runs():
+    """Test get_string_values yields one anchor value per data-area merged run."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=6, column=1, value="P1")
+    ws.merge_cells("A6:A8")
+    ws.cell(row=9, column=1, value="P2")
+    ws.cell(row=2, column=1, value="Hdr")
+    ws.merge_cells("A2:A3")
+
+    tracker = MergeTracker(ws)
+
+    assert tracker.get_string_values(1, 6, 10, header_row=5) == ["P1", "P2", None]
+    # Mid-run start still propagates the anchor.
+    assert tracker.get_string_values(1, 7, 7, header_row=5) == ["P1"]
+    # Header-area merge: raw (unmerged) values, row by row.
+    assert tracker.get_string_values(1, 2, 3, header_row=5) == ["Hdr", None]
+
+
+# ---------------------------------------------------------------------------
+# Virtual unmerge and column filtering
+# ---------------------------------------------------------------------------
+
+
+def test_unmerge_false_leaves_sheet_merged_with_same_answers():
+    """Test unmerge=False records ranges without mutating the worksheet and
+    answers reads exactly like an unmerging tracker.
+    """
+    virtual_ws = _make_sheet_with_vertical_merge()
+    real_ws = _make_sheet_with_vertical_merge()
+
+    virtual = MergeTracker(virtual_ws, unmerge=False)
+    real = MergeTracker(real_ws)
+
+    assert len(list(virtual_ws.merged_cells.ranges)) == 1
+    assert virtual._ranges == real._ranges
+    for row in range(4, 9):
+        assert virtual.get_string_value(row, 1, header_row=2) == real.get_string_value(row, 1, header_row=2)
+        assert virtual.get_weight_value(row, 1, header_row=2) == real.get_weight_value(row, 1, header_row=2)
+
+
+def test_columns_filter_skips_ranges_outside_mapped_columns():
+    """Test only ranges touching the given columns are captured."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=5, column=1, value="PartA")
+    ws.merge_cells("A5:A7")
+    ws.cell(row=1, column=4, value="Title")
+    ws.merge_cells("D1:H1")
+    ws.cell(row=9, column=10, value="Note")
+    ws.merge_cells("J9:K9")
+
+    tracker = MergeTracker(ws, unmerge=False, columns=[1, 6])
+
+    assert sorted((mr.min_row, mr.min_col) for mr in tracker._ranges) == [(1, 4), (5, 1)]
+    assert tracker.is_in_merge(10, 9) is False
+    assert tracker.get_anchor_value(6, 1) == "PartA"
@@ -18,8 +18,10 @@ from autoconvert.models import (
     FieldPattern,
     FileResult,
     InvoiceItem,
+    InvoiceRecord,
     MergeRange,
     PackingItem,
+    PackingRecord,
     PackingTotals,
 )
 
@@ -164,6 +166,32 @@ def test_packing_item_nw_decimal():
     assert item.nw == Decimal("2.50000")
 
 
+# ---------------------------------------------------------------------------
+# InvoiceRecord / PackingRecord tests
+# ---------------------------------------------------------------------------
+
+
+def test_invoice_record_to_model_keeps_all_fields():
+    """Test that InvoiceRecord has InvoiceItem's fields and converts value for value."""
+    item = _make_invoice_item(allocated_weight=Decimal("1.234"))
+    record = InvoiceRecord(**item.model_dump())
+
+    model = record.to_model()
+
+    assert isinstance(model, InvoiceItem)
+    assert model == item
+    assert not hasattr(record, "__dict__")
+
+
+def test_packing_record_to_model_keeps_all_fields():
+    """Test that PackingRecord converts to an equal PackingItem."""
+    record = PackingRecord(part_no="P-004", qty=Decimal("3"), nw=Decimal("1.50000"), is_first_row_of_merge=False)
+
+    model = record.to_model()
+
+    assert model == PackingItem(part_no="P-004", qty=Decimal("3"), nw=Decimal("1.50000"), is_first_row_of_merge=False)
+
+
 # ---------------------------------------------------------------------------
 # PackingTotals tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,159 @@
+"""Tests for src/autoconvert/numeric.py.
+
+The fast conversions must agree with the utils functions they replace, value
+for value and in Decimal representation, so most tests are randomized
+equivalence checks against ``safe_decimal`` / ``detect_cell_precision``.
+"""
+
+import random
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from autoconvert.numeric import cell_decimal, cell_precision, round_units, units_to_decimal
+from autoconvert.utils import detect_cell_precision, round_half_up, safe_decimal, strip_unit_suffix
+
+_SEED = 20240601
+_CASES = 20_000
+
+_FORMATS = (
+    None,
+    "General",
+    "@",
+    "0",
+    "0.0",
+    "0.00",
+    "0.000",
+    "#,##0.00",
+    "#,##0.0000",
+    "0.00000_ ",
+    "_($* #,##0.00_)",
+    "0.0000000000",
+    "0%",
+    "yyyy-mm-dd",
+)
+
+
+def _reference_decimal(value: Any, decimals: int) -> Decimal | type[ValueError]:
+    """Return what the extractors computed before numeric existed (or ValueError)."""
+    try:
+        return safe_decimal(strip_unit_suffix(str(value)), decimals)
+    except ValueError:
+        return ValueError
+
+
+def _random_value(rng: random.Random) -> Any:
+    """Return a random cell value: floats of all magnitudes, ties, ints and strings."""
+    kind = rng.randrange(9)
+    if kind == 0:
+        return rng.uniform(-1e6, 1e6)
+    if kind == 1:
+        return rng.random() * 10 ** rng.randint(-8, 18)
+    if kind == 2:
+        # Decimal ties such as 2.285 or 0.125, stored as the nearest float.
+        return float(Decimal(rng.randint(0, 10**6)).scaleb(-rng.randint(1, 6)) + Decimal("0.5").scaleb(-6))
+    if kind == 3:
+        # Exact binary fractions (exact .5 ties after scaling).
+        return rng.randint(0, 10**6) / 2 ** rng.randint(1, 12)
+    if kind == 4:
+        return rng.randint(-(10**20), 10**20)
+    if kind == 5:
+        return rng.randint(0, 5000)
+    if kind == 6:
+        return rng.choice([0.0, -0.0, float("inf"), float("nan"), True, False, 1e-12, -1e-12, 2.28, 2.2799999999999998])
+    if kind == 7:
+        return f"{rng.uniform(0, 1000):.{rng.randint(0, 6)}f}{rng.choice(['', ' KGS', 'PCS', ' kg'])}"
+    return rng.choice(["", "abc", "1,000", " 12.5 ", "N/A", "-3.5"])
+
+
+class TestCellDecimal:
+    """cell_decimal() equals safe_decimal(strip_unit_suffix(str(value)))."""
+
+    def test_cell_decimal_matches_safe_decimal_on_random_values(self) -> None:
+        """Random values and precisions give identical results and representations."""
+        rng = random.Random(_SEED)
+        for _ in range(_CASES):
+            value = _random_value(rng)
+            decimals = rng.randint(0, 17)
+            expected = _reference_decimal(value, decimals)
+            if expected is ValueError:
+                with pytest.raises(ValueError):
+                    cell_decimal(value, decimals)
+                continue
+            result = cell_decimal(value, decimals)
+            assert str(result) == str(expected), (value, decimals)
+
+    @pytest.mark.parametrize(
+        ("value", "decimals", "expected"),
+        [
+            (2.2799999999999998, 2, "2.28"),
+            (2.285, 2, "2.29"),
+            (10, 0, "10"),
+            (3.5, 5, "3.5"),
+            ("12.5 KGS", 2, "12.5"),
+            (-2.5, 0, "-2"),
+        ],
+    )
+    def test_cell_decimal_known_values(self, value: Any, decimals: int, expected: str) -> None:
+        """Epsilon correction, ints, suffixes and negatives behave as safe_decimal does."""
+        assert str(cell_decimal(value, decimals)) == expected
+
+    def test_cell_decimal_bool_is_not_numeric(self) -> None:
+        """Booleans are rejected like their str() form ("True")."""
+        with pytest.raises(ValueError):
+            cell_decimal(True, 2)
+
+
+class TestCellPrecision:
+    """cell_precision() equals detect_cell_precision() on the same cell."""
+
+    def test_cell_precision_matches_detect_cell_precision_on_random_cells(self) -> None:
+        """Random values and formats give identical precisions (or the same error)."""
+        rng = random.Random(_SEED + 1)
+        for _ in range(_CASES):
+            value = _random_value(rng)
+            number_format = rng.choice(_FORMATS)
+            cell = SimpleNamespace(value=value, number_format=number_format)
+            try:
+                expected = detect_cell_precision(cell)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    cell_precision(value, number_format)
+                continue
+            assert cell_precision(value, number_format) == expected, (value, number_format)
+
+    @pytest.mark.parametrize(
+        ("value", "number_format", "expected"),
+        [
+            (1.5, "0.000", 3),
+            (1.5, "General", 1),
+            (0.015625, "General", 5),
+            (1.00004, "General", 5),
+            (1.000004, None, 0),
+            (1.0000001, "General", 0),
+            (12, "@", 0),
+        ],
+    )
+    def test_cell_precision_known_values(self, value: Any, number_format: str | None, expected: int) -> None:
+        """Formats decide when they carry decimals; General/text fall back to the value."""
+        assert cell_precision(value, number_format) == expected
+
+
+class TestRoundUnits:
+    """round_units() / units_to_decimal() reproduce round_half_up()."""
+
+    def test_round_units_matches_round_half_up_on_random_values(self) -> None:
+        """Integer units rebuild the exact Decimal round_half_up returns."""
+        rng = random.Random(_SEED + 2)
+        for _ in range(_CASES):
+            value = Decimal(rng.randint(-(10**9), 10**12)).scaleb(-rng.randint(0, 8))
+            decimals = rng.randint(0, 6)
+            expected = round_half_up(value, decimals)
+            units = round_units(float(value), decimals)
+            assert units == expected.scaleb(decimals), (value, decimals)
+            # Reason: From 1e16 on, repr() switches to exponent notation and
+            # round_half_up keeps that exponent; only the value is comparable.
+            if expected and abs(units) < 2**52:
+                assert str(units_to_decimal(units, decimals)) == str(expected)
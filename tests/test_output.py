@@ -1,6 +1,6 @@
 """Tests for output.py — FR-029, FR-030: Template population and output file writing.
 
-Seven test cases covering:
+Ten test cases covering:
 1. Output file is created and is a valid workbook.
 2. Template rows 1–4 are preserved after write.
 3. Column mapping correctness (spot checks on key columns).
@@ -8,6 +8,9 @@ Seven test cases covering:
 5. total_packets=None produces an empty cell at AK row 5.
 6. ERR_051 raised when template path does not exist.
 7. ERR_052 raised when output path is unwritable.
+8. Outputs built from the cached template clone match a fresh template load.
+9. The streaming writer round-trips the same values and styles as openpyxl.
+10. OutputWriterPool bounds queued writes and reports failures by key.
 """
 
 import stat
@@ -346,3 +349,208 @@ def test_write_template_err052_on_unwritable_path(
             read_only_dir.chmod(
                 stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
             )
+
+
+# ---------------------------------------------------------------------------
+# Test 8 — Cached template clones match a fresh template load
+# ---------------------------------------------------------------------------
+
+
+def _make_styled_template(path: Path) -> Path:
+    """Save a small styled 工作表1 template (fonts, formats, merges, widths).
+
+    Args:
+        path: Destination file.
+
+    Returns:
+        The saved path.
+    """
+    from openpyxl.styles import Font
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "工作表1"
+    for col in range(1, 41):
+        ws.cell(row=1, column=col, value=f"H{col}").font = Font(bold=True)
+        ws.cell(row=4, column=col, value=f"  说明 {col}")
+    ws.cell(row=2, column=1, value="Merged title")
+    ws.merge_cells("A2:C2")
+    ws.cell(row=3, column=5, value=1.5)
+    for row in range(5, 9):
+        for col in (12, 13):
+            ws.cell(row=row, column=col).number_format = "0.00000_"
+    ws.row_dimensions[5].height = 18
+    ws.column_dimensions["A"].width = 24
+    wb.save(path)
+    return path
+
+
+def test_write_template_cached_clone_is_byte_equivalent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Outputs built from the cached template match a fresh load and do not share rows."""
+    import zipfile
+
+    from autoconvert import output as output_module
+
+    config = _make_config(tmp_path).model_copy(
+        update={"template_path": _make_styled_template(tmp_path / "output_template.xlsx")}
+    )
+    monkeypatch.setattr(output_module, "_template_cache", {})
+    monkeypatch.setattr(output_module, "_sheet_template", lambda path: None)
+    items = [_item("PART-001"), _item("PART-002")]
+
+    write_template([_item("A"), _item("B"), _item("C")], _totals(), config, tmp_path / "first.xlsx")
+    write_template(items, _totals(), config, tmp_path / "cached.xlsx")
+    monkeypatch.setattr(output_module, "_template_cache", {})
+    write_template(items, _totals(), config, tmp_path / "fresh.xlsx")
+
+    def parts(path: Path) -> dict[str, bytes]:
+        with zipfile.ZipFile(path) as zf:
+            return {name: zf.read(name) for name in ("xl/worksheets/sheet1.xml", "xl/styles.xml")}
+
+    assert parts(tmp_path / "cached.xlsx") == parts(tmp_path / "fresh.xlsx")
+    ws = openpyxl.load_workbook(tmp_path / "cached.xlsx")["工作表1"]
+    assert ws.cell(row=7, column=1).value is None
+
+
+# ---------------------------------------------------------------------------
+# Test 9 — Streaming writer matches the openpyxl path
+# ---------------------------------------------------------------------------
+
+
+def test_write_template_streaming_round_trips_like_openpyxl(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Streamed output reads back with the same values/styles; other parts are copied verbatim."""
+    import zipfile
+
+    from autoconvert import output as output_module
+
+    template_path = _make_styled_template(tmp_path / "output_template.xlsx")
+    config = _make_config(tmp_path).model_copy(update={"template_path": template_path})
+    items = [
+        _item("PART-001"),
+        _item(" lead & <trail> ", serial="", allocated_weight=None, qty=Decimal("3")),
+        _item("PART-003", amount=Decimal("1234567.891"), price=Decimal("0.00001")),
+        _item("PART-004"),
+        _item("PART-005", model_no="型号-5"),
+    ]
+
+    write_template(items, _totals(), config, tmp_path / "streamed.xlsx")
+    monkeypatch.setattr(output_module, "_sheet_template", lambda path: None)
+    write_template(items, _totals(), config, tmp_path / "openpyxl.xlsx")
+
+    streamed = openpyxl.load_workbook(tmp_path / "streamed.xlsx")["工作表1"]
+    reference = openpyxl.load_workbook(tmp_path / "openpyxl.xlsx")["工作表1"]
+    assert (streamed.max_row, streamed.max_column) == (reference.max_row, reference.max_column)
+    for row in range(1, reference.max_row + 1):
+        for col in range(1, reference.max_column + 1):
+            got, want = streamed.cell(row=row, column=col), reference.cell(row=row, column=col)
+            assert got.value == want.value, (row, col)
+            assert got.number_format == want.number_format, (row, col)
+            assert got.font.b == want.font.b, (row, col)
+    assert streamed.row_dimensions[5].height == 18
+    assert [str(r) for r in streamed.merged_cells.ranges] == ["A2:C2"]
+
+    with zipfile.ZipFile(template_path) as src, zipfile.ZipFile(tmp_path / "streamed.xlsx") as out:
+        for name in src.namelist():
+            if name != "xl/worksheets/sheet1.xml":
+                assert out.read(name) == src.read(name), name
+
+
+# ---------------------------------------------------------------------------
+# Test 10 — Background writer pool
+# ---------------------------------------------------------------------------
+
+
+def test_output_writer_pool_backpressure_and_failures(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """submit() blocks once max_pending writes are in flight; collect() returns failures by key."""
+    import threading
+
+    from autoconvert import output as output_module
+    from autoconvert.output import OutputWriterPool
+
+    release = threading.Event()
+    in_flight: list[str] = []
+
+    def fake_write(items, totals, config, output_path):  # type: ignore[no-untyped-def]
+        in_flight.append(output_path.name)
+        release.wait(5)
+        if output_path.name == "bad.xlsx":
+            raise ProcessingError(code=ErrorCode.ERR_052, message="cannot write", context={})
+
+    monkeypatch.setattr(output_module, "write_template", fake_write)
+    config = _make_config(tmp_path)
+
+    with OutputWriterPool(max_workers=1, max_pending=2) as pool:
+        pool.submit("good", [_item()], _totals(), config, tmp_path / "good.xlsx")
+        pool.submit("bad", [_item()], _totals(), config, tmp_path / "bad.xlsx")
+        third = threading.Thread(
+            target=pool.submit, args=("late", [_item()], _totals(), config, tmp_path / "late.xlsx")
+        )
+        third.start()
+        third.join(0.2)
+        assert third.is_alive(), "third submit should block while two writes are pending"
+
+        release.set()
+        third.join(5)
+        failures = pool.collect()
+
+    assert sorted(in_flight) == ["bad.xlsx", "good.xlsx", "late.xlsx"]
+    assert list(failures) == ["bad"]
+    assert failures["bad"].code == ErrorCode.ERR_052
+
+
+# ---------------------------------------------------------------------------
+# Test 11 — Outputs are replaced atomically
+# ---------------------------------------------------------------------------
+
+
+def test_write_template_concurrent_writes_to_one_path_stay_valid(tmp_path: Path) -> None:
+    """Threads writing the same output path leave one complete workbook and no temp files."""
+    import threading
+
+    template_path = _make_styled_template(tmp_path / "output_template.xlsx")
+    config = _make_config(tmp_path).model_copy(update={"template_path": template_path})
+    output_dir = tmp_path / "finished"
+    output_dir.mkdir()
+    output_path = output_dir / "same_template.xlsx"
+    errors: list[BaseException] = []
+
+    def write(part_no: str) -> None:
+        try:
+            for _ in range(5):
+                write_template([_item(part_no)] * 50, _totals(), config, output_path)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(f"PART-{idx}",)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    ws = openpyxl.load_workbook(output_path)["工作表1"]
+    assert len({ws.cell(row=row, column=1).value for row in range(5, 55)}) == 1
+    assert [path.name for path in output_dir.iterdir()] == ["same_template.xlsx"]
+
+
+def test_write_template_failed_save_leaves_no_partial_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A save that fails midway raises ERR_052 and leaves neither output nor temp file."""
+    from autoconvert.xlsx_writer import SheetTemplate
+
+    def failing_write(self: SheetTemplate, output_path: Path, sheet_xml: bytes) -> None:
+        output_path.write_bytes(b"PK partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(SheetTemplate, "write", failing_write)
+    template_path = _make_styled_template(tmp_path / "output_template.xlsx")
+    config = _make_config(tmp_path).model_copy(update={"template_path": template_path})
+    output_dir = tmp_path / "finished"
+    output_dir.mkdir()
+
+    with pytest.raises(ProcessingError) as exc_info:
+        write_template([_item()], _totals(), config, output_dir / "broken_template.xlsx")
+
+    assert exc_info.value.code == ErrorCode.ERR_052
+    assert list(output_dir.iterdir()) == []
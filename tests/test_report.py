@@ -217,3 +217,17 @@ class TestPrintBatchSummary:
         assert "12.35 seconds" in log_text
         # Ensure the un-rounded value does NOT appear
         assert "12.3456" not in log_text
+
+    def test_print_batch_summary_layout_cache_hit_rate(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test the layout cache line appears only when the cache was consulted."""
+        batch_result = _make_batch_result([_make_file_result("file1.xlsx", "Success")])
+
+        with caplog.at_level(logging.INFO, logger="autoconvert.report"):
+            print_batch_summary(batch_result)
+        assert "Layout cache:" not in caplog.text
+
+        caplog.clear()
+        batch_result = batch_result.model_copy(update={"layout_cache_lookups": 4, "layout_cache_hits": 3})
+        with caplog.at_level(logging.INFO, logger="autoconvert.report"):
+            print_batch_summary(batch_result)
+        assert "Layout cache:       3/4 hits (75%)" in caplog.text
@@ -0,0 +1,164 @@
+"""Tests for sheet_cache — round trip, cache keys, LRU eviction, damaged entries."""
+
+import os
+import re
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+from autoconvert.models import AppConfig
+from autoconvert.sheet_cache import SheetCache
+from autoconvert.sheet_snapshot import LazySheetSnapshot, SheetSnapshot
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _cells() -> list[tuple[int, int, object, str | None]]:
+    """Return stored cells covering every value kind a snapshot can hold.
+
+    Returns:
+        (row, col, value, number_format) tuples.
+    """
+    return [
+        (1, 1, "INVOICE", None),
+        (1, 2, "covered", None),
+        (2, 1, 12, None),
+        (2, 2, 1.25, "0.00"),
+        (2, 3, True, None),
+        (3, 1, datetime(2025, 3, 1, 8, 30, 15, 250), "yyyy-mm-dd"),
+        (3, 2, time(12, 15), "h:mm"),
+        (3, 3, timedelta(days=1, seconds=30), "[h]:mm"),
+        (6, 5, None, "0.000"),
+    ]
+
+
+def _snapshot(title: str = "Invoice") -> SheetSnapshot:
+    """Build a snapshot with a merge over A1:B1.
+
+    Args:
+        title: Sheet title.
+
+    Returns:
+        SheetSnapshot of _cells().
+    """
+    return SheetSnapshot.from_cells(title, _cells(), [(1, 1, 1, 2)])
+
+
+def _assert_same(actual: SheetSnapshot, expected: SheetSnapshot) -> None:
+    """Assert two snapshots read identically.
+
+    Args:
+        actual: Snapshot under test.
+        expected: Reference snapshot.
+    """
+    assert actual.title == expected.title
+    assert actual.merged_ranges == expected.merged_ranges
+    assert (actual.max_row, actual.max_column) == (expected.max_row, expected.max_column)
+    assert (actual.data_max_row, actual.data_max_column) == (expected.data_max_row, expected.data_max_column)
+    for row in range(1, expected.max_row + 2):
+        for col in range(1, expected.max_column + 2):
+            assert actual.value(row, col) == expected.value(row, col), (row, col)
+            assert type(actual.value(row, col)) is type(expected.value(row, col)), (row, col)
+            assert actual.number_format(row, col) == expected.number_format(row, col), (row, col)
+
+
+def _config(invoice_pattern: str = r"^invoice") -> AppConfig:
+    """Create an AppConfig with the given invoice sheet pattern.
+
+    Args:
+        invoice_pattern: Invoice sheet name regex.
+
+    Returns:
+        AppConfig.
+    """
+    return AppConfig(
+        invoice_sheet_patterns=[re.compile(invoice_pattern, re.IGNORECASE)],
+        packing_sheet_patterns=[re.compile(r"^packing", re.IGNORECASE)],
+        invoice_columns={},
+        packing_columns={},
+        inv_no_patterns=[],
+        inv_no_label_patterns=[],
+        inv_no_exclude_patterns=[],
+        currency_lookup={},
+        country_lookup={},
+        template_path=Path("dummy.xlsx"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_store_and_lookup_round_trip(tmp_path: Path):
+    """Values of every kind, formats, merges and dimensions survive a round trip."""
+    cache = SheetCache(tmp_path / "cache", 1 << 20)
+    inv_snap, pack_snap = _snapshot(), _snapshot("Packing")
+
+    cache.store("k1", inv_snap, pack_snap)
+    hit = cache.lookup("k1")
+
+    assert hit is not None
+    _assert_same(hit[0], inv_snap)
+    _assert_same(hit[1], pack_snap)
+    assert cache.lookup("missing") is None
+
+
+def test_lazy_and_same_sheet_snapshots(tmp_path: Path):
+    """A lazy snapshot is stored in full; a without_merges() packing view is stored once."""
+    cache = SheetCache(tmp_path, 1 << 20)
+    rows = [(r, [c for c in _cells() if c[0] == r]) for r in (1, 2, 3, 6)]
+    lazy = LazySheetSnapshot("Invoice", iter(rows), [(1, 1, 1, 2)])
+    assert lazy.value(1, 1) == "INVOICE"
+
+    cache.store("k1", lazy, lazy.without_merges())
+    hit = cache.lookup("k1")
+
+    assert hit is not None
+    _assert_same(hit[0], _snapshot())
+    _assert_same(hit[1], _snapshot().without_merges())
+
+
+def test_key_depends_on_content_and_sheet_patterns(tmp_path: Path):
+    """Same bytes under another name share a key; other bytes or sheet patterns do not."""
+    cache = SheetCache(tmp_path / "cache", 1 << 20)
+    first, copy, other = tmp_path / "a.xlsx", tmp_path / "b.xlsx", tmp_path / "c.xlsx"
+    first.write_bytes(b"same bytes")
+    copy.write_bytes(b"same bytes")
+    other.write_bytes(b"other bytes")
+    config = _config()
+
+    assert cache.key(first, config) == cache.key(copy, config)
+    assert cache.key(first, config) != cache.key(other, config)
+    assert cache.key(first, config) != cache.key(first, _config(r"^inv"))
+
+
+def test_eviction_removes_least_recently_used(tmp_path: Path):
+    """Over the size cap, the entry with the oldest use is evicted first."""
+    cache = SheetCache(tmp_path, 1 << 20)
+    cache.store("old", _snapshot(), _snapshot("Packing"))
+    entry_size = (tmp_path / "old.sheets").stat().st_size
+    cache.store("used", _snapshot(), _snapshot("Packing"))
+    os.utime(tmp_path / "old.sheets", (1_000, 1_000))
+    os.utime(tmp_path / "used.sheets", (2_000, 2_000))
+    assert cache.lookup("old") is not None  # refreshes "old"
+
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    cache.store("new", _snapshot(), _snapshot("Packing"))
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.sheets", "old.sheets"]
+
+
+def test_damaged_entry_is_a_miss_and_removed(tmp_path: Path):
+    """Truncated or foreign entry files are ignored and deleted."""
+    cache = SheetCache(tmp_path, 1 << 20)
+    cache.store("k1", _snapshot(), _snapshot("Packing"))
+    path = tmp_path / "k1.sheets"
+    path.write_bytes(path.read_bytes()[:20])
+
+    assert cache.lookup("k1") is None
+    assert not path.exists()
+
+    path.write_bytes(b"PK\x03\x04 not a cache entry")
+    assert cache.lookup("k1") is None
@@ -0,0 +1,276 @@
+"""Tests for sheet_snapshot — SheetSnapshot construction and reads.
+
+Every test builds an in-memory openpyxl ``Workbook`` and compares snapshot
+reads against what the pipeline previously read through ``sheet.cell()``.
+"""
+
+from decimal import Decimal
+
+from openpyxl import Workbook
+
+from autoconvert.extract_packing import extract_packing_items
+from autoconvert.merge_tracker import MergeTracker
+from autoconvert.models import ColumnMapping
+from autoconvert.sheet_snapshot import LazySheetSnapshot, SheetSnapshot, snapshot_of
+from autoconvert.utils import detect_cell_precision
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_packing_workbook() -> Workbook:
+    """Create a packing sheet with a vertical NW merge and formatted QTY cells.
+
+    Returns:
+        Workbook whose active sheet has header row 1 and three data rows.
+    """
+    wb = Workbook()
+    ws = wb.active
+    for col, header in enumerate(("Part No", "QTY", "N.W.", "G.W."), start=1):
+        ws.cell(row=1, column=col, value=header)
+    rows = [("P1", 10, 4.5, 5.0), ("P1", 20, None, 6.0), ("P2", 5, 1.25, 2.0)]
+    for r, values in enumerate(rows, start=2):
+        for c, value in enumerate(values, start=1):
+            if value is not None:
+                ws.cell(row=r, column=c, value=value)
+        ws.cell(row=r, column=2).number_format = "0.00"
+    ws.merge_cells("C2:C3")
+    return wb
+
+
+# ---------------------------------------------------------------------------
+# Construction and reads
+# ---------------------------------------------------------------------------
+
+
+def test_snapshot_values_match_worksheet():
+    """Every in-range cell reads the same value as Worksheet.cell()."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=1, column=1, value="A")
+    ws.cell(row=3, column=5, value=12.5)
+    ws.cell(row=4, column=2, value=0)
+
+    snap = SheetSnapshot.from_worksheet(ws)
+
+    assert (snap.max_row, snap.max_column) == (ws.max_row, ws.max_column)
+    for row in range(1, ws.max_row + 1):
+        for col in range(1, ws.max_column + 1):
+            assert snap.value(row, col) == ws.cell(row=row, column=col).value
+
+
+def test_snapshot_out_of_range_reads_are_empty():
+    """Reads outside the stored grid return None / General."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=2, column=2, value="x")
+
+    snap = SheetSnapshot.from_worksheet(ws)
+
+    assert snap.value(0, 1) is None
+    assert snap.value(2, 50) is None
+    assert snap.value(500, 1) is None
+    assert snap.number_format(500, 1) == "General"
+    assert snap.row_values(500) == []
+
+
+def test_snapshot_number_formats_and_cell_shim():
+    """number_format and cell() feed detect_cell_precision like a real cell."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=1, column=1, value=3.5).number_format = "#,##0.000"
+    ws.cell(row=1, column=2, value=2.25)
+
+    snap = SheetSnapshot.from_worksheet(ws)
+
+    assert snap.number_format(1, 1) == "#,##0.000"
+    assert snap.number_format(1, 2) == "General"
+    for col in (1, 2):
+        assert detect_cell_precision(snap.cell(row=1, column=col)) == detect_cell_precision(ws.cell(row=1, column=col))
+
+
+def test_snapshot_clears_non_anchor_merge_cells_without_unmerging():
+    """Non-anchor merged cells read as empty; the worksheet keeps its merges."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=5, column=1, value="PartA")
+    ws.merge_cells("A5:B7")
+
+    snap = SheetSnapshot.from_worksheet(ws)
+
+    assert snap.merged_ranges == [(5, 1, 7, 2)]
+    assert snap.value(5, 1) == "PartA"
+    assert snap.value(5, 2) is None
+    assert snap.value(6, 1) is None
+    assert len(ws.merged_cells.ranges) == 1
+
+
+def test_snapshot_of_returns_existing_snapshot():
+    """snapshot_of passes snapshots through and snapshots worksheets."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=1, column=1, value="x")
+
+    snap = snapshot_of(ws)
+
+    assert isinstance(snap, SheetSnapshot)
+    assert snapshot_of(snap) is snap
+
+
+# ---------------------------------------------------------------------------
+# Pipeline equivalence
+# ---------------------------------------------------------------------------
+
+
+def test_merge_tracker_on_snapshot_matches_worksheet_tracker():
+    """A tracker built on a snapshot answers like one built on the unmerged sheet."""
+    snap = SheetSnapshot.from_worksheet(_make_packing_workbook().active)
+    ws = _make_packing_workbook().active
+    ws_tracker = MergeTracker(ws)
+
+    snap_tracker = MergeTracker(snap)
+
+    assert snap_tracker._ranges == ws_tracker._ranges
+    for row in range(1, 5):
+        for col in range(1, 5):
+            assert snap_tracker.get_string_value(row, col, 1) == ws_tracker.get_string_value(row, col, 1)
+            assert snap_tracker.get_weight_value(row, col, 1) == ws_tracker.get_weight_value(row, col, 1)
+
+
+def test_extract_packing_items_snapshot_matches_worksheet():
+    """Packing extraction gives identical items from a snapshot and a worksheet."""
+    column_map = ColumnMapping(
+        sheet_type="packing",
+        field_map={"part_no": 1, "qty": 2, "nw": 3, "gw": 4},
+        header_row=1,
+        effective_header_row=1,
+    )
+    ws = _make_packing_workbook().active
+    expected = extract_packing_items(ws, column_map, MergeTracker(ws))
+    snap = SheetSnapshot.from_worksheet(_make_packing_workbook().active)
+
+    actual = extract_packing_items(snap, column_map, MergeTracker(snap))
+
+    assert actual == expected
+    assert actual[0][0].qty == Decimal("10.00")
+    assert [item.nw for item in actual[0]] == [Decimal("4.50000"), Decimal("0.00000"), Decimal("1.25000")]
+
+
+# ---------------------------------------------------------------------------
+# Data extent
+# ---------------------------------------------------------------------------
+
+
+def test_snapshot_data_extent_ignores_styled_empty_cells():
+    """Styled-but-empty cells inflate max_row/max_column but not the data extent."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=2, column=3, value="x")
+    ws.cell(row=1_048_576, column=1).number_format = "0.00"
+    ws.cell(row=5, column=200).number_format = "0.00"
+
+    snap = SheetSnapshot.from_worksheet(ws)
+
+    assert (snap.max_row, snap.max_column) == (1_048_576, 200)
+    assert (snap.data_max_row, snap.data_max_column) == (2, 3)
+    assert snap.trailing_blank_rows == 1_048_574
+    assert list(snap.data_rows(2)) == [2]
+    assert list(snap.data_rows(3)) == []
+    assert snap.data_columns(50) == 3
+
+
+def test_snapshot_data_extent_covers_merges_with_anchor_value():
+    """A merge with a value extends the extent to its last row; an empty merge does not."""
+    wb = Workbook()
+    ws = wb.active
+    ws.cell(row=2, column=1, value="PartA")
+    ws.merge_cells("A2:A6")
+    ws.merge_cells("C2:D20")
+
+    snap = SheetSnapshot.from_worksheet(ws)
+
+    assert (snap.data_max_row, snap.data_max_column) == (6, 1)
+
+
+def test_snapshot_empty_sheet_has_empty_extent():
+    """An empty worksheet has a zero data extent and no data rows."""
+    snap = SheetSnapshot.from_worksheet(Workbook().active)
+
+    assert (snap.data_max_row, snap.data_max_column) == (0, 0)
+    assert list(snap.data_rows(1)) == []
+
+
+# ---------------------------------------------------------------------------
+# LazySheetSnapshot
+# ---------------------------------------------------------------------------
+
+
+def _lazy_cells() -> list[tuple[int, int, object, str | None]]:
+    """Return stored cells of a small sheet with data, merges and styled blanks.
+
+    Returns:
+        (row, col, value, number_format) tuples in row order.
+    """
+    return [
+        (1, 1, "Title", None),
+        (1, 2, "covered", None),
+        (3, 1, "PartA", None),
+        (3, 2, 1.5, "0.00"),
+        (4, 1, "hidden", None),
+        (5, 3, 7, "0.000"),
+        (9, 6, None, "0.00"),
+    ]
+
+
+def _lazy_source(cells: list[tuple[int, int, object, str | None]], consumed: list[int]):
+    """Group cells into a forward-only row source that records what it yielded.
+
+    Args:
+        cells: Cells in row order.
+        consumed: Receives each row number as it is yielded.
+
+    Yields:
+        (row, cells of that row).
+    """
+    for row in sorted({cell[0] for cell in cells}):
+        consumed.append(row)
+        yield row, [cell for cell in cells if cell[0] == row]
+
+
+def test_lazy_snapshot_matches_eager_snapshot():
+    """Reads, merges, extents and the no-merge view equal from_cells()."""
+    merged = [(1, 1, 1, 2), (3, 1, 6, 1)]
+    eager = SheetSnapshot.from_cells("S", _lazy_cells(), merged)
+    lazy = LazySheetSnapshot("S", _lazy_source(_lazy_cells(), []), merged)
+    view = lazy.without_merges()
+
+    for row in range(1, 11):
+        for col in range(1, 8):
+            assert lazy.value(row, col) == eager.value(row, col), (row, col)
+            assert lazy.number_format(row, col) == eager.number_format(row, col), (row, col)
+        assert lazy.row_values(row) == eager.row_values(row), row
+    assert (lazy.max_row, lazy.max_column) == (eager.max_row, eager.max_column)
+    assert (lazy.data_max_row, lazy.data_max_column) == (eager.data_max_row, eager.data_max_column)
+    assert view.merged_ranges == []
+    assert (view.data_max_row, view.data_max_column) == (
+        eager.without_merges().data_max_row,
+        eager.without_merges().data_max_column,
+    )
+
+
+def test_lazy_snapshot_parses_only_rows_that_are_read():
+    """Stopping early leaves later rows unparsed; dimensions drain the source."""
+    consumed: list[int] = []
+    lazy = LazySheetSnapshot("S", _lazy_source(_lazy_cells(), consumed), [])
+
+    for row in lazy.data_rows(1):
+        if lazy.value(row, 1) == "PartA":
+            break
+
+    assert consumed == [1, 3]
+    assert lazy.data_columns(50) == 50
+    assert lazy.data_max_row == 5
+    assert consumed == [1, 3, 4, 5, 9]
+    assert lazy.data_columns(50) == 3
+    assert list(lazy.data_rows(4)) == [4, 5]
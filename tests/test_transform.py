@@ -7,8 +7,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from autoconvert import transform
 from autoconvert.errors import ProcessingError, WarningCode
-from autoconvert.models import AppConfig, InvoiceItem
+from autoconvert.models import AppConfig, InvoiceRecord
 from autoconvert.transform import clean_po_number, convert_country, convert_currency
 
 # ---------------------------------------------------------------------------
@@ -20,18 +21,20 @@ def _make_item(
     currency: str = "USD",
     coo: str = "CN",
     po_no: str = "PO12345",
-) -> InvoiceItem:
-    """Create a minimal InvoiceItem for transform tests.
+    row: int = 2,
+) -> InvoiceRecord:
+    """Create a minimal InvoiceRecord for transform tests.
 
     Args:
         currency: Currency string field value.
         coo: Country of origin field value.
         po_no: Purchase order number field value.
+        row: Source sheet row.
 
     Returns:
-        InvoiceItem with sensible defaults for all other required fields.
+        InvoiceRecord with sensible defaults for all other required fields.
     """
-    return InvoiceItem(
+    return InvoiceRecord(
         part_no="PART-001",
         po_no=po_no,
         qty=Decimal("10"),
@@ -45,6 +48,7 @@ def _make_item(
         model_no="MOD-001",
         inv_no="INV-001",
         serial="",
+        row=row,
     )
 
 
@@ -150,6 +154,43 @@ class TestConvertCurrency:
         assert len(warnings) == 1
         assert warnings[0].code == WarningCode.ATT_003
 
+    def test_convert_currency_normalizes_each_distinct_value_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test convert_currency looks up each distinct raw value once and maps the result to every item."""
+        calls: list[str] = []
+
+        def counting_normalize(value: str) -> str:
+            calls.append(value)
+            return value.strip().upper()
+
+        monkeypatch.setattr(transform, "normalize_lookup_key", counting_normalize)
+        items = [_make_item(currency=raw) for raw in ["USD", "usd", "USD", "GBP", "USD", "GBP"]]
+        config = _make_config(currency_lookup={"USD": "502"})
+
+        result_items, warnings = convert_currency(items, config)
+
+        assert sorted(calls) == ["GBP", "USD", "usd"]
+        assert [item.currency for item in result_items] == ["502", "502", "502", "GBP", "502", "GBP"]
+        assert len(warnings) == 1
+
+    def test_convert_currency_aggregates_warnings_per_normalized_value(self) -> None:
+        """Test convert_currency emits one ATT_003 per normalized value with count and a bounded row sample."""
+        raws = ["eur", "EUR ", "GBP"] + ["EUR"] * 7
+        items = [_make_item(currency=raw, row=row) for row, raw in enumerate(raws, start=5)]
+        config = _make_config(currency_lookup={"USD": "502"})
+
+        result_items, warnings = convert_currency(items, config)
+
+        assert [item.currency for item in result_items] == raws
+        assert [w.code for w in warnings] == [WarningCode.ATT_003, WarningCode.ATT_003]
+        eur, gbp = warnings
+        assert eur.context["normalized_key"] == "EUR"
+        assert eur.context["raw_values"] == ["eur", "EUR ", "EUR"]
+        assert eur.context["occurrences"] == 9
+        assert eur.context["rows"] == [5, 6, 8, 9, 10]
+        assert "9 occurrences, rows 5, 6, 8, 9, 10, ..." in eur.message
+        assert gbp.context["occurrences"] == 1
+        assert gbp.message == "Currency value 'GBP' (normalized: 'GBP') not found in currency_lookup (row 7)"
+
 
 # ---------------------------------------------------------------------------
 # convert_country() tests
@@ -194,6 +235,18 @@ class TestConvertCountry:
         assert isinstance(warnings[0], ProcessingError)
         assert warnings[0].code == WarningCode.ATT_004
 
+    def test_convert_country_repeated_unmatched_value_gives_one_att004_warning(self) -> None:
+        """Test convert_country reports a repeated unmatched COO once with its occurrence count."""
+        items = [_make_item(coo="Atlantis", row=row) for row in range(10, 13)]
+        config = _make_config(country_lookup={"CN": "142"})
+
+        _, warnings = convert_country(items, config)
+
+        assert len(warnings) == 1
+        assert warnings[0].code == WarningCode.ATT_004
+        assert warnings[0].context["occurrences"] == 3
+        assert warnings[0].message.endswith("(3 occurrences, rows 10, 11, 12)")
+
     def test_convert_country_empty_coo_preserved_as_empty(self) -> None:
         """Test convert_country with empty coo string: preserved as empty, ATT_004 issued."""
         # Empty coo is not in any lookup table — treat as unmatched per spec.
@@ -273,3 +326,21 @@ class TestCleanPoNumber:
         result = clean_po_number(items)
 
         assert result[0].po_no == "PO12345"
+
+    def test_clean_po_number_cleans_each_distinct_value_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test clean_po_number cleans each distinct po_no once and shares the result across items."""
+        calls: list[str] = []
+        original_clean_po = transform._clean_po
+
+        def counting_clean_po(po_no: str) -> str:
+            calls.append(po_no)
+            return original_clean_po(po_no)
+
+        monkeypatch.setattr(transform, "_clean_po", counting_clean_po)
+        items = [_make_item(po_no=po_no) for po_no in ["PO1-A", "PO2.0", "PO1-A", "PO1-A"]]
+
+        result = clean_po_number(items)
+
+        assert sorted(calls) == ["PO1-A", "PO2.0"]
+        assert [item.po_no for item in result] == ["PO1", "PO2", "PO1", "PO1"]
+        assert result[0].po_no is result[3].po_no
@@ -0,0 +1,137 @@
+"""Tests for watch.py -- watch_directory() polling and stability detection."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from autoconvert.models import FileResult
+from autoconvert.watch import watch_directory
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _fake_process_file(filepath: Path, config: object) -> FileResult:
+    """Return a FileResult whose status depends on the filename.
+
+    Args:
+        filepath: Input file path.
+        config: Unused application config.
+
+    Returns:
+        Failed for names containing 'bad', Success otherwise.
+    """
+    status = "Failed" if "bad" in filepath.name else "Success"
+    return FileResult(
+        filename=filepath.name,
+        status=status,
+        errors=[],
+        warnings=[],
+        invoice_items=[],
+        packing_items=[],
+        packing_totals=None,
+    )
+
+
+def _touch(path: Path, content: bytes, mtime_ns: int) -> None:
+    """Write a file and pin its mtime so signature changes are deterministic.
+
+    Args:
+        path: File to write.
+        content: Bytes to write.
+        mtime_ns: Modification time in nanoseconds.
+    """
+    path.write_bytes(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# ---------------------------------------------------------------------------
+# watch_directory() tests
+# ---------------------------------------------------------------------------
+
+
+class TestWatchDirectory:
+    """Tests for watch_directory()."""
+
+    def _run(self, tmp_path: Path, steps: list, max_polls: int, stable_polls: int = 2) -> tuple:
+        """Run watch_directory with a fake sleep that executes one step per poll.
+
+        Args:
+            tmp_path: pytest temporary directory.
+            steps: Callables invoked (with the data dir) after each poll.
+            max_polls: Number of polls to run.
+            stable_polls: Stability threshold passed through.
+
+        Returns:
+            (BatchResult, process_file mock).
+        """
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        pending = list(steps)
+
+        def fake_sleep(_: float) -> None:
+            if pending:
+                pending.pop(0)(data_dir)
+
+        mock_process = MagicMock(side_effect=_fake_process_file)
+        with (
+            patch("autoconvert.batch._DATA_DIR", data_dir),
+            patch("autoconvert.batch._FINISHED_DIR", data_dir / "finished"),
+            patch("autoconvert.batch.process_file", mock_process),
+            patch("autoconvert.watch.print_batch_summary"),
+        ):
+            result = watch_directory(
+                MagicMock(),
+                poll_interval=0.01,
+                stable_polls=stable_polls,
+                max_polls=max_polls,
+                sleep=fake_sleep,
+            )
+        return result, mock_process
+
+    def test_waits_for_stable_file_then_processes_once(self, tmp_path: Path) -> None:
+        """A growing file is not processed until its size/mtime stop changing."""
+        steps = [
+            lambda d: _touch(d / "a.xlsx", b"x", 1_000),
+            lambda d: _touch(d / "a.xlsx", b"xx", 2_000),  # still being copied
+            lambda d: None,
+            lambda d: None,
+            lambda d: None,
+        ]
+        result, mock_process = self._run(tmp_path, steps, max_polls=6)
+
+        assert mock_process.call_count == 1
+        assert mock_process.call_args[0][0].name == "a.xlsx"
+        assert result.total_files == 1
+        assert result.success_count == 1
+
+    def test_modified_file_is_reprocessed_and_summary_keeps_latest(self, tmp_path: Path) -> None:
+        """Modifying a processed file triggers a rerun; the summary holds one row per file."""
+        steps = [
+            lambda d: _touch(d / "a.xlsx", b"x", 1_000),
+            lambda d: _touch(d / "bad.xlsx", b"y", 1_000),
+            lambda d: None,
+            lambda d: _touch(d / "a.xlsx", b"xyz", 5_000),
+            lambda d: None,
+            lambda d: None,
+        ]
+        result, mock_process = self._run(tmp_path, steps, max_polls=7, stable_polls=1)
+
+        names = [call[0][0].name for call in mock_process.call_args_list]
+        assert names == ["a.xlsx", "bad.xlsx", "a.xlsx"]
+        assert [r.filename for r in result.file_results] == ["a.xlsx", "bad.xlsx"]
+        assert result.success_count == 1
+        assert result.failed_count == 1
+
+    def test_keyboard_interrupt_returns_summary(self, tmp_path: Path) -> None:
+        """Ctrl+C stops watching and still returns the accumulated result."""
+
+        def interrupt(_: Path) -> None:
+            raise KeyboardInterrupt
+
+        steps = [lambda d: _touch(d / "a.xlsx", b"x", 1_000), interrupt]
+        result, mock_process = self._run(tmp_path, steps, max_polls=None, stable_polls=1)
+
+        assert mock_process.call_count == 1
+        assert result.total_files == 1
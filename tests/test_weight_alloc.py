@@ -4,13 +4,15 @@ Covers aggregation, pre-allocation validation, precision determination,
 proportional allocation, and final validation — minimum 17 test cases.
 """
 
-from decimal import Decimal
+import random
+from decimal import Decimal, DivisionByZero, InvalidOperation
 from unittest.mock import patch
 
 import pytest
 
 from autoconvert.errors import ErrorCode, ProcessingError
 from autoconvert.models import InvoiceItem, PackingItem, PackingTotals
+from autoconvert.utils import WEIGHT_PRECISION_MAX, WEIGHT_PRECISION_MIN, round_half_up
 from autoconvert.weight_alloc import allocate_weights
 
 # ---------------------------------------------------------------------------
@@ -64,6 +66,49 @@ def _totals(
     )
 
 
+def _reference_allocation(
+    invoice_items: list[InvoiceItem],
+    packing_items: list[PackingItem],
+    packing_totals: PackingTotals,
+) -> list[Decimal]:
+    """Allocate weights with per-value round_half_up calls (the original Decimal path).
+
+    Covers the successful path only; used to check the integer engine
+    value for value, including the Decimal representation.
+    """
+    total_nw = packing_totals.total_nw
+    base = max(WEIGHT_PRECISION_MIN, min(packing_totals.total_nw_precision, WEIGHT_PRECISION_MAX))
+    weights: dict[str, Decimal] = {}
+    for item in packing_items:
+        weights[item.part_no.strip()] = weights.get(item.part_no.strip(), Decimal("0")) + item.nw
+
+    precision = base
+    if sum((round_half_up(w, base) for w in weights.values()), Decimal("0")) != total_nw:
+        precision = min(base + 1, WEIGHT_PRECISION_MAX)
+    while any(round_half_up(w, precision) == 0 for w in weights.values()):
+        precision += 1
+
+    rounded = {part_no: round_half_up(w, precision) for part_no, w in weights.items()}
+    remainder = total_nw - sum(rounded.values(), Decimal("0"))
+    if remainder != 0:
+        last_key = list(rounded)[-1]
+        rounded[last_key] = rounded[last_key] + remainder
+
+    groups: dict[str, list[int]] = {}
+    for idx, item in enumerate(invoice_items):
+        groups.setdefault(item.part_no.strip(), []).append(idx)
+    allocated: list[Decimal] = [Decimal("0")] * len(invoice_items)
+    for part_no, part_weight in rounded.items():
+        indices = groups[part_no]
+        total_qty = sum(invoice_items[i].qty for i in indices)
+        allocated_sum = Decimal("0")
+        for idx in indices[:-1]:
+            allocated[idx] = round_half_up(part_weight * (invoice_items[idx].qty / total_qty), precision + 1)
+            allocated_sum += allocated[idx]
+        allocated[indices[-1]] = part_weight - allocated_sum
+    return allocated
+
+
 # ===========================================================================
 # Aggregation tests (FR-021)
 # ===========================================================================
@@ -550,3 +595,50 @@ class TestEdgeCases:
         result = allocate_weights(invoice, packing, totals)
 
         assert result[0].allocated_weight == Decimal("12.500")
+
+    def test_allocate_weights_zero_invoice_qty_raises_decimal_error(self) -> None:
+        """A part whose invoice qty sums to zero fails as the Decimal formula does."""
+        invoice = [_inv("P1", Decimal("0"))]
+        packing = [_pack("P1", Decimal("5"), Decimal("12.50000"))]
+        totals = _totals(Decimal("12.50"), 2)
+
+        with pytest.raises(InvalidOperation):
+            allocate_weights(invoice, packing, totals)
+
+    def test_allocate_weights_cancelling_invoice_qty_raises_division_by_zero(self) -> None:
+        """Non-zero invoice qtys that sum to zero fail as a Decimal division by zero."""
+        invoice = [_inv("P1", Decimal("2")), _inv("P1", Decimal("-2"))]
+        packing = [_pack("P1", Decimal("5"), Decimal("12.50000"))]
+        totals = _totals(Decimal("12.50"), 2)
+
+        with pytest.raises(DivisionByZero):
+            allocate_weights(invoice, packing, totals)
+
+
+class TestIntegerEngineEquivalence:
+    """The integer engine reproduces the per-value round_half_up results exactly."""
+
+    def test_allocate_weights_matches_reference_on_random_invoices(self) -> None:
+        """Random invoices (ties, tiny weights, remainders) match value and representation."""
+        rng = random.Random(20240521)
+        for _ in range(300):
+            packing: list[PackingItem] = []
+            invoice: list[InvoiceItem] = []
+            nw_decimals = rng.randint(2, 5)
+            for part in range(rng.randint(1, 6)):
+                units = rng.choice([rng.randint(1, 300_000), rng.randint(1, 60), rng.randint(1, 9) * 5])
+                nw = Decimal(units).scaleb(-nw_decimals)
+                packing.append(_pack(f"P{part}", Decimal("1"), nw))
+                for _ in range(rng.randint(1, 5)):
+                    qty = rng.choice([Decimal(rng.randint(1, 1000)), Decimal(rng.randint(1, 7)) / 2, Decimal("3")])
+                    invoice.append(_inv(f"P{part}", qty))
+            rng.shuffle(invoice)
+            packing_sum = sum((item.nw for item in packing), Decimal("0"))
+            nw_precision = rng.randint(2, 5)
+            total_nw = round_half_up(packing_sum, nw_precision) + rng.choice([Decimal("0"), Decimal("0.01")])
+            totals = _totals(total_nw, nw_precision)
+
+            expected = _reference_allocation(invoice, packing, totals)
+            result = allocate_weights(list(invoice), packing, totals)
+
+            assert [str(item.allocated_weight) for item in result] == [str(value) for value in expected]
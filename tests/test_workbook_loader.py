@@ -0,0 +1,130 @@
+"""Tests for workbook_loader — sheet-selective .xlsx loading."""
+
+import re
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from autoconvert.errors import ErrorCode, ProcessingError
+from autoconvert.models import AppConfig, FieldPattern
+from autoconvert.workbook_loader import load_xlsx_sheets
+
+# ---------------------------------------------------------------------------
+# Fixtures / helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def config() -> AppConfig:
+    """Create an AppConfig with simple invoice/packing sheet patterns."""
+    return AppConfig(
+        invoice_sheet_patterns=[re.compile(r"^invoice", re.IGNORECASE)],
+        packing_sheet_patterns=[re.compile(r"^packing", re.IGNORECASE)],
+        invoice_columns={
+            "part_no": FieldPattern(patterns=["^part"], type="string", required=True),
+        },
+        packing_columns={
+            "part_no": FieldPattern(patterns=["^part"], type="string", required=True),
+        },
+        inv_no_patterns=[],
+        inv_no_label_patterns=[],
+        inv_no_exclude_patterns=[],
+        currency_lookup={},
+        country_lookup={},
+        template_path=Path("dummy.xlsx"),
+    )
+
+
+def _save_workbook(path: Path, sheet_names: list[str]) -> Path:
+    """Save a workbook whose sheets each hold their own name in A1.
+
+    Args:
+        path: Destination .xlsx path.
+        sheet_names: Sheet titles in workbook order.
+
+    Returns:
+        The saved path.
+    """
+    wb = Workbook()
+    wb.remove(wb.active)
+    for name in sheet_names:
+        ws = wb.create_sheet(name)
+        ws["A1"] = name
+        ws["B2"] = 12.5
+        ws["C3"] = datetime(2025, 1, 31)
+    wb.save(path)
+    return path
+
+
+def _corrupt_parts(path: Path, keep: set[str]) -> None:
+    """Replace every worksheet part not in keep with invalid XML.
+
+    Args:
+        path: .xlsx file to rewrite in place.
+        keep: Worksheet part names (e.g. "xl/worksheets/sheet1.xml") left intact.
+    """
+    with zipfile.ZipFile(path) as src:
+        members = [(info, src.read(info.filename)) for info in src.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info, data in members:
+            if info.filename.startswith("xl/worksheets/sheet") and info.filename not in keep:
+                data = b"<not-xml"
+            dst.writestr(info, data)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_loads_only_matched_sheets(tmp_path: Path, config: AppConfig):
+    """Extra sheets are skipped; matched sheets keep values, types and order."""
+    path = _save_workbook(tmp_path / "in.xlsx", ["Notes", "Packing List", "History", "Invoice", "Pivot"])
+
+    wb = load_xlsx_sheets(path, config)
+
+    assert wb.sheetnames == ["Packing List", "Invoice"]
+    assert wb["Invoice"]["A1"].value == "Invoice"
+    assert wb["Invoice"]["B2"].value == 12.5
+    assert wb["Packing List"]["C3"].value == datetime(2025, 1, 31)
+
+
+def test_unmatched_sheet_parts_are_never_parsed(tmp_path: Path, config: AppConfig):
+    """Corrupt cell XML in an extra sheet does not affect loading."""
+    path = _save_workbook(tmp_path / "in.xlsx", ["Invoice", "Junk", "Packing"])
+    _corrupt_parts(path, keep={"xl/worksheets/sheet1.xml", "xl/worksheets/sheet3.xml"})
+
+    wb = load_xlsx_sheets(path, config)
+
+    assert wb.sheetnames == ["Invoice", "Packing"]
+
+
+def test_missing_sheet_raises_before_cell_parsing(tmp_path: Path, config: AppConfig):
+    """ERR_012/ERR_013 come from sheet names alone, with every name in context."""
+    path = _save_workbook(tmp_path / "in.xlsx", ["Summary", "Packing"])
+    _corrupt_parts(path, keep=set())
+
+    with pytest.raises(ProcessingError) as exc_info:
+        load_xlsx_sheets(path, config)
+
+    assert exc_info.value.code == ErrorCode.ERR_012
+    assert exc_info.value.context["sheet_names"] == ["Summary", "Packing"]
+
+    path = _save_workbook(tmp_path / "in2.xlsx", ["Invoice", "Other"])
+    with pytest.raises(ProcessingError) as exc_info:
+        load_xlsx_sheets(path, config)
+
+    assert exc_info.value.code == ErrorCode.ERR_013
+
+
+def test_single_sheet_matching_both_patterns(tmp_path: Path, config: AppConfig):
+    """A sheet matched by both pattern lists is loaded once."""
+    config.packing_sheet_patterns.append(re.compile(r"^invoice", re.IGNORECASE))
+    path = _save_workbook(tmp_path / "in.xlsx", ["Cover", "Invoice & Packing"])
+
+    wb = load_xlsx_sheets(path, config)
+
+    assert wb.sheetnames == ["Invoice & Packing"]
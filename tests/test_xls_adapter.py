@@ -1,4 +1,4 @@
-"""Tests for xls_adapter.convert_xls_to_xlsx.
+"""Tests for xls_adapter.convert_xls_to_xlsx and the XlsWorkbook facade.
 
 All tests that can use the real corpus file (茂綸股份有限公司.xls) do so.
 Tests for cell types not present in the corpus (XL_CELL_DATE, XL_CELL_BOOLEAN,
@@ -14,7 +14,8 @@ import pytest
 import xlrd
 from openpyxl import Workbook
 
-from autoconvert.xls_adapter import _convert_cell_value, convert_xls_to_xlsx
+from autoconvert.sheet_snapshot import SheetSnapshot
+from autoconvert.xls_adapter import XlsWorkbook, _convert_cell_value, convert_xls_to_xlsx, open_xls_workbook
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -243,3 +244,109 @@ def test_convert_xls_does_not_modify_source(corpus_path: Path) -> None:
     after = hashlib.md5(corpus_path.read_bytes()).hexdigest()
 
     assert before == after, "Source .xls file was modified during conversion"
+
+
+# ---------------------------------------------------------------------------
+# XlsWorkbook facade
+# ---------------------------------------------------------------------------
+
+
+def _make_book() -> MagicMock:
+    """Create an on-demand xlrd Book mock with one small loaded-on-request sheet.
+
+    Sheet "INVOICE" (0-based grid)::
+
+        row 0: "TITLE" (merged A1:C1), <covered "x">, <empty>
+        row 1: "P-1", 3.0, 45658.5 (date)
+        row 2: <blank>, <error>, True
+
+    Returns:
+        MagicMock standing in for xlrd.Book with sheets "Notes" and "INVOICE".
+    """
+    types = [
+        [xlrd.XL_CELL_TEXT, xlrd.XL_CELL_TEXT, xlrd.XL_CELL_EMPTY],
+        [xlrd.XL_CELL_TEXT, xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_DATE],
+        [xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR, xlrd.XL_CELL_BOOLEAN],
+    ]
+    values = [["TITLE", "x", ""], ["P-1", 3.0, 45658.5], ["", 7, 1]]
+    sheet = MagicMock()
+    sheet.name = "INVOICE"
+    sheet.nrows, sheet.ncols = 3, 3
+    sheet.merged_cells = [(0, 1, 0, 3)]
+    sheet.row_types.side_effect = lambda r: types[r]
+    sheet.row_values.side_effect = lambda r: values[r]
+    sheet.cell_type.side_effect = lambda r, c: types[r][c]
+    sheet.cell_value.side_effect = lambda r, c: values[r][c]
+
+    book = MagicMock()
+    book.datemode = 0
+    book.nsheets = 2
+    book.sheet_names.return_value = ["Notes", "INVOICE"]
+    book.sheet_by_name.return_value = sheet
+    book.sheet_loaded.side_effect = lambda idx: idx == 1 and book.sheet_by_name.called
+    return book
+
+
+def test_open_xls_workbook_uses_on_demand(tmp_path: Path) -> None:
+    """The book is opened on demand and no sheet is loaded until it is looked up."""
+    book = _make_book()
+    with patch("autoconvert.xls_adapter.open_workbook", return_value=book) as mock_open:
+        workbook = open_xls_workbook(tmp_path / "in.xls")
+
+    assert mock_open.call_args.kwargs == {"formatting_info": True, "on_demand": True}
+    assert workbook.sheetnames == ["Notes", "INVOICE"]
+    book.sheet_by_name.assert_not_called()
+
+
+def test_xls_worksheet_reads_like_converted_sheet() -> None:
+    """cell(), dimensions, merges and iter_rows() match convert_xls_to_xlsx semantics."""
+    with XlsWorkbook(_make_book()) as workbook:
+        ws = workbook["INVOICE"]
+
+        assert ws.title == "INVOICE"
+        assert (ws.max_row, ws.max_column) == (3, 3)
+        assert [str(r) for r in ws.merged_cells.ranges] == ["A1:C1"]
+        assert ws.cell(row=1, column=1).value == "TITLE"
+        # Merged non-anchor cells read as None, as after openpyxl merge_cells().
+        assert ws.cell(row=1, column=2).value is None
+        assert ws.cell(row=2, column=3).value == datetime(2025, 1, 1, 12, 0)
+        assert ws.cell(row=3, column=2).value is None
+        assert ws.cell(row=3, column=3).value is True
+        assert ws.cell(row=9, column=9).value is None
+        assert ws.cell(row=2, column=2).number_format == "General"
+        stored = [(c.row, c.column, c.value) for row in ws.iter_rows() for c in row]
+        noon = datetime(2025, 1, 1, 12, 0)
+        assert stored == [(1, 1, "TITLE"), (2, 1, "P-1"), (2, 2, 3.0), (2, 3, noon), (3, 3, True)]
+
+        snap = SheetSnapshot.from_worksheet(ws)  # type: ignore[arg-type]
+        assert snap.value(2, 2) == 3.0
+        assert snap.merged_ranges == [(1, 1, 1, 3)]
+
+
+def test_xls_workbook_loads_only_requested_sheets() -> None:
+    """Only looked-up sheets are loaded; close() unloads them and releases the file."""
+    book = _make_book()
+    workbook = XlsWorkbook(book)
+
+    assert workbook["INVOICE"] is workbook["INVOICE"]
+    with pytest.raises(KeyError):
+        workbook["Missing"]
+    workbook.close()
+
+    book.sheet_by_name.assert_called_once_with("INVOICE")
+    book.unload_sheet.assert_called_once_with("INVOICE")
+    book.release_resources.assert_called_once()
+
+
+def test_xls_facade_snapshots_match_conversion(corpus_path: Path) -> None:
+    """Snapshots read through the facade equal snapshots of the converted Workbook."""
+    converted = convert_xls_to_xlsx(corpus_path)
+
+    with open_xls_workbook(corpus_path) as workbook:
+        for name in workbook.sheetnames:
+            fast = SheetSnapshot.from_worksheet(workbook[name])  # type: ignore[arg-type]
+            reference = SheetSnapshot.from_worksheet(converted[name])
+            assert (fast.max_row, fast.max_column) == (reference.max_row, reference.max_column)
+            assert sorted(fast.merged_ranges) == sorted(reference.merged_ranges)
+            for row in range(1, reference.max_row + 1):
+                assert fast.row_values(row) == reference.row_values(row), (name, row)
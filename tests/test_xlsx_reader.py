@@ -0,0 +1,222 @@
+"""Tests for xlsx_reader — fast reader equivalence with the openpyxl path."""
+
+import re
+import zipfile
+from datetime import datetime, time
+from pathlib import Path
+
+import openpyxl
+import pytest
+from openpyxl.styles import Font
+
+from autoconvert.errors import ErrorCode, ProcessingError
+from autoconvert.models import AppConfig, FieldPattern
+from autoconvert.sheet_snapshot import SheetSnapshot
+from autoconvert.xlsx_reader import read_xlsx_sheets
+
+# ---------------------------------------------------------------------------
+# Fixtures / helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def config() -> AppConfig:
+    """Create an AppConfig with simple invoice/packing sheet patterns."""
+    return AppConfig(
+        invoice_sheet_patterns=[re.compile(r"^invoice", re.IGNORECASE)],
+        packing_sheet_patterns=[re.compile(r"^packing", re.IGNORECASE)],
+        invoice_columns={
+            "part_no": FieldPattern(patterns=["^part"], type="string", required=True),
+        },
+        packing_columns={
+            "part_no": FieldPattern(patterns=["^part"], type="string", required=True),
+        },
+        inv_no_patterns=[],
+        inv_no_label_patterns=[],
+        inv_no_exclude_patterns=[],
+        currency_lookup={},
+        country_lookup={},
+        template_path=Path("dummy.xlsx"),
+    )
+
+
+def _save_mixed_workbook(path: Path) -> Path:
+    """Save a workbook exercising every value kind the extractors read.
+
+    Args:
+        path: Destination .xlsx path.
+
+    Returns:
+        The saved path.
+    """
+    wb = openpyxl.Workbook()
+    wb.active.title = "Notes"
+    wb.active["A1"] = "ignored"
+    inv = wb.create_sheet("Invoice")
+    inv["A1"] = "INVOICE NO: INV-001"
+    inv.merge_cells("A1:D1")
+    inv["A3"] = "Part No"
+    inv["B3"] = "Qty"
+    inv["C3"] = "Price"
+    inv["D3"] = "Date"
+    inv["E3"] = "Flag"
+    inv["A4"] = "P-001"
+    inv["B4"] = 12
+    inv["C4"] = 1.23456
+    inv["C4"].number_format = "0.00000"
+    inv["D4"] = datetime(2025, 3, 1, 8, 30)
+    inv["E4"] = True
+    inv["F4"] = time(12, 15)
+    inv["B5"] = 1.5e-7
+    inv["B5"].number_format = "#,##0.000"
+    inv["A6"] = "  padded  "
+    inv["C6"] = "=SUM(C4:C5)"
+    inv["A7"] = "Merged value"
+    inv.merge_cells("A7:A9")
+    # Styled but empty cell far below the data (inflates max_row).
+    inv["H40"].font = Font(bold=True)
+    pack = wb.create_sheet("Packing List")
+    pack["A1"] = "Part No"
+    pack["B1"] = 0.5
+    pack["B1"].number_format = "0.0%"
+    wb.save(path)
+    return path
+
+
+def _assert_same_snapshot(fast: SheetSnapshot, reference: SheetSnapshot) -> None:
+    """Assert two snapshots present identical values, formats and merges.
+
+    Args:
+        fast: Snapshot from xlsx_reader.
+        reference: Snapshot from openpyxl.
+    """
+    assert fast.title == reference.title
+    assert (fast.max_row, fast.max_column) == (reference.max_row, reference.max_column)
+    assert (fast.data_max_row, fast.data_max_column) == (reference.data_max_row, reference.data_max_column)
+    assert sorted(fast.merged_ranges) == sorted(reference.merged_ranges)
+    for row in range(1, reference.max_row + 2):
+        for col in range(1, reference.max_column + 2):
+            assert fast.value(row, col) == reference.value(row, col), (row, col)
+            assert type(fast.value(row, col)) is type(reference.value(row, col)), (row, col)
+            assert fast.number_format(row, col) == reference.number_format(row, col), (row, col)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_snapshots_match_openpyxl(tmp_path: Path, config: AppConfig):
+    """Values, types, number formats, merges and dimensions equal the openpyxl path."""
+    path = _save_mixed_workbook(tmp_path / "in.xlsx")
+    wb = openpyxl.load_workbook(path, data_only=True)
+
+    inv_snap, pack_snap = read_xlsx_sheets(path, config)
+
+    _assert_same_snapshot(inv_snap, SheetSnapshot.from_worksheet(wb["Invoice"]))
+    _assert_same_snapshot(pack_snap, SheetSnapshot.from_worksheet(wb["Packing List"]))
+
+
+def test_shared_rich_strings_and_1904_epoch(tmp_path: Path, config: AppConfig):
+    """Shared/inline rich text and date1904 workbooks read like openpyxl reads them."""
+    path = _save_mixed_workbook(tmp_path / "in.xlsx")
+    wb = openpyxl.load_workbook(path)
+    wb.epoch = openpyxl.utils.datetime.CALENDAR_MAC_1904
+    wb.save(path)
+    # Reason: openpyxl writes inline strings only; add a shared string table
+    # (rich runs plus a phonetic run) by hand.
+    shared = (
+        b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="1" uniqueCount="1">'
+        b'<si><r><t>Part</t></r><r><t xml:space="preserve"> No</t></r><rPh sb="0" eb="1"><t>x</t></rPh></si></sst>'
+    )
+    with zipfile.ZipFile(path) as src:
+        members = [(info, src.read(info.filename)) for info in src.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info, data in members:
+            if info.filename == "xl/worksheets/sheet3.xml":
+                data = data.replace(
+                    b'<c r="A1" t="inlineStr"><is><t>Part No</t></is></c>',
+                    b'<c r="A1" t="s"><v>0</v></c>'
+                    b'<c r="C1" t="inlineStr"><is><r><t>In</t></r><r><t>line</t></r></is></c>',
+                )
+            elif info.filename == "xl/_rels/workbook.xml.rels":
+                data = data.replace(
+                    b"</Relationships>",
+                    b'<Relationship Id="rIdSst" Target="sharedStrings.xml" Type="http://schemas.openxmlformats.org/'
+                    b'officeDocument/2006/relationships/sharedStrings"/></Relationships>',
+                )
+            elif info.filename == "[Content_Types].xml":
+                data = data.replace(
+                    b"</Types>",
+                    b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+                    b'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>',
+                )
+            dst.writestr(info, data)
+        dst.writestr("xl/sharedStrings.xml", shared)
+    reference = openpyxl.load_workbook(path, data_only=True)
+
+    inv_snap, pack_snap = read_xlsx_sheets(path, config)
+
+    assert pack_snap.value(1, 1) == "Part No"
+    assert pack_snap.value(1, 3) == "Inline"
+    _assert_same_snapshot(inv_snap, SheetSnapshot.from_worksheet(reference["Invoice"]))
+    _assert_same_snapshot(pack_snap, SheetSnapshot.from_worksheet(reference["Packing List"]))
+
+
+def test_missing_sheet_raises_before_reading_cells(tmp_path: Path, config: AppConfig):
+    """ERR_012 is raised from workbook.xml alone, even if every sheet part is corrupt."""
+    wb = openpyxl.Workbook()
+    wb.active.title = "Summary"
+    wb.create_sheet("Packing")
+    path = tmp_path / "in.xlsx"
+    wb.save(path)
+    with zipfile.ZipFile(path) as src:
+        members = [(info, src.read(info.filename)) for info in src.infolist()]
+    with zipfile.ZipFile(path, "w") as dst:
+        for info, data in members:
+            dst.writestr(info, b"<broken" if info.filename.startswith("xl/worksheets/") else data)
+
+    with pytest.raises(ProcessingError) as exc_info:
+        read_xlsx_sheets(path, config)
+
+    assert exc_info.value.code == ErrorCode.ERR_012
+    assert exc_info.value.context["sheet_names"] == ["Summary", "Packing"]
+
+
+def test_single_sheet_matching_both_patterns(tmp_path: Path, config: AppConfig):
+    """A sheet matched by both patterns yields a packing snapshot without merges."""
+    config.packing_sheet_patterns.append(re.compile(r"^invoice", re.IGNORECASE))
+    wb = openpyxl.Workbook()
+    wb.active.title = "Invoice & Packing"
+    wb.active["A1"] = "x"
+    wb.active.merge_cells("A1:B1")
+    path = tmp_path / "in.xlsx"
+    wb.save(path)
+
+    inv_snap, pack_snap = read_xlsx_sheets(path, config)
+
+    assert inv_snap.merged_ranges == [(1, 1, 1, 2)]
+    assert pack_snap.merged_ranges == []
+    assert pack_snap.value(1, 1) == "x"
+
+
+def test_rows_after_last_read_are_never_parsed(tmp_path: Path, config: AppConfig):
+    """Rows beyond the last one read stay unparsed until the sheet extent is needed."""
+    path = _save_mixed_workbook(tmp_path / "in.xlsx")
+    # Reason: A shared-string reference without a string table fails to
+    # convert, so the row raises only if the reader actually parses it.
+    with zipfile.ZipFile(path) as src:
+        members = [(info, src.read(info.filename)) for info in src.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info, data in members:
+            if info.filename == "xl/worksheets/sheet2.xml":
+                data = data.replace(b"</sheetData>", b'<row r="200"><c r="A200" t="s"><v>999</v></c></row></sheetData>')
+            dst.writestr(info, data)
+
+    inv_snap, _ = read_xlsx_sheets(path, config)
+
+    seen = [row for row in inv_snap.data_rows(1, 9) if inv_snap.value(row, 1) is not None]
+    assert seen == [1, 3, 4, 6, 7]
+    assert inv_snap.value(7, 1) == "Merged value"
+    with pytest.raises(IndexError):
+        _ = inv_snap.data_max_row